@@ -0,0 +1,187 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from os.path import dirname, abspath
+
+# Add the project root directory to Python path
+sys.path.append(dirname(dirname(abspath(__file__))))
+
+BASELINE_PATH = os.path.join(dirname(abspath(__file__)), 'baseline.json')
+DEFAULT_THRESHOLD = 0.25  # fail when wall time grows by more than 25%
+
+
+def _circuit_build():
+    from src.encode import create_shors_code
+    from src.decode import decode_shors_code
+    from src.simulate import _assemble_circuit
+    return lambda: _assemble_circuit(create_shors_code(), decode_shors_code(), 3, 'both', '0')
+
+
+def _transpile():
+    from qiskit import transpile
+    from qiskit_aer import AerSimulator
+    from src.circuit_cache import get_template
+    from src.simulate import create_noise_model
+    backend = AerSimulator(noise_model=create_noise_model())
+    decode = get_template('decode')
+    return lambda: transpile(decode, backend, optimization_level=1, seed_transpiler=0)
+
+
+def _noisy_simulation(shots):
+    def setup():
+        from qiskit_aer import AerSimulator
+        from src.simulate import create_noise_model, _build_transpiled_circuit
+        backend = AerSimulator(noise_model=create_noise_model())
+        circuit = _build_transpiled_circuit(backend, 3, 'both', '0')
+        return lambda: backend.run(circuit, shots=shots, seed_simulator=1).result()
+    return setup
+
+
+def _grid(engine):
+    def setup():
+        from src.visualize import compute_per_qubit_error_grid
+        return lambda: compute_per_qubit_error_grid(engine=engine)
+    return setup
+
+
+def _figure():
+    from src.visualize import generate_per_qubit_error_grid
+    # Rendered into a scratch directory so examples/ is left untouched, and
+    # forced so repeats time the drawing rather than the up-to-date check
+    output_dir = tempfile.mkdtemp()
+    return lambda: generate_per_qubit_error_grid(output_dir=output_dir, force=True)
+
+
+# name -> (setup returning the timed callable, shots per call or None)
+BENCHMARKS = {
+    'circuit_build': (_circuit_build, None),
+    'transpile_decode': (_transpile, None),
+    'simulate_1024_shots': (_noisy_simulation(1024), 1024),
+    'simulate_8192_shots': (_noisy_simulation(8192), 8192),
+    'simulate_65536_shots': (_noisy_simulation(65536), 65536),
+    'grid_unitary': (_grid('unitary'), None),
+    'grid_circuit': (_grid('circuit'), None),
+    'render_grid_figure': (_figure, None),
+}
+
+
+def measure(func, repeat=3, shots=None):
+    """Time func: best wall time of repeat calls (after one warm-up call),
+    peak Python heap allocation of one call (tracemalloc, so Aer's C++
+    buffers are not included) and, if shots is given, shots per second."""
+    func()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = {'wall_time_s': min(times), 'peak_memory_mb': peak / 2 ** 20}
+    if shots:
+        result['shots_per_second'] = shots / min(times)
+    return result
+
+
+def run_benchmarks(names=None, repeat=3):
+    """Run the selected benchmarks (all by default) with the result cache
+    disabled, so every call really simulates."""
+    from src import result_cache
+    enabled, result_cache.ENABLED = result_cache.ENABLED, False
+    try:
+        results = {}
+        for name in names or BENCHMARKS:
+            setup, shots = BENCHMARKS[name]
+            results[name] = measure(setup(), repeat=repeat, shots=shots)
+    finally:
+        result_cache.ENABLED = enabled
+    return results
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """Return a list of (name, baseline time, new time) for every benchmark
+    whose wall time exceeds its baseline by more than threshold (a fraction).
+    Benchmarks missing from the baseline are not compared."""
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        old = baseline[name]['wall_time_s']
+        new = result['wall_time_s']
+        if new > old * (1 + threshold):
+            regressions.append((name, old, new))
+    return regressions
+
+
+def load_baseline(path=BASELINE_PATH):
+    """Benchmarks of the baseline at path, or None if there is no baseline yet."""
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)['benchmarks']
+
+
+def save_baseline(results, path=BASELINE_PATH):
+    import qiskit
+    payload = {
+        'machine': {'python': platform.python_version(), 'platform': platform.platform(),
+                    'processor': platform.processor(), 'cpus': os.cpu_count(),
+                    'qiskit': qiskit.__version__},
+        'benchmarks': results,
+    }
+    with open(path, 'w') as f:
+        json.dump(payload, f, indent=2, sort_keys=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the Shor code hot paths.')
+    parser.add_argument('--only', nargs='+', choices=sorted(BENCHMARKS), default=None)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='allowed fractional slowdown before failing (default 0.25)')
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='record these results as the new baseline')
+    args = parser.parse_args(argv)
+
+    baseline = load_baseline(args.baseline)
+    if baseline is None and not args.update_baseline:
+        print(f"No baseline at {args.baseline}; record one with --update-baseline",
+              file=sys.stderr)
+        return 2
+
+    results = run_benchmarks(args.only, repeat=args.repeat)
+    baseline = baseline or {}
+    for name, result in results.items():
+        line = f"{name:24s} {result['wall_time_s'] * 1000:10.2f} ms  " \
+               f"{result['peak_memory_mb']:8.2f} MB"
+        if 'shots_per_second' in result:
+            line += f"  {result['shots_per_second']:12.0f} shots/s"
+        if name in baseline:
+            change = result['wall_time_s'] / baseline[name]['wall_time_s'] - 1
+            line += f"  ({change:+.0%} vs baseline)"
+        print(line)
+
+    if args.update_baseline:
+        save_baseline(dict(baseline, **results), args.baseline)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    for name, old, new in regressions:
+        print(f"REGRESSION {name}: {old * 1000:.2f} ms -> {new * 1000:.2f} ms "
+              f"(threshold {args.threshold:.0%})")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,16 +1,16 @@
-import matplotlib
-matplotlib.use('Agg')  # Force non-interactive backend
-import matplotlib.pyplot as plt
 from os.path import dirname, abspath
+import logging
 import sys
 
 # Add the parent directory to the system path
 sys.path.append(dirname(dirname(abspath(__file__))))
 
-from src.simulate import simulate_shors_code
-from src.visualize import visualize_circuit, visualize_results
-
 def main():
+    # Imported here so that importing main.py stays cheap; src.visualize
+    # itself only loads matplotlib once a figure is drawn
+    from src.simulate import simulate_shors_code
+    from src.visualize import visualize_circuit, visualize_results
+
     # Run simulation with bit flip error
     circuit, counts = simulate_shors_code(error_qubit=4, error_type='bit')
     
@@ -24,4 +24,5 @@ def main():
         print(f"State {state}: {count} counts")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     main()
@@ -0,0 +1,11 @@
+import sys
+from os.path import dirname, abspath
+
+# Add the project root directory to Python path
+sys.path.append(dirname(dirname(abspath(__file__))))
+
+from src.cli import main
+
+# Guarded so spawned sweep workers, which re-import this module, do not rerun the CLI
+if __name__ == '__main__':
+    main()
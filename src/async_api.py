@@ -0,0 +1,66 @@
+import asyncio
+import functools
+import inspect
+import sys
+from os.path import dirname, abspath
+
+# Add the project root directory to Python path
+sys.path.append(dirname(dirname(abspath(__file__))))
+
+from src.parallel import task_seed
+from src.simulate import _run_sweep_chunk, simulate_shors_code
+
+
+async def _in_executor(executor, func, *args, **kwargs):
+    """Await func(*args, **kwargs) run in executor.
+
+    Aer releases the GIL while it simulates, so the loop's default thread
+    pool already runs jobs concurrently with each other and with the loop.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+
+
+async def simulate_shors_code_async(error_qubit=3, error_type='both', initial_state='0',
+                                    shots=8192, noise=None, seed_simulator=None, executor=None):
+    """Awaitable simulate_shors_code(): the job runs in executor (the event
+    loop's default thread pool if None) while the loop stays free.
+
+    A ProcessPoolExecutor works too, with noise given as a dict.
+    Returns (full_circuit, counts).
+    """
+    return await _in_executor(executor, simulate_shors_code, error_qubit, error_type,
+                              initial_state, shots=shots, noise=noise,
+                              seed_simulator=seed_simulator)
+
+
+async def simulate_sweep_async(configs, shots=8192, seed_simulator=None, noise=None,
+                               max_concurrency=4, executor=None, on_result=None):
+    """Run a sweep as concurrent Aer jobs, at most max_concurrency at a time.
+
+    configs are as in simulate_sweep(). Each config is its own job, seeded
+    with task_seed(seed_simulator, index), so a seeded run returns the same
+    rows as simulate_sweep(configs, seed_simulator=..., chunksize=1) however
+    the jobs interleave. on_result, a function or coroutine function, is
+    called with each row as soon as its job finishes, so post-processing
+    or plotting overlaps with the jobs still running.
+
+    Returns the rows in config order, like asyncio.gather().
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    defaults = {'error_qubit': 3, 'error_type': 'both', 'initial_state': '0'}
+
+    async def run(index, config):
+        if not isinstance(config, dict):
+            config = dict(zip(('error_qubit', 'error_type', 'initial_state'), config))
+        row = dict(defaults, **config)
+        async with semaphore:
+            row = (await _in_executor(executor, _run_sweep_chunk,
+                                      ([row], shots, task_seed(seed_simulator, index), noise)))[0]
+        if on_result is not None:
+            result = on_result(row)
+            if inspect.isawaitable(result):
+                await result
+        return row
+
+    return await asyncio.gather(*(run(i, config) for i, config in enumerate(configs)))
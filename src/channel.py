@@ -0,0 +1,131 @@
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.quantum_info import DensityMatrix, partial_trace
+import sys
+from os.path import dirname, abspath
+
+# Add the project root directory to Python path
+sys.path.append(dirname(dirname(abspath(__file__))))
+
+from src.circuit_cache import get_template, get_transpiled
+from src.pauli_frame import NOISY_1Q_GATES, NOISY_2Q_GATES
+from src.simulate import create_noise_model, gate_errors, introduce_error
+
+PAULIS = {
+    'I': np.eye(2, dtype=complex),
+    'X': np.array([[0, 1], [1, 0]], dtype=complex),
+    'Y': np.array([[0, -1j], [1j, 0]], dtype=complex),
+    'Z': np.array([[1, 0], [0, -1]], dtype=complex),
+}
+
+
+def _noisy_block_circuit(error_qubit, error_type, initial_state, blocks):
+    """Prepare -> encode -> error -> decode on 9 qubits, without measurement."""
+    encode, decode = blocks
+    qc = QuantumCircuit(9)
+    if initial_state == '1':
+        qc.x(0)
+    qc.compose(encode, inplace=True)
+    if error_type != 'none':
+        introduce_error(qc, error_qubit, error_type)
+    qc.compose(decode, inplace=True)
+    return qc
+
+
+def _blocks(transpiled, noise):
+    if not transpiled:
+        return get_template('encode'), get_template('decode')
+    from qiskit_aer import AerSimulator
+    backend = AerSimulator(noise_model=create_noise_model(**noise))
+    return get_transpiled('encode', backend), get_transpiled('decode', backend)
+
+
+def evolve_noisy(circuit, rho, error_1, error_2):
+    """Evolve the 9-qubit density matrix rho through circuit, applying the
+    gate errors exactly after every gate they are attached to in
+    create_noise_model()."""
+    channel_1 = error_1.to_quantumchannel()
+    channel_2 = error_2.to_quantumchannel()
+    for instruction in circuit.data:
+        name = instruction.operation.name
+        if name == 'barrier':
+            continue
+        qargs = [circuit.find_bit(q).index for q in instruction.qubits]
+        rho = rho.evolve(instruction.operation, qargs=qargs)
+        if name in NOISY_1Q_GATES:
+            rho = rho.evolve(channel_1, qargs=qargs)
+        elif name in NOISY_2Q_GATES:
+            rho = rho.evolve(channel_2, qargs=qargs)
+    return rho
+
+
+def _logical_output(input_state, circuit, errors):
+    """Reduced state of qubit 0 after running circuit on input_state (2x2) x |0..0>."""
+    ancillas = np.zeros((256, 256), dtype=complex)
+    ancillas[0, 0] = 1
+    rho = DensityMatrix(np.kron(ancillas, input_state))
+    rho = evolve_noisy(circuit, rho, *errors)
+    return partial_trace(rho, list(range(1, 9))).data
+
+
+def logical_channel(error_qubit=3, error_type='none', p1=0.001, p2=0.01, transpiled=True,
+                    **noise):
+    """Exact Pauli transfer matrix of the logical qubit through encode -> error -> decode.
+
+    The noisy process is computed by evolving density matrices through
+    every gate, each followed by the exact depolarizing (and, with t1/t2 in
+    noise, thermal relaxation) channel that create_noise_model() would
+    attach to it, then tracing out qubits 1-8. Composing the full 9-qubit
+    superoperator (4^9 x 4^9) is out of reach, but the logical channel is
+    linear in the input, so four input states fix it.
+
+    With transpiled (the default) the encode/decode blocks are the cached
+    ones simulate_shors_code() actually runs on Aer, Toffolis decomposed
+    into noisy gates; otherwise the untranspiled blocks with noiseless
+    Toffolis, as in src.pauli_frame.
+
+    Returns the 4x4 real PTM R, R[i, j] = Tr(P_i Lambda(P_j)) / 2 for
+    P = I, X, Y, Z.
+    """
+    noise_params = dict(noise, p1=p1, p2=p2)
+    errors = gate_errors(p1, p2, noise.get('t1'), noise.get('t2'),
+                         noise.get('gate_time_1q', 50), noise.get('gate_time_2q', 300))
+    circuit = _noisy_block_circuit(error_qubit, error_type, '0',
+                                   _blocks(transpiled, noise_params))
+
+    plus = np.full((2, 2), 0.5, dtype=complex)
+    plus_i = np.array([[0.5, -0.5j], [0.5j, 0.5]])
+    zero = np.diag([1, 0]).astype(complex)
+    one = np.diag([0, 1]).astype(complex)
+    out_zero, out_one, out_plus, out_plus_i = (
+        _logical_output(state, circuit, errors) for state in (zero, one, plus, plus_i))
+    outputs = {
+        'I': out_zero + out_one,
+        'Z': out_zero - out_one,
+        'X': 2 * out_plus - (out_zero + out_one),
+        'Y': 2 * out_plus_i - (out_zero + out_one),
+    }
+    labels = 'IXYZ'
+    return np.array([[np.trace(PAULIS[i] @ outputs[j]).real / 2 for j in labels]
+                     for i in labels])
+
+
+def exact_success_probability(error_qubit=3, error_type='both', initial_state='0',
+                              p1=0.001, p2=0.01, readout=0.0, transpiled=True, **noise):
+    """Exact probability that simulate_shors_code() measures initial_state.
+
+    Same circuit and noise as the Aer run, including the noisy X that
+    prepares |1> and the noisy X/Z gates that inject the error, but with no
+    sampling error: a noise-free reference for the Monte Carlo paths.
+    readout is the symmetric measurement error of create_noise_model().
+    """
+    noise_params = dict(noise, p1=p1, p2=p2)
+    errors = gate_errors(p1, p2, noise.get('t1'), noise.get('t2'),
+                         noise.get('gate_time_1q', 50), noise.get('gate_time_2q', 300))
+    circuit = _noisy_block_circuit(error_qubit, error_type, initial_state,
+                                   _blocks(transpiled, noise_params))
+    rho = evolve_noisy(circuit, DensityMatrix.from_label('0' * 9), *errors)
+    reduced = partial_trace(rho, list(range(1, 9))).data
+    expected = int(initial_state)
+    p_correct = reduced[expected, expected].real
+    return float(p_correct * (1 - readout) + (1 - p_correct) * readout)
@@ -0,0 +1,107 @@
+import functools
+import hashlib
+import os
+import sys
+import threading
+from os.path import dirname, abspath
+
+import qiskit
+from qiskit import qpy, transpile
+
+# Add the project root directory to Python path
+sys.path.append(dirname(dirname(abspath(__file__))))
+
+from src.encode import create_shors_code
+from src.decode import decode_shors_code
+from src.instrumentation import count, logger, span
+
+CACHE_DIR = os.path.join(dirname(dirname(abspath(__file__))), '.circuit_cache')
+
+_BUILDERS = {
+    'encode': create_shors_code,
+    'decode': decode_shors_code,
+}
+
+# In-process tier of the transpiled cache, keyed like the files on disk
+_transpiled = {}
+
+
+@functools.lru_cache(maxsize=None)
+def get_template(name):
+    """Return the untranspiled 'encode' or 'decode' block, built once per process.
+
+    The returned circuit is shared: compose it into other circuits, but do
+    not modify it in place.
+    """
+    if name not in _BUILDERS:
+        raise ValueError(f"Unknown circuit template '{name}', expected one of {sorted(_BUILDERS)}")
+    return _BUILDERS[name]()
+
+
+def _backend_name(backend):
+    return backend.name() if callable(backend.name) else backend.name
+
+
+def _cache_key(name, backend, optimization_level):
+    """Hash of everything the transpiled circuit depends on.
+
+    Includes the gate list of the template itself, so editing encode.py or
+    decode.py invalidates stale files, and the qiskit version, since QPY
+    files are only guaranteed to load in the version that wrote them.
+    """
+    circuit = get_template(name)
+    source = [
+        (instruction.operation.name, [circuit.find_bit(q).index for q in instruction.qubits])
+        for instruction in circuit.data
+    ]
+    basis_gates = tuple(sorted(backend.configuration().basis_gates))
+    payload = repr((name, _backend_name(backend), basis_gates, optimization_level,
+                    qiskit.__version__, source))
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def get_transpiled(name, backend, optimization_level=1, cache_dir=CACHE_DIR):
+    """Return the 'encode' or 'decode' block transpiled for backend.
+
+    Looks in the in-process cache first, then for a QPY file in cache_dir,
+    and only transpiles when neither has it, writing the QPY file so the
+    next process can load it instead.
+    """
+    key = _cache_key(name, backend, optimization_level)
+    if key in _transpiled:
+        return _transpiled[key]
+
+    circuit = None
+    path = os.path.join(cache_dir, f"{name}-{key}.qpy") if cache_dir else None
+    if path and os.path.exists(path):
+        try:
+            with span('circuit_cache_load'), open(path, 'rb') as f:
+                circuit = qpy.load(f)[0]
+        except Exception as e:
+            logger.warning("Ignoring unreadable circuit cache file %s: %s", path, e)
+
+    if circuit is None:
+        with span('transpile'):
+            circuit = transpile(get_template(name), backend,
+                                optimization_level=optimization_level, seed_transpiler=0)
+        count('transpilations')
+        if path:
+            os.makedirs(cache_dir, exist_ok=True)
+            # Unique per thread as well as per process, so concurrent writers never share it
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                qpy.dump(circuit, f)
+            os.replace(tmp_path, path)
+
+    _transpiled[key] = circuit
+    return circuit
+
+
+def clear_circuit_cache(cache_dir=None):
+    """Empty the in-process caches, and the QPY files in cache_dir if given."""
+    get_template.cache_clear()
+    _transpiled.clear()
+    if cache_dir and os.path.isdir(cache_dir):
+        for filename in os.listdir(cache_dir):
+            if filename.endswith('.qpy'):
+                os.remove(os.path.join(cache_dir, filename))
@@ -0,0 +1,179 @@
+import argparse
+import contextlib
+import json
+import logging
+import sys
+from os.path import dirname, abspath
+
+# Add the project root directory to Python path
+sys.path.append(dirname(dirname(abspath(__file__))))
+
+# Only the standard library is imported here: each subcommand imports
+# qiskit, Aer or matplotlib itself, and only what it needs, so --help and
+# short scheduler-launched jobs start quickly.
+
+ERROR_TYPES = ['none', 'bit', 'phase', 'both']
+
+
+def _int_list(text):
+    return [int(item) for item in text.split(',') if item]
+
+
+def _str_list(text):
+    return [item for item in text.split(',') if item]
+
+
+def _workers(text):
+    return None if text == 'all' else int(text)
+
+
+def cmd_simulate(args):
+    if args.workers == 1:
+        from src.simulate import simulate_sweep
+        row = simulate_sweep([(args.error_qubit, args.error_type, args.initial_state)],
+                             shots=args.shots, seed_simulator=args.seed)[0]
+    else:
+        from src.simulate import simulate_sharded
+        _, counts = simulate_sharded(args.error_qubit, args.error_type, args.initial_state,
+                                     shots=args.shots, seed_simulator=args.seed,
+                                     workers=args.workers)
+        row = {'error_qubit': args.error_qubit, 'error_type': args.error_type,
+               'initial_state': args.initial_state, 'counts': counts,
+               'success_rate': counts.get(args.initial_state, 0) / args.shots * 100}
+    if args.json:
+        print(json.dumps(row))
+    else:
+        print(f"Counts: {row['counts']}")
+        print(f"Success rate: {row['success_rate']:.1f}% "
+              f"(preservation of |{args.initial_state}⟩ state)")
+    if args.plot:
+        from src.simulate import _build_full_circuit
+        from src.visualize import visualize_circuit, visualize_results
+        visualize_circuit(_build_full_circuit(args.error_qubit, args.error_type, args.initial_state))
+        visualize_results(row['counts'])
+
+
+def cmd_grid(args):
+    if args.plot:
+        from src.visualize import generate_per_qubit_error_grid
+        generate_per_qubit_error_grid(initial_state=args.initial_state,
+                                      workers=args.workers, engine=args.engine)
+        return
+    from src.visualize import compute_per_qubit_error_grid
+    grid, error_types = compute_per_qubit_error_grid(initial_state=args.initial_state,
+                                                     workers=args.workers, engine=args.engine)
+    if args.json:
+        print(json.dumps({'error_types': error_types, 'fidelity': grid.tolist()}))
+        return
+    for qubit_idx, fidelities in enumerate(grid):
+        row = "  ".join(f"{et}={f * 100:.2f}%" for et, f in zip(error_types, fidelities))
+        print(f"qubit {qubit_idx}: {row}")
+
+
+def cmd_sweep(args):
+    from src.simulate import simulate_sweep, sweep_configs
+
+    configs = sweep_configs(args.qubits, args.error_types, args.initial_states)
+    rows = simulate_sweep(configs, shots=args.shots, seed_simulator=args.seed,
+                          workers=args.workers, chunksize=args.chunksize, store=args.store)
+    for row in rows:
+        if args.json:
+            print(json.dumps(row))
+        else:
+            print(f"q{row['error_qubit']} {row['error_type']:>5} |{row['initial_state']}⟩: "
+                  f"{row['success_rate']:.1f}%")
+
+
+def cmd_plot(args):
+    from src.visualize import generate_sweep_histograms, generate_sweep_success_plot
+    generate_sweep_success_plot(args.store, initial_state=args.initial_state, force=args.force)
+    if args.histograms:
+        generate_sweep_histograms(args.store, workers=args.workers, force=args.force)
+
+
+def cmd_serve(args):
+    from src.server import serve
+    serve(args.host, args.port)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m src',
+                                     description="Simulate and plot Shor's 9-qubit code.")
+    parser.add_argument('--log-level', default='WARNING',
+                        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+                        help="level for the 'shors_code' logger (default WARNING)")
+    parser.add_argument('--metrics', default=None, metavar='PATH',
+                        help='write per-stage timings, counters and Aer metadata to PATH '
+                             '(.csv for span rows, otherwise JSON)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    simulate = subparsers.add_parser('simulate', help='run one noisy configuration on Aer')
+    simulate.add_argument('--error-qubit', type=int, default=3)
+    simulate.add_argument('--error-type', choices=ERROR_TYPES, default='both')
+    simulate.add_argument('--initial-state', choices=['0', '1'], default='0')
+    simulate.add_argument('--shots', type=int, default=8192)
+    simulate.add_argument('--seed', type=int, default=None)
+    simulate.add_argument('--workers', type=_workers, default=1,
+                          help="split the shots into shards over this many processes, or 'all'")
+    simulate.add_argument('--json', action='store_true', help='print the result row as JSON')
+    simulate.add_argument('--plot', action='store_true',
+                          help='also save the circuit and results figures to examples/')
+    simulate.set_defaults(func=cmd_simulate)
+
+    grid = subparsers.add_parser('grid', help='ideal per-qubit recovery fidelity grid')
+    grid.add_argument('--initial-state', choices=['0', '1'], default='0')
+    grid.add_argument('--engine', choices=['unitary', 'circuit'], default='unitary')
+    grid.add_argument('--workers', type=_workers, default=1, help="process count, or 'all'")
+    grid.add_argument('--json', action='store_true')
+    grid.add_argument('--plot', action='store_true',
+                      help='save examples/per_qubit_error_correction.png instead of printing')
+    grid.set_defaults(func=cmd_grid)
+
+    sweep = subparsers.add_parser('sweep', help='batched noisy sweep over error configurations')
+    sweep.add_argument('--qubits', type=_int_list, default=list(range(9)),
+                       help='comma-separated error qubits (default 0-8)')
+    sweep.add_argument('--error-types', type=_str_list, default=ERROR_TYPES)
+    sweep.add_argument('--initial-states', type=_str_list, default=['0', '1'])
+    sweep.add_argument('--shots', type=int, default=8192)
+    sweep.add_argument('--seed', type=int, default=None)
+    sweep.add_argument('--workers', type=_workers, default=1, help="process count, or 'all'")
+    sweep.add_argument('--chunksize', type=int, default=None,
+                       help='configs per Aer job (default: all in one job); set it to use --workers')
+    sweep.add_argument('--store', default=None,
+                       help='result store directory; rerunning resumes an interrupted sweep')
+    sweep.add_argument('--json', action='store_true', help='print one JSON row per line')
+    sweep.set_defaults(func=cmd_sweep)
+
+    plot = subparsers.add_parser('plot', help='plot a sweep result store without re-simulating')
+    plot.add_argument('store')
+    plot.add_argument('--initial-state', choices=['0', '1'], default='0')
+    plot.add_argument('--histograms', action='store_true',
+                      help='also save one counts histogram per sweep point')
+    plot.add_argument('--workers', type=_workers, default=1, help="process count, or 'all'")
+    plot.add_argument('--force', action='store_true',
+                      help='redraw figures even if their inputs are unchanged')
+    plot.set_defaults(func=cmd_plot)
+
+    serve = subparsers.add_parser('serve', help='keep a warmed-up simulator running behind '
+                                                 'a localhost JSON API (see src/client.py)')
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=8765)
+    serve.set_defaults(func=cmd_serve)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=args.log_level, format='%(message)s')
+    if args.metrics:
+        from src.instrumentation import record_metrics
+        recording = record_metrics(path=args.metrics)
+    else:
+        recording = contextlib.nullcontext()
+    with recording:
+        args.func(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+import json
+import urllib.error
+import urllib.request
+
+# Standard library only, so a client process starts in milliseconds; all
+# of qiskit lives in the server (src/server.py).
+
+DEFAULT_URL = 'http://127.0.0.1:8765'
+
+
+class SimulationClient:
+    """Thin JSON client for a running SimulationServer."""
+
+    def __init__(self, url=DEFAULT_URL, timeout=600):
+        self.url = url.rstrip('/')
+        self.timeout = timeout
+
+    def _request(self, path, params=None):
+        data = None if params is None else json.dumps(params).encode()
+        request = urllib.request.Request(f"{self.url}/{path}", data=data,
+                                         headers={'Content-Type': 'application/json'})
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            message = json.loads(e.read() or b'{}').get('error', e.reason)
+            raise RuntimeError(f"Server returned {e.code}: {message}") from None
+
+    def health(self):
+        return self._request('health')
+
+    def simulate(self, error_qubit=3, error_type='both', initial_state='0', shots=8192,
+                 seed=None, noise=None):
+        """One result row, as simulate_sweep() returns it."""
+        return self._request('simulate', {'error_qubit': error_qubit, 'error_type': error_type,
+                                          'initial_state': initial_state, 'shots': shots,
+                                          'seed': seed, 'noise': noise})
+
+    def grid(self, initial_state='0', engine='unitary'):
+        """(grid, error_types), the grid as nested lists of fidelities."""
+        result = self._request('grid', {'initial_state': initial_state, 'engine': engine})
+        return result['grid'], result['error_types']
+
+    def sweep(self, configs=None, shots=8192, seed=None, noise=None, **grid):
+        """Rows of simulate_sweep(); without configs, grid takes sweep_configs()
+        arguments (qubits, error_types, initial_states)."""
+        params = dict(grid, configs=configs, shots=shots, seed=seed, noise=noise)
+        return self._request('sweep', params)['rows']
@@ -0,0 +1,75 @@
+import numpy as np
+
+
+def outcome_dtype(num_bits):
+    """Smallest unsigned integer dtype that holds a num_bits-bit outcome."""
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if num_bits <= np.iinfo(dtype).bits:
+            return np.dtype(dtype)
+    return np.dtype(np.uint64)
+
+
+def counts_to_array(counts, num_bits):
+    """Histogram array of a counts dict: entry i is the count of outcome i.
+
+    Bitstrings are read as Aer writes them (most significant clbit first,
+    register separators ignored), so index i matches int(key, 2).
+    """
+    hist = np.zeros(2 ** num_bits, dtype=np.int64)
+    for outcome, n in counts.items():
+        hist[int(outcome.replace(' ', ''), 2)] += n
+    return hist
+
+
+def array_to_counts(hist, num_bits=None):
+    """Counts dict of the non-zero bins of a histogram array."""
+    num_bits = num_bits or max(1, int(np.log2(len(hist))))
+    return {format(int(i), f'0{num_bits}b'): int(hist[i]) for i in np.flatnonzero(hist)}
+
+
+def memory_to_array(memory, num_bits, out=None):
+    """Per-shot outcomes as integers instead of bitstrings.
+
+    memory is a list of Aer memory strings; the result uses
+    outcome_dtype(num_bits), one or two bytes per shot for the 9-qubit code
+    instead of a ~50-byte Python string. out, an array of the right length
+    (e.g. a slice of a memory-mapped file), is filled and returned instead
+    of allocating a new one.
+    """
+    outcomes = np.fromiter((int(outcome.replace(' ', ''), 2) for outcome in memory),
+                           dtype=outcome_dtype(num_bits), count=len(memory))
+    if out is None:
+        return outcomes
+    out[:] = outcomes
+    return out
+
+
+def array_to_memory(outcomes, num_bits):
+    """Inverse of memory_to_array(): the list of Aer-style bitstrings."""
+    return [format(int(outcome), f'0{num_bits}b') for outcome in outcomes]
+
+
+def open_memory_file(path, shots, num_bits):
+    """Create a .npy file for shots per-shot outcomes, memory-mapped for writing."""
+    return np.lib.format.open_memmap(path, mode='w+', dtype=outcome_dtype(num_bits),
+                                     shape=(shots,))
+
+
+def load_memory_file(path):
+    """Memory-map a per-shot outcome file read-only, without loading it."""
+    return np.load(path, mmap_mode='r')
+
+
+def histogram(outcomes, num_bits, chunk=1 << 24):
+    """Histogram array of per-shot outcomes, chunk shots at a time so a
+    memory-mapped file is never read into memory at once."""
+    hist = np.zeros(2 ** num_bits, dtype=np.int64)
+    for start in range(0, len(outcomes), chunk):
+        hist += np.bincount(outcomes[start:start + chunk], minlength=2 ** num_bits)
+    return hist
+
+
+def success_rate(hist, expected):
+    """Percentage of shots in outcome expected (a bitstring or an index)."""
+    index = int(expected, 2) if isinstance(expected, str) else int(expected)
+    return hist[index] / hist.sum() * 100
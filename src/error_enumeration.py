@@ -0,0 +1,116 @@
+import itertools
+import sys
+from os.path import dirname, abspath
+
+# Add the project root directory to Python path
+sys.path.append(dirname(dirname(abspath(__file__))))
+
+from src.statevector_engine import NUM_QUBITS, recovery_fidelities
+
+# Pauli -> error_type of introduce_error(); Y is X then Z, equal up to a global phase
+PAULI_ERROR_TYPES = {'X': 'bit', 'Y': 'both', 'Z': 'phase'}
+# Sort order that puts non-identity Paulis first within a canonical block
+_ORDER = 'XYZI'
+
+
+def pauli_patterns(weight):
+    """Every weight-k Pauli error on the 9 qubits, as tuples of (qubit, Pauli)
+    pairs in qubit order, e.g. ((0, 'X'), (4, 'Y'))."""
+    for qubits in itertools.combinations(range(NUM_QUBITS), weight):
+        for paulis in itertools.product('XYZ', repeat=weight):
+            yield tuple(zip(qubits, paulis))
+
+
+def canonical_pattern(pattern):
+    """Representative of pattern under the code's symmetries.
+
+    Permuting the three blocks, or the three qubits inside any block, maps
+    the Shor code to itself and commutes with its majority-vote decoding,
+    so every pattern in an orbit has the same logical effect. The orbit is
+    identified by the multiset of per-block Pauli contents; the
+    representative puts the busiest blocks first and, within a block, the
+    non-identity Paulis on the lowest qubits.
+    """
+    blocks = [['I'] * 3 for _ in range(3)]
+    for qubit, pauli in pattern:
+        blocks[qubit // 3][qubit % 3] = pauli
+    contents = sorted((sorted(block, key=_ORDER.index) for block in blocks),
+                      key=lambda block: [_ORDER.index(p) for p in block])
+    return tuple((3 * b + position, pauli)
+                 for b, block in enumerate(contents)
+                 for position, pauli in enumerate(block) if pauli != 'I')
+
+
+def pattern_label(pattern):
+    """Compact label such as 'X0 Y4'; 'I' for the empty pattern."""
+    return ' '.join(f"{pauli}{qubit}" for qubit, pauli in pattern) or 'I'
+
+
+def error_classes(weights=(1, 2, 3)):
+    """Group every Pauli pattern of the given weights into symmetry classes.
+
+    Returns a dict mapping each canonical representative to the list of all
+    patterns in its class, in enumeration order.
+    """
+    classes = {}
+    for weight in weights:
+        for pattern in pauli_patterns(weight):
+            classes.setdefault(canonical_pattern(pattern), []).append(pattern)
+    return classes
+
+
+def _logical_error(fidelity_z, fidelity_x, tol):
+    """Logical Pauli implied by the recovery fidelities of |0> and |+>."""
+    bit_flip = fidelity_z < 1 - tol
+    phase_flip = fidelity_x < 1 - tol
+    return {(False, False): 'I', (True, False): 'X',
+            (False, True): 'Z', (True, True): 'Y'}[(bit_flip, phase_flip)]
+
+
+def enumerate_logical_failures(weights=(1, 2, 3), tol=1e-9):
+    """Exhaustively classify every weight-k Pauli error by its logical effect.
+
+    All 27 weight-1, 324 weight-2 and 2268 weight-3 patterns on the 9
+    qubits (X, Y and Z) are reduced to their symmetry classes, and only one
+    representative per class is decoded, as one batch through
+    src.statevector_engine for |0> (which detects logical X) and one for
+    |+> (logical Z); a logical Y shows up in both.
+
+    Returns one row per class, ordered by weight, with the keys weight,
+    representative (its label), patterns (every member), multiplicity,
+    logical_error (the Pauli left on decoded qubit 0: 'I' when corrected,
+    else 'X', 'Y' or 'Z'),
+    fidelity_0 and fidelity_plus.
+    """
+    classes = error_classes(weights)
+    representatives = sorted(classes, key=lambda pattern: (len(pattern), pattern))
+    errors = [[(qubit, PAULI_ERROR_TYPES[pauli]) for qubit, pauli in pattern]
+              for pattern in representatives]
+    fidelities_z = recovery_fidelities(errors, initial_state='0')
+    fidelities_x = recovery_fidelities(errors, initial_state='+')
+
+    rows = []
+    for pattern, fidelity_z, fidelity_x in zip(representatives, fidelities_z, fidelities_x):
+        rows.append({
+            'weight': len(pattern),
+            'representative': pattern_label(pattern),
+            'patterns': [pattern_label(member) for member in classes[pattern]],
+            'multiplicity': len(classes[pattern]),
+            'logical_error': _logical_error(fidelity_z, fidelity_x, tol),
+            'fidelity_0': float(fidelity_z),
+            'fidelity_plus': float(fidelity_x),
+        })
+    return rows
+
+
+def failure_summary(rows):
+    """Per weight: total patterns, failing patterns and the failing fraction."""
+    summary = {}
+    for row in rows:
+        entry = summary.setdefault(row['weight'], {'patterns': 0, 'failures': 0})
+        entry['patterns'] += row['multiplicity']
+        if row['logical_error'] != 'I':
+            entry['failures'] += row['multiplicity']
+    for entry in summary.values():
+        entry['failure_fraction'] = entry['failures'] / entry['patterns']
+    return summary
@@ -0,0 +1,122 @@
+import contextlib
+import csv
+import json
+import logging
+import time
+
+logger = logging.getLogger('shors_code')
+
+# Recorders currently collecting, innermost last; spans and counters are
+# free no-ops while this is empty
+_active = []
+
+
+class MetricsRecorder:
+    """Collects stage timings, counters and Aer execution metadata.
+
+    Use through record_metrics(); every span(), count() and
+    record_aer_result() made while it is active lands here. Only work done
+    in this process is recorded, not inside parallel_map workers.
+    """
+
+    def __init__(self):
+        self.spans = []
+        self.counters = {}
+        self.aer = []
+        self.origin = time.perf_counter()
+        self._depth = 0
+
+    def totals(self):
+        """Total seconds per span name."""
+        totals = {}
+        for span_row in self.spans:
+            totals[span_row['name']] = totals.get(span_row['name'], 0.0) + span_row['duration_s']
+        return totals
+
+    def to_dict(self):
+        return {'spans': self.spans, 'totals': self.totals(),
+                'counters': self.counters, 'aer': self.aer}
+
+    def to_json(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2, default=str)
+
+    def to_csv(self, path):
+        """Write one row per span (name, depth, start, duration) to path."""
+        with open(path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=['name', 'depth', 'start_s', 'duration_s'])
+            writer.writeheader()
+            writer.writerows(self.spans)
+
+
+@contextlib.contextmanager
+def record_metrics(path=None, callback=None):
+    """Collect metrics for the enclosed block into a MetricsRecorder.
+
+    On exit the recorder is written to path (CSV if it ends in .csv,
+    otherwise JSON) and/or passed to callback, if given.
+    """
+    recorder = MetricsRecorder()
+    _active.append(recorder)
+    try:
+        yield recorder
+    finally:
+        _active.remove(recorder)
+        if path:
+            if str(path).endswith('.csv'):
+                recorder.to_csv(path)
+            else:
+                recorder.to_json(path)
+        if callback:
+            callback(recorder)
+
+
+@contextlib.contextmanager
+def span(name):
+    """Time the enclosed block as stage name in every active recorder."""
+    if not _active:
+        yield
+        return
+    start = time.perf_counter()
+    for recorder in _active:
+        recorder._depth += 1
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - start
+        for recorder in _active:
+            recorder._depth -= 1
+            recorder.spans.append({'name': name, 'depth': recorder._depth,
+                                   'start_s': start - recorder.origin, 'duration_s': duration})
+
+
+def count(name, value=1):
+    """Add value to counter name in every active recorder."""
+    for recorder in _active:
+        recorder.counters[name] = recorder.counters.get(name, 0) + value
+
+
+def record_aer_result(result):
+    """Keep the timing and parallelisation metadata Aer reports for a job."""
+    if not _active:
+        return
+    metadata = getattr(result, 'metadata', None) or {}
+    row = {
+        'time_taken': getattr(result, 'time_taken', None),
+        'parallel_experiments': metadata.get('parallel_experiments'),
+        'omp_enabled': metadata.get('omp_enabled'),
+        'max_memory_mb': metadata.get('max_memory_mb'),
+        'experiments': [],
+    }
+    for experiment in getattr(result, 'results', []):
+        experiment_metadata = getattr(experiment, 'metadata', None) or {}
+        row['experiments'].append({
+            'name': getattr(experiment.header, 'name', None),
+            'shots': experiment.shots,
+            'time_taken': getattr(experiment, 'time_taken', None),
+            'method': experiment_metadata.get('method'),
+            'parallel_shots': experiment_metadata.get('parallel_shots'),
+            'parallel_state_update': experiment_metadata.get('parallel_state_update'),
+        })
+    for recorder in _active:
+        recorder.aer.append(row)
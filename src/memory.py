@@ -0,0 +1,103 @@
+import numpy as np
+from qiskit import QuantumCircuit
+import sys
+from os.path import dirname, abspath
+
+# Add the project root directory to Python path
+sys.path.append(dirname(dirname(abspath(__file__))))
+
+from src.circuit_cache import get_template
+from src.pauli_frame import (circuit_ops, new_frames, propagate_frames,
+                             sample_depolarizing_faults, depolarizing_masks,
+                             bernoulli_positions, num_words, popcount, valid_mask)
+from src.syndrome import NUM_SYNDROME, append_syndrome_round
+
+NUM_QUBITS = 9 + NUM_SYNDROME
+
+
+def encode_ops():
+    """Gate list that encodes logical |0> on qubits 0-8 of the 17-qubit layout."""
+    qc = QuantumCircuit(NUM_QUBITS)
+    qc.compose(get_template('encode'), qubits=list(range(9)), inplace=True)
+    return circuit_ops(qc)
+
+
+def round_ops():
+    """Gate list of one memory round: every data qubit idles (an 'id' op, which
+    picks up idle noise), then all eight stabilizers are measured and the
+    ancillas reset."""
+    qc = QuantumCircuit(NUM_QUBITS, NUM_SYNDROME)
+    for q in range(9):
+        qc.id(q)
+    append_syndrome_round(qc, list(range(NUM_SYNDROME)), reset=True)
+    return circuit_ops(qc)
+
+
+def _idle_faults(ops, shots, p_idle, rng, faults):
+    """Add depolarizing faults of strength p_idle after every 'id' op."""
+    n_words = num_words(shots)
+    for i, (name, qubits) in enumerate(ops):
+        if name != 'id':
+            continue
+        positions = bernoulli_positions(rng, shots, p_idle)
+        if len(positions):
+            faults.setdefault(i, []).extend(depolarizing_masks(rng, qubits, positions, n_words))
+    return faults
+
+
+def _majority(a, b, c):
+    return (a & b) | (b & c) | (a & c)
+
+
+def memory_experiment(rounds, shots=10**5, p1=0.001, p2=0.01, p_idle=None, seed=None):
+    """Logical error rate of a stored logical |0> after 1..rounds QEC rounds.
+
+    Each round lets the data qubits idle with depolarizing noise p_idle
+    (default p1), then measures all stabilizers with noisy gates (p1/p2 as
+    in create_noise_model()). Phase flips are tracked in software from the
+    X-type syndrome changes between rounds: a change locates a new error to
+    one block, whose correction is toggled. Bit flips commute with the
+    logical readout (X on all nine qubits) and need no correction.
+
+    All shots are simulated as bit-packed Pauli frames (src.pauli_frame)
+    and carried from round k into round k+1, so the whole curve costs one
+    rounds-long simulation rather than one run per round count. After
+    every round the logical readout is evaluated on the current frames
+    without disturbing them, as an ideal transversal X-basis measurement.
+
+    Returns one row per round count, each a dict with rounds, shots,
+    failures and logical_error_rate.
+    """
+    rng = np.random.default_rng(seed)
+    p_idle = p1 if p_idle is None else p_idle
+    n_words = num_words(shots)
+    valid = valid_mask(shots, n_words)
+    x, z = new_frames(NUM_QUBITS, shots)
+
+    ops = encode_ops()
+    propagate_frames(ops, NUM_QUBITS, shots, sample_depolarizing_faults(ops, shots, p1, p2, rng),
+                     frames=(x, z))
+
+    ops = round_ops()
+    previous = (np.zeros(n_words, dtype=np.uint64), np.zeros(n_words, dtype=np.uint64))
+    correction = [np.zeros(n_words, dtype=np.uint64) for _ in range(3)]
+    rows = []
+    for k in range(1, rounds + 1):
+        faults = _idle_faults(ops, shots, p_idle,
+                              rng, sample_depolarizing_faults(ops, shots, p1, p2, rng))
+        outcomes = propagate_frames(ops, NUM_QUBITS, shots, faults, frames=(x, z))
+
+        # X-type syndrome bits are the last two measurements of the round
+        s0, s1 = outcomes[-2], outcomes[-1]
+        d0, d1 = s0 ^ previous[0], s1 ^ previous[1]
+        correction[0] ^= d0 & ~d1
+        correction[1] ^= d0 & d1
+        correction[2] ^= ~d0 & d1
+        previous = (s0, s1)
+
+        # An X-basis readout flips where the frame has a Z component
+        parities = [z[3 * b] ^ z[3 * b + 1] ^ z[3 * b + 2] ^ correction[b] for b in range(3)]
+        failures = popcount(_majority(*parities) & valid)
+        rows.append({'rounds': k, 'shots': shots, 'failures': failures,
+                     'logical_error_rate': failures / shots})
+    return rows
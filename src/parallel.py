@@ -0,0 +1,56 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+
+def task_seed(seed, index):
+    """Derive a reproducible seed for task number index from a base seed.
+
+    Depends only on (seed, index), never on which worker runs the task, so
+    seeded results come out the same for any worker count. Returns None when
+    seed is None.
+    """
+    if seed is None:
+        return None
+    return int(np.random.SeedSequence(seed, spawn_key=(index,)).generate_state(1)[0])
+
+
+def resolve_workers(workers):
+    """Turn a workers argument into a process count (None means all cores)."""
+    if workers is None:
+        return os.cpu_count() or 1
+    return max(1, int(workers))
+
+
+def parallel_imap(func, tasks, workers=1, chunksize=1):
+    """Like parallel_map, but yield each result, in task order, as soon as it
+    and every result before it are done.
+
+    Lets callers stream completed results (e.g. to a ResultStore) instead of
+    holding them all until the last task finishes.
+    """
+    tasks = list(tasks)
+    workers = resolve_workers(workers)
+    if workers == 1 or len(tasks) <= 1:
+        for task in tasks:
+            yield func(task)
+        return
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks)), mp_context=context) as pool:
+        yield from pool.map(func, tasks, chunksize=chunksize)
+
+
+def parallel_map(func, tasks, workers=1, chunksize=1):
+    """Apply func to every task and return the results in task order.
+
+    With workers=1 (the default) the tasks run serially in this process;
+    otherwise they are spread over a process pool of that many workers
+    (None for one per core), chunksize tasks at a time. func must be a
+    module-level function so it can be pickled.
+
+    Workers are started with 'spawn' rather than 'fork': Aer's OpenMP
+    threads do not survive a fork and forked workers can deadlock.
+    """
+    return list(parallel_imap(func, tasks, workers=workers, chunksize=chunksize))
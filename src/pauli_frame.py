@@ -0,0 +1,249 @@
+import numpy as np
+import sys
+from os.path import dirname, abspath
+
+# Add the project root directory to Python path
+sys.path.append(dirname(dirname(abspath(__file__))))
+
+# Gates that pick up depolarizing noise, both in create_noise_model() and here
+NOISY_1Q_GATES = ('x', 'h', 'z')
+NOISY_2Q_GATES = ('cx',)
+
+
+def circuit_ops(circuit):
+    """Flatten a QuantumCircuit into a list of (gate name, qubit indices) tuples.
+
+    Barriers are dropped; everything else is kept in circuit order so the
+    frame sampler runs exactly the gate list the Aer paths run.
+    """
+    ops = []
+    for instruction in circuit.data:
+        name = instruction.operation.name
+        if name == 'barrier':
+            continue
+        qubits = tuple(circuit.find_bit(q).index for q in instruction.qubits)
+        ops.append((name, qubits))
+    return ops
+
+
+def shors_code_ops(error_qubit=3, error_type='both', initial_state='0'):
+    """Gate list of the same encode -> error -> decode -> measure circuit
+    that simulate_shors_code() runs on Aer."""
+    from src.simulate import _build_full_circuit
+    return circuit_ops(_build_full_circuit(error_qubit, error_type, initial_state))
+
+
+def _check_toffoli_controls(ops):
+    """Make sure every Toffoli can be treated as a measured, classically
+    controlled X.
+
+    That is only valid when its control qubits are never touched again
+    (they are then in a deterministic Z eigenstate relative to the
+    noiseless reference), which holds for decode_shors_code().
+    """
+    for i, (name, qubits) in enumerate(ops):
+        if name != 'ccx':
+            continue
+        controls = set(qubits[:2])
+        for later_name, later_qubits in ops[i + 1:]:
+            if later_name != 'measure' and controls & set(later_qubits):
+                raise ValueError(
+                    f"Toffoli at position {i} has control qubits {sorted(controls)} "
+                    f"reused by a later '{later_name}' gate; cannot track it as a Pauli frame"
+                )
+
+
+def fault_locations(ops, p1=0.001, p2=0.01):
+    """Return (op index, qubits, probability) for every noisy gate in ops."""
+    locations = []
+    for i, (name, qubits) in enumerate(ops):
+        if name in NOISY_1Q_GATES and p1 > 0:
+            locations.append((i, qubits, p1))
+        elif name in NOISY_2Q_GATES and p2 > 0:
+            locations.append((i, qubits, p2))
+    return locations
+
+
+def num_words(shots):
+    """Number of uint64 words holding one bit per shot."""
+    return (shots + 63) // 64
+
+
+def pack_shots(positions, n_words):
+    """Pack shot indices into a uint64 bit mask."""
+    words = np.zeros(n_words, dtype=np.uint64)
+    if len(positions):
+        positions = np.asarray(positions, dtype=np.uint64)
+        np.bitwise_or.at(words, positions >> np.uint64(6),
+                         np.uint64(1) << (positions & np.uint64(63)))
+    return words
+
+
+def popcount(words):
+    """Number of set bits in an array of uint64 words."""
+    if hasattr(np, 'bitwise_count'):
+        return int(np.bitwise_count(words).sum())
+    return int(np.unpackbits(words.view(np.uint8)).sum())
+
+
+def valid_mask(shots, n_words):
+    """Mask with one bit set per real shot (the tail of the last word is padding)."""
+    mask = np.full(n_words, np.iinfo(np.uint64).max, dtype=np.uint64)
+    tail = shots % 64
+    if tail:
+        mask[-1] = (np.uint64(1) << np.uint64(tail)) - np.uint64(1)
+    return mask
+
+
+def bernoulli_positions(rng, shots, p):
+    """Indices of shots hit by an independent event of probability p.
+
+    Drawn as geometric gaps, so the cost scales with the number of hits
+    rather than with the number of shots.
+    """
+    if p <= 0:
+        return np.empty(0, dtype=np.int64)
+    if p >= 1:
+        return np.arange(shots, dtype=np.int64)
+    expected = shots * p
+    size = int(expected + 6 * np.sqrt(expected) + 16)
+    positions = np.cumsum(rng.geometric(p, size)) - 1
+    while positions[-1] < shots:
+        more = np.cumsum(rng.geometric(p, size)) + positions[-1]
+        positions = np.concatenate([positions, more])
+    return positions[positions < shots]
+
+
+def depolarizing_masks(rng, qubits, positions, n_words):
+    """Frame flips for a uniformly random n-qubit Pauli (identity included,
+    as in Aer's depolarizing_error) on each shot in positions.
+
+    Returns a list of (qubit, x_mask, z_mask).
+    """
+    paulis = rng.integers(0, 4 ** len(qubits), size=len(positions))
+    masks = []
+    for j, qubit in enumerate(qubits):
+        x_bits = (paulis >> (2 * j)) & 1
+        z_bits = (paulis >> (2 * j + 1)) & 1
+        masks.append((qubit,
+                      pack_shots(positions[x_bits == 1], n_words),
+                      pack_shots(positions[z_bits == 1], n_words)))
+    return masks
+
+
+def sample_depolarizing_faults(ops, shots, p1=0.001, p2=0.01, rng=None):
+    """Sample depolarizing noise for every noisy gate in ops.
+
+    Returns a dict mapping op index to a list of (qubit, x_mask, z_mask)
+    frame flips to apply right after that gate, for use with propagate_frames().
+    """
+    rng = np.random.default_rng(rng)
+    n_words = num_words(shots)
+    faults = {}
+    for index, qubits, p in fault_locations(ops, p1, p2):
+        positions = bernoulli_positions(rng, shots, p)
+        if len(positions):
+            faults[index] = depolarizing_masks(rng, qubits, positions, n_words)
+    return faults
+
+
+def new_frames(num_qubits, shots):
+    """Empty (x, z) Pauli frames for num_qubits qubits and shots shots."""
+    n_words = num_words(shots)
+    return (np.zeros((num_qubits, n_words), dtype=np.uint64),
+            np.zeros((num_qubits, n_words), dtype=np.uint64))
+
+
+def propagate_frames(ops, num_qubits, shots, faults=None, frames=None):
+    """Propagate bit-packed Pauli frames through ops.
+
+    Frames are tracked relative to the noiseless circuit with every X/Z gate
+    removed: X and Z gates (state preparation and injected errors) become
+    frame flips on all shots, H and CX are Clifford updates, and a Toffoli
+    is a classically controlled X on its target (see _check_toffoli_controls).
+    Because the reference circuit returns every measured qubit to |0>, the
+    outcome of a measurement is the X component of the frame. A reset
+    clears the frame of its qubit.
+
+    frames, an (x, z) pair of (num_qubits, words) uint64 arrays from
+    new_frames(), lets a caller continue from where an earlier call left
+    off; they are updated in place.
+
+    Returns a list of uint64 outcome masks, one per 'measure' op, in order.
+    """
+    _check_toffoli_controls(ops)
+    faults = faults or {}
+    n_words = num_words(shots)
+    ones = np.full(n_words, np.iinfo(np.uint64).max, dtype=np.uint64)
+    x, z = frames if frames is not None else new_frames(num_qubits, shots)
+    outcomes = []
+
+    for i, (name, qubits) in enumerate(ops):
+        if name == 'x':
+            x[qubits[0]] ^= ones
+        elif name == 'z':
+            z[qubits[0]] ^= ones
+        elif name == 'h':
+            q = qubits[0]
+            x[q], z[q] = z[q].copy(), x[q].copy()
+        elif name == 'cx':
+            control, target = qubits
+            x[target] ^= x[control]
+            z[control] ^= z[target]
+        elif name == 'ccx':
+            a, b, target = qubits
+            x[target] ^= x[a] & x[b]
+        elif name == 'measure':
+            outcomes.append(x[qubits[0]] & valid_mask(shots, n_words))
+        elif name == 'reset':
+            x[qubits[0]] = 0
+            z[qubits[0]] = 0
+        elif name != 'id':
+            raise ValueError(f"Unsupported gate '{name}' for Pauli-frame simulation")
+
+        for qubit, x_mask, z_mask in faults.get(i, ()):
+            x[qubit] ^= x_mask
+            z[qubit] ^= z_mask
+
+    return outcomes
+
+
+def run_pauli_frames(ops, shots, p1=0.001, p2=0.01, seed=None, batch_shots=1 << 22):
+    """Sample ops with depolarizing noise and return Aer-style counts of the
+    first measured bit, e.g. {'0': 9990, '1': 10}.
+
+    Shots are processed in batches of batch_shots to bound memory.
+    """
+    rng = np.random.default_rng(seed)
+    num_qubits = 1 + max(q for _, qubits in ops for q in qubits)
+    ones = 0
+    remaining = shots
+    while remaining > 0:
+        batch = min(batch_shots, remaining)
+        faults = sample_depolarizing_faults(ops, batch, p1, p2, rng)
+        outcomes = propagate_frames(ops, num_qubits, batch, faults)
+        ones += popcount(outcomes[0])
+        remaining -= batch
+
+    counts = {'0': shots - ones, '1': ones}
+    return {key: value for key, value in counts.items() if value}
+
+
+def sample_shors_code(error_qubit=3, error_type='both', initial_state='0',
+                      shots=10**6, p1=0.001, p2=0.01, seed=None):
+    """Pauli-frame counterpart of simulate_shors_code().
+
+    Runs the same circuit with the same depolarizing noise strengths and
+    returns counts in the same format, but at a cost that lets 10^7-10^8
+    shots finish in seconds. Toffolis are treated as noiseless classically
+    controlled corrections; Aer instead decomposes them into noisy CX/H
+    gates, so its success rates are somewhat lower than the ones found here.
+    """
+    ops = shors_code_ops(error_qubit, error_type, initial_state)
+    return run_pauli_frames(ops, shots, p1=p1, p2=p2, seed=seed)
+
+
+def logical_error_rate(counts, initial_state='0'):
+    """Fraction of shots that did not preserve the initial logical state."""
+    total = sum(counts.values())
+    return 1 - counts.get(initial_state, 0) / total
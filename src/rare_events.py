@@ -0,0 +1,123 @@
+import numpy as np
+import sys
+from os.path import dirname, abspath
+
+# Add the project root directory to Python path
+sys.path.append(dirname(dirname(abspath(__file__))))
+
+from src.pauli_frame import (shors_code_ops, fault_locations, depolarizing_masks,
+                             propagate_frames, num_words, popcount)
+from src.threshold import clopper_pearson
+
+
+def _symmetric_sums(weights, max_order):
+    """table[i, r] = elementary symmetric polynomial of order r of weights[i:]."""
+    n = len(weights)
+    table = np.zeros((n + 1, max_order + 1))
+    table[n, 0] = 1.0
+    for i in range(n - 1, -1, -1):
+        table[i] = table[i + 1]
+        table[i, 1:] += weights[i] * table[i + 1, :-1]
+    return table
+
+
+def fault_count_distribution(probabilities, max_faults):
+    """P(exactly k fault locations fire) for k = 0..max_faults, and P(more fire).
+
+    probabilities holds the firing probability of each location; the count
+    of firing locations is Poisson-binomial, computed exactly. Returns
+    (weights, tail).
+    """
+    p = np.asarray(probabilities, dtype=float)
+    table = _symmetric_sums(p / (1 - p), max_faults)
+    weights = np.prod(1 - p) * table[0]
+    return weights, max(0.0, 1.0 - weights.sum())
+
+
+def sample_conditional_faults(locations, k, shots, rng):
+    """Sample depolarizing faults conditioned on exactly k locations firing.
+
+    Each shot picks its k locations with the exact conditional probability
+    (subsets weighted by prod p/(1-p)), drawn location by location for all
+    shots at once; every chosen location then applies a uniformly random
+    Pauli, identity included, as in sample_depolarizing_faults().
+    Returns a faults dict for propagate_frames().
+    """
+    p = np.array([prob for _, _, prob in locations])
+    table = _symmetric_sums(p / (1 - p), k)
+    remaining = np.full(shots, k)
+    n_words = num_words(shots)
+    faults = {}
+    for i, (index, qubits, prob) in enumerate(locations):
+        if not remaining.any():
+            break
+        r = np.maximum(remaining, 1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            include_probability = np.where(
+                remaining > 0, p[i] / (1 - p[i]) * table[i + 1, r - 1] / table[i, r], 0.0)
+        positions = np.flatnonzero(rng.random(shots) < include_probability)
+        remaining[positions] -= 1
+        if len(positions):
+            faults[index] = depolarizing_masks(rng, qubits, positions, n_words)
+    return faults
+
+
+def stratified_logical_error_rate(error_qubit=3, error_type='none', initial_state='0',
+                                  p1=0.001, p2=0.01, max_faults=4, shots_per_stratum=10**5,
+                                  seed=None, ops=None, confidence=0.95):
+    """Rare-event estimate of the logical error rate, stratified by fault count.
+
+    The circuit's noisy gates fire independently (p1 or p2 each), so the
+    number k of firing locations has a known distribution. Each stratum
+    k = 1..max_faults is sampled conditionally on exactly k faults with the
+    Pauli-frame sampler, and the per-stratum failure rates f_k are combined
+    with the exact weights P(K = k):
+
+        P_L = sum_k P(K = k) f_k  (+ at most P(K > max_faults))
+
+    Every shot is spent on a run that actually contains faults, which at
+    the default p1/p2 gives orders of magnitude smaller error bars than
+    plain sampling for the same number of shots. The zero-fault stratum is
+    deterministic and run once. ops defaults to shors_code_ops() for the
+    given error configuration (noiseless Toffolis, see src.pauli_frame).
+
+    Returns a dict with logical_error_rate (unbiased for the truncated sum),
+    std_error, ci (a conservative interval: per-stratum Clopper-Pearson
+    bounds combined with the weights, plus the truncated tail on the
+    upper end), truncation (that tail probability), shots and strata (one
+    row per k with faults, weight, shots, failures and failure_rate).
+    """
+    ops = ops if ops is not None else shors_code_ops(error_qubit, error_type, initial_state)
+    locations = fault_locations(ops, p1, p2)
+    num_qubits = 1 + max(q for _, qubits in ops for q in qubits)
+    max_faults = min(max_faults, len(locations))
+    weights, tail = fault_count_distribution([prob for _, _, prob in locations], max_faults)
+    rng = np.random.default_rng(seed)
+    flip = initial_state == '1'
+
+    strata = []
+    estimate = variance = low = high = 0.0
+    for k in range(max_faults + 1):
+        shots = 1 if k == 0 else shots_per_stratum
+        faults = sample_conditional_faults(locations, k, shots, rng) if k else None
+        outcome = propagate_frames(ops, num_qubits, shots, faults)[0]
+        failures = shots - popcount(outcome) if flip else popcount(outcome)
+        rate = failures / shots
+        stratum_low, stratum_high = (rate, rate) if k == 0 else clopper_pearson(
+            failures, shots, confidence)
+        estimate += weights[k] * rate
+        if k:
+            variance += weights[k] ** 2 * rate * (1 - rate) / shots
+        low += weights[k] * stratum_low
+        high += weights[k] * stratum_high
+        strata.append({'faults': k, 'weight': float(weights[k]), 'shots': shots,
+                       'failures': failures, 'failure_rate': rate})
+
+    return {
+        'logical_error_rate': float(estimate),
+        'std_error': float(np.sqrt(variance)),
+        'ci': (float(low), float(min(1.0, high + tail))),
+        'truncation': float(tail),
+        'shots': sum(row['shots'] for row in strata),
+        'strata': strata,
+    }
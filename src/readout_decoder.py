@@ -0,0 +1,141 @@
+import functools
+import numpy as np
+from qiskit import QuantumCircuit
+import sys
+from os.path import dirname, abspath
+
+# Add the project root directory to Python path
+sys.path.append(dirname(dirname(abspath(__file__))))
+
+from src.circuit_cache import get_template
+from src.counts_array import array_to_counts, counts_to_array, memory_to_array
+from src.simulate import introduce_error, resolve_noise_model
+from src.result_cache import run_counts
+
+# Readout basis that reveals each logical input: the logical Z eigenstates
+# differ in the phase of every block (X basis), the X eigenstates in the
+# parity of the block values (Z basis)
+READOUT_BASES = {'0': 'X', '1': 'X', '+': 'Z', '-': 'Z'}
+NUM_OUTCOMES = 2 ** 9
+
+
+def build_readout_circuit(error_qubit=3, error_type='both', initial_state='0', basis=None):
+    """Encode, inject an error and destructively measure all nine data qubits.
+
+    initial_state is '0', '1', '+' or '-'; basis ('X' or 'Z') defaults to
+    the one that reads that state out (READOUT_BASES). Qubit q is measured
+    into clbit q, so bit q of an outcome index is qubit q. The circuit is
+    Clifford, so under Pauli noise it runs on the stabilizer method.
+    """
+    basis = basis or READOUT_BASES[initial_state]
+    qc = QuantumCircuit(9, 9)
+    if initial_state in ('1', '-'):
+        qc.x(0)
+    if initial_state in ('+', '-'):
+        qc.h(0)
+    qc.compose(get_template('encode'), inplace=True)
+    qc.barrier()
+    if error_type != 'none':
+        introduce_error(qc, error_qubit, error_type)
+    qc.barrier()
+    if basis == 'X':
+        qc.h(range(9))
+    qc.measure(range(9), range(9))
+    return qc
+
+
+@functools.lru_cache(maxsize=None)
+def readout_lut(basis='X'):
+    """Decoding tables for all 512 nine-bit outcomes of one readout basis.
+
+    Returns (logical, syndrome), two read-only arrays indexed by outcome.
+    In the X basis each block's parity is a copy of the logical value and
+    the logical outcome is their majority; the syndrome is 0, or k + 1 when
+    block k's parity is outvoted (a phase flip on that block). In the Z
+    basis each block's majority value corrects a bit flip and the logical
+    outcome is the parity of the three majorities; the syndrome packs two
+    bits per block, 0 or j + 1 when qubit j of the block was outvoted.
+    """
+    bits = (np.arange(NUM_OUTCOMES)[:, None] >> np.arange(9)) & 1
+    blocks = bits.reshape(NUM_OUTCOMES, 3, 3)
+    if basis == 'X':
+        parities = blocks.sum(axis=2) % 2
+        logical = (parities.sum(axis=1) >= 2).astype(np.uint8)
+        outvoted = parities != logical[:, None]
+        syndrome = np.where(outvoted.any(axis=1), outvoted.argmax(axis=1) + 1, 0)
+    elif basis == 'Z':
+        majorities = (blocks.sum(axis=2) >= 2).astype(np.uint8)
+        logical = majorities.sum(axis=1) % 2
+        outvoted = blocks != majorities[:, :, None]
+        per_block = np.where(outvoted.any(axis=2), outvoted.argmax(axis=2) + 1, 0)
+        syndrome = per_block[:, 0] | per_block[:, 1] << 2 | per_block[:, 2] << 4
+    else:
+        raise ValueError(f"Unknown readout basis '{basis}', expected 'X' or 'Z'")
+    logical = logical.astype(np.uint8)
+    syndrome = syndrome.astype(np.uint8)
+    logical.setflags(write=False)
+    syndrome.setflags(write=False)
+    return logical, syndrome
+
+
+def decode_readout(outcomes, basis='X'):
+    """Decode an array of nine-bit outcomes (any shape) in one table lookup.
+
+    Returns (logical, syndrome) arrays of the same shape as outcomes.
+    """
+    logical, syndrome = readout_lut(basis)
+    outcomes = np.asarray(outcomes)
+    return logical[outcomes], syndrome[outcomes]
+
+
+def decode_histogram(hist, basis='X'):
+    """Decode a 512-bin outcome histogram without expanding it into shots.
+
+    Returns (logical counts array of length 2, syndrome counts array of
+    length 64), both weighted bincounts through readout_lut().
+    """
+    logical, syndrome = readout_lut(basis)
+    return (np.bincount(logical, weights=hist, minlength=2).astype(np.int64),
+            np.bincount(syndrome, weights=hist, minlength=64).astype(np.int64))
+
+
+def simulate_readout(error_qubit=3, error_type='both', initial_state='0', shots=8192,
+                     noise=None, seed_simulator=None, basis=None, memory=False):
+    """Run build_readout_circuit() and decode the outcomes classically.
+
+    The nine-qubit counts are turned into a 512-bin histogram and decoded
+    with decode_histogram(), so the cost is independent of shots. With
+    memory=True the per-shot outcomes are also returned as an integer array
+    and decoded shot by shot with decode_readout(). Aer picks the stabilizer
+    method for Pauli noise and a general method for noise that it cannot
+    handle, such as thermal relaxation (t1/t2).
+
+    Returns a dict with counts (logical {'0': n, '1': m}, '0' meaning the
+    first state of the basis pair: |0> or |+>), syndromes ({code: count}
+    for the non-zero codes of readout_lut()), histogram and, with memory,
+    outcomes, logical and syndrome per shot.
+    """
+    from qiskit_aer import AerSimulator
+
+    basis = basis or READOUT_BASES[initial_state]
+    backend = AerSimulator(noise_model=resolve_noise_model(noise))
+    circuit = build_readout_circuit(error_qubit, error_type, initial_state, basis)
+    if memory:
+        result = backend.run(circuit, shots=shots, seed_simulator=seed_simulator,
+                             memory=True).result()
+        outcomes = memory_to_array(result.get_memory(0), 9)
+        hist = np.bincount(outcomes, minlength=NUM_OUTCOMES)
+    else:
+        counts = run_counts(backend, [circuit], shots=shots, seed_simulator=seed_simulator)[0]
+        hist = counts_to_array(counts, 9)
+
+    logical_counts, syndrome_counts = decode_histogram(hist, basis)
+    result = {
+        'counts': array_to_counts(logical_counts, 1),
+        'syndromes': {int(code): int(n) for code, n in enumerate(syndrome_counts) if n},
+        'histogram': hist,
+    }
+    if memory:
+        result['outcomes'] = outcomes
+        result['logical'], result['syndrome'] = decode_readout(outcomes, basis)
+    return result
@@ -0,0 +1,150 @@
+import hashlib
+import json
+import os
+import struct
+import sys
+from os.path import dirname, abspath
+
+import numpy as np
+
+# Add the project root directory to Python path
+sys.path.append(dirname(dirname(abspath(__file__))))
+
+from src.instrumentation import count, logger, span
+from src.parallel import parallel_map
+
+# Bump when a draw function's styling changes, so existing PNGs are redrawn
+RENDER_VERSION = 1
+# PNG text chunk holding the input hash of the figure
+HASH_KEY = 'InputHash'
+
+# Figures reused across render() calls in this process, keyed by figsize
+_figures = {}
+
+
+def _jsonable(obj):
+    from qiskit import QuantumCircuit
+    from src.result_cache import circuit_fingerprint
+
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, QuantumCircuit):
+        return repr(circuit_fingerprint(obj))
+    raise TypeError(f"Cannot hash figure input of type {type(obj).__name__}")
+
+
+def input_hash(draw, data, figsize=None, dpi=200):
+    """Content hash of everything that determines a rendered figure: the draw
+    function, its data (JSON-like values, numpy arrays or circuits), the
+    figure size, dpi and RENDER_VERSION."""
+    payload = json.dumps([RENDER_VERSION, draw.__module__, draw.__qualname__, data,
+                          figsize, dpi], sort_keys=True, default=_jsonable)
+    return hashlib.sha256(payload.encode()).hexdigest()[:24]
+
+
+def stored_hash(path):
+    """Input hash recorded in the PNG at path by render(), or None.
+
+    Only the chunk headers are read; image data is skipped over.
+    """
+    try:
+        with open(path, 'rb') as f:
+            if f.read(8) != b'\x89PNG\r\n\x1a\n':
+                return None
+            while True:
+                header = f.read(8)
+                if len(header) < 8:
+                    return None
+                length, chunk_type = struct.unpack('>I4s', header)
+                if chunk_type == b'IEND':
+                    return None
+                if chunk_type == b'tEXt':
+                    key, _, value = f.read(length).partition(b'\0')
+                    if key.decode('latin-1') == HASH_KEY:
+                        return value.decode('latin-1')
+                    f.seek(4, os.SEEK_CUR)
+                else:
+                    f.seek(length + 4, os.SEEK_CUR)
+    except (OSError, struct.error):
+        return None
+
+
+def get_figure(figsize):
+    """Cleared Figure of size figsize, reused across calls in this process.
+
+    Figures are created directly rather than through pyplot, so they are
+    never registered with (or leaked into) pyplot's global figure list.
+    """
+    from matplotlib.figure import Figure
+
+    figsize = tuple(figsize)
+    fig = _figures.get(figsize)
+    if fig is None:
+        fig = _figures[figsize] = Figure(figsize=figsize)
+    else:
+        fig.clf()
+        fig.set_size_inches(figsize)
+    return fig
+
+
+def _draw_and_save(path, draw, data, figsize, dpi, key):
+    with span('render'):
+        fig = get_figure(figsize) if figsize else None
+        drawn = draw(fig, data)
+        if drawn is not None and drawn is not fig:
+            fig = drawn
+        fig.savefig(path, bbox_inches='tight', dpi=dpi, metadata={HASH_KEY: key})
+        if not figsize:
+            # Figures the draw function created itself are not reused
+            import matplotlib.pyplot as plt
+            plt.close(fig)
+    count('figures_rendered')
+    return path
+
+
+def render(path, draw, data, figsize=(10, 4.5), dpi=200, force=False):
+    """Render draw(fig, data) to the PNG at path unless it is already current.
+
+    draw gets a reused, cleared Figure of size figsize and plots data into
+    it; with figsize=None it gets None and must return a Figure of its own.
+    The PNG is tagged with input_hash() of the inputs, and when the file at
+    path already carries the same hash nothing is drawn. Returns True if the
+    figure was rendered, False if it was skipped.
+    """
+    key = input_hash(draw, data, figsize, dpi)
+    if not force and stored_hash(path) == key:
+        count('figures_skipped')
+        logger.debug("Figure %s is up to date", path)
+        return False
+    _draw_and_save(path, draw, data, figsize, dpi, key)
+    return True
+
+
+def _render_task(task):
+    return _draw_and_save(*task)
+
+
+def render_figures(jobs, workers=1, chunksize=4, force=False):
+    """render() every job, drawing the out-of-date ones in parallel.
+
+    jobs is a list of dicts of render() arguments (path, draw, data and
+    optionally figsize and dpi); draw must be a module-level function so it
+    can be sent to worker processes. Hashes are checked here first, so only
+    figures that changed are handed to the pool of workers processes (None
+    for one per core), where each worker reuses its own Figures.
+
+    Returns the list of paths that were rendered.
+    """
+    tasks = []
+    for job in jobs:
+        figsize = job.get('figsize', (10, 4.5))
+        dpi = job.get('dpi', 200)
+        key = input_hash(job['draw'], job['data'], figsize, dpi)
+        if not force and stored_hash(job['path']) == key:
+            count('figures_skipped')
+            continue
+        tasks.append((job['path'], job['draw'], job['data'], figsize, dpi, key))
+    logger.info("Rendering %d of %d figures", len(tasks), len(jobs))
+    return parallel_map(_render_task, tasks, workers=workers, chunksize=chunksize)
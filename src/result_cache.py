@@ -0,0 +1,207 @@
+import copy
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from os.path import dirname, abspath
+
+import numpy as np
+import qiskit
+import sys
+
+# Add the project root directory to Python path
+sys.path.append(dirname(dirname(abspath(__file__))))
+
+from src.instrumentation import count, logger, record_aer_result, span
+
+CACHE_DIR = os.path.join(dirname(dirname(abspath(__file__))), '.result_cache')
+MAX_DISK_BYTES = 256 * 1024 * 1024
+MAX_MEMORY_ENTRIES = 256
+# Set SHORS_RESULT_CACHE=0 (or ENABLED = False) to always simulate, e.g. for benchmarks
+ENABLED = os.environ.get('SHORS_RESULT_CACHE', '1') != '0'
+
+# In-process tier, most recently used last; the lock serialises the async
+# API's executor threads
+_memory = OrderedDict()
+_memory_lock = threading.Lock()
+
+
+def circuit_fingerprint(circuit):
+    """Hashable description of everything in circuit that affects its results."""
+    return (
+        circuit.num_qubits,
+        circuit.num_clbits,
+        tuple(
+            (instruction.operation.name,
+             tuple(repr(param) for param in instruction.operation.params),
+             tuple(circuit.find_bit(q).index for q in instruction.qubits),
+             tuple(circuit.find_bit(c).index for c in instruction.clbits))
+            for instruction in circuit.data
+        ),
+    )
+
+
+def _noise_fingerprint(noise_model):
+    if noise_model is None:
+        return None
+    return json.dumps(noise_model.to_dict(serializable=True), sort_keys=True, default=str)
+
+
+def result_key(kind, circuits, noise_model=None, shots=None, seed=None, method=None):
+    """Content hash of a simulation request.
+
+    Covers the circuits (gate by gate), the full noise model, shots, seed,
+    simulator method and the qiskit/qiskit-aer versions, so any change that
+    could change the result gives a different key.
+    """
+    import qiskit_aer
+
+    payload = repr((kind, [circuit_fingerprint(c) for c in circuits],
+                    _noise_fingerprint(noise_model), shots, seed, method,
+                    qiskit.__version__, qiskit_aer.__version__))
+    return hashlib.sha256(payload.encode()).hexdigest()[:24]
+
+
+def _copy(value):
+    """Private copy of a cached value, so callers never share (and mutate) the stored one."""
+    return value.copy() if isinstance(value, np.ndarray) else copy.deepcopy(value)
+
+
+def _remember(key, value):
+    with _memory_lock:
+        _memory[key] = _copy(value)
+        _memory.move_to_end(key)
+        while len(_memory) > MAX_MEMORY_ENTRIES:
+            _memory.popitem(last=False)
+
+
+def _evict(cache_dir, max_bytes):
+    """Delete least recently used files until cache_dir fits in max_bytes."""
+    entries = []
+    for filename in os.listdir(cache_dir):
+        if filename.endswith(('.json', '.npy')):
+            path = os.path.join(cache_dir, filename)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:  # evicted by another thread or process
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+
+
+def cache_get(key, cache_dir=CACHE_DIR):
+    """Return the stored value for key, or None on a miss.
+
+    Checks the in-process tier first, then cache_dir; a disk hit has its
+    modification time bumped so eviction treats it as recently used. The
+    value returned is the caller's own copy.
+    """
+    if not ENABLED:
+        return None
+    with _memory_lock:
+        if key in _memory:
+            _memory.move_to_end(key)
+            return _copy(_memory[key])
+    if not cache_dir:
+        return None
+    for extension in ('.json', '.npy'):
+        path = os.path.join(cache_dir, key + extension)
+        if not os.path.exists(path):
+            continue
+        try:
+            if extension == '.json':
+                with open(path) as f:
+                    value = json.load(f)
+            else:
+                value = np.load(path)
+        except Exception as e:
+            logger.warning("Ignoring unreadable result cache file %s: %s", path, e)
+            return None
+        try:
+            os.utime(path)
+        except FileNotFoundError:  # evicted since it was read
+            pass
+        _remember(key, value)
+        return value
+    return None
+
+
+def cache_put(key, value, cache_dir=CACHE_DIR, max_bytes=MAX_DISK_BYTES):
+    """Store value (JSON-serialisable, or a NumPy array) under key in both tiers."""
+    if not ENABLED:
+        return
+    _remember(key, value)
+    if not cache_dir:
+        return
+    os.makedirs(cache_dir, exist_ok=True)
+    is_array = isinstance(value, np.ndarray)
+    path = os.path.join(cache_dir, key + ('.npy' if is_array else '.json'))
+    # Unique per thread as well as per process, so concurrent writers never share it
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'wb' if is_array else 'w') as f:
+        if is_array:
+            np.save(f, value)
+        else:
+            json.dump(value, f)
+    os.replace(tmp_path, path)
+    _evict(cache_dir, max_bytes)
+
+
+def run_counts(backend, circuits, shots, seed_simulator=None, cache_dir=CACHE_DIR):
+    """Run circuits on an AerSimulator backend and return a list of counts dicts,
+    reusing the stored counts when the identical job has been run before.
+
+    The whole list is one cache entry, since Aer seeds the experiments of a
+    multi-circuit job from one seed. Unseeded jobs are never cached: each
+    one must be a fresh, independent sample.
+    """
+    circuits = list(circuits)
+    counts = None
+    if seed_simulator is not None:
+        with span('result_cache_lookup'):
+            key = result_key('counts', circuits, backend.options.noise_model, shots,
+                             seed_simulator, backend.options.method)
+            counts = cache_get(key, cache_dir)
+    if counts is None:
+        with span('execute'):
+            result = backend.run(circuits, shots=shots, seed_simulator=seed_simulator).result()
+        record_aer_result(result)
+        count('circuits_executed', len(circuits))
+        count('shots_executed', shots * len(circuits))
+        counts = [dict(result.get_counts(i)) for i in range(len(circuits))]
+        if seed_simulator is not None:
+            cache_put(key, counts, cache_dir)
+    else:
+        count('result_cache_hits')
+    return counts
+
+
+def cached_statevector(circuit, cache_dir=CACHE_DIR):
+    """Exact statevector amplitudes of circuit (Statevector.from_instruction), cached."""
+    from qiskit.quantum_info import Statevector
+
+    key = result_key('statevector', [circuit])
+    amplitudes = cache_get(key, cache_dir)
+    if amplitudes is None:
+        amplitudes = Statevector.from_instruction(circuit).data
+        cache_put(key, amplitudes, cache_dir)
+    return amplitudes
+
+
+def clear_result_cache(cache_dir=None):
+    """Empty the in-process tier, and the files in cache_dir if given."""
+    with _memory_lock:
+        _memory.clear()
+    if cache_dir and os.path.isdir(cache_dir):
+        for filename in os.listdir(cache_dir):
+            if filename.endswith(('.json', '.npy')):
+                os.remove(os.path.join(cache_dir, filename))
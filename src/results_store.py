@@ -0,0 +1,112 @@
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+
+MANIFEST_FILE = 'manifest.json'
+RESULTS_FILE = 'results.jsonl'
+
+
+def params_hash(params):
+    """Stable hash of a JSON-serialisable parameter dict."""
+    payload = json.dumps(params, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+class ResultStore:
+    """Append-only on-disk store for the rows of one long sweep.
+
+    A store is a directory holding manifest.json, which records what the
+    sweep is (kind and parameters) and whether it finished, and
+    results.jsonl, one JSON row per completed point. Every row carries an
+    'index', its position in the sweep, and is flushed and fsynced as soon
+    as it is appended, so after a crash reopening the store with the same
+    parameters reports which points are already done and the runner only
+    simulates the rest.
+    """
+
+    def __init__(self, path, kind, params):
+        # Frozen as the JSON the manifest persists, so later changes to the
+        # caller's objects cannot make the stored params disagree with the hash
+        params = json.loads(json.dumps(params, default=str))
+        self.path = path
+        self.manifest_path = os.path.join(path, MANIFEST_FILE)
+        self.results_path = os.path.join(path, RESULTS_FILE)
+        os.makedirs(path, exist_ok=True)
+
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path) as f:
+                self.manifest = json.load(f)
+            if self.manifest['kind'] != kind or self.manifest['params_hash'] != params_hash(params):
+                raise ValueError(
+                    f"Result store {path} holds a different '{self.manifest['kind']}' sweep; "
+                    "use a new directory or delete it to start over"
+                )
+        else:
+            self.manifest = {
+                'kind': kind,
+                'params': params,
+                'params_hash': params_hash(params),
+                'created': datetime.now().isoformat(timespec='seconds'),
+                'complete': False,
+            }
+            self._write_manifest()
+        self._repair_tail()
+
+    def _write_manifest(self):
+        tmp_path = f"{self.manifest_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.manifest, f, indent=2, default=str)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _repair_tail(self):
+        """Drop a partially written last line left behind by a crash mid-append."""
+        if not os.path.exists(self.results_path):
+            return
+        with open(self.results_path, 'rb+') as f:
+            data = f.read()
+            if data and not data.endswith(b'\n'):
+                f.truncate(data.rfind(b'\n') + 1)
+
+    @property
+    def complete(self):
+        return self.manifest['complete']
+
+    def rows(self):
+        """Yield the stored rows one at a time, in the order they were completed."""
+        if not os.path.exists(self.results_path):
+            return
+        with open(self.results_path) as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def completed_indices(self):
+        """Set of sweep indices that already have a stored row."""
+        return {row['index'] for row in self.rows()}
+
+    def append(self, rows):
+        """Durably append completed rows, each a dict with an 'index' key."""
+        with open(self.results_path, 'a') as f:
+            for row in rows:
+                f.write(json.dumps(row, default=str) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def mark_complete(self):
+        self.manifest['complete'] = True
+        self.manifest['completed'] = datetime.now().isoformat(timespec='seconds')
+        self._write_manifest()
+
+    def sorted_rows(self):
+        """All stored rows ordered by sweep index, without their 'index' key."""
+        rows = sorted(self.rows(), key=lambda row: row['index'])
+        return [{k: v for k, v in row.items() if k != 'index'} for row in rows]
+
+
+def open_store(path):
+    """Open an existing store for reading, whatever sweep it holds."""
+    with open(os.path.join(path, MANIFEST_FILE)) as f:
+        manifest = json.load(f)
+    return ResultStore(path, manifest['kind'], manifest['params'])
@@ -0,0 +1,146 @@
+import json
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from os.path import dirname, abspath
+
+# Add the project root directory to Python path
+sys.path.append(dirname(dirname(abspath(__file__))))
+
+from src.instrumentation import logger
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+
+def warm_up(noise=None):
+    """Pay every one-off cost before the first request arrives.
+
+    Imports qiskit and Aer, builds (and memoizes) the noise model, loads or
+    transpiles the encode/decode blocks for the resulting backend, and
+    computes the block unitaries used by the grid. Everything is cached at
+    module level, so later requests in this process reuse it.
+    """
+    from qiskit_aer import AerSimulator
+    from src.circuit_cache import get_transpiled
+    from src.simulate import resolve_noise_model
+    from src.statevector_engine import block_unitary
+
+    start = time.perf_counter()
+    backend = AerSimulator(noise_model=resolve_noise_model(noise))
+    for name in ('encode', 'decode'):
+        get_transpiled(name, backend)
+        block_unitary(name)
+    logger.info("Warmed up in %.2f s", time.perf_counter() - start)
+
+
+def _simulate(params):
+    from src.simulate import simulate_sweep
+    config = {key: params[key] for key in ('error_qubit', 'error_type', 'initial_state')
+              if key in params}
+    return simulate_sweep([config], shots=params.get('shots', 8192),
+                          seed_simulator=params.get('seed'), noise=params.get('noise'))[0]
+
+
+def _grid(params):
+    from src.visualize import compute_per_qubit_error_grid
+    grid, error_types = compute_per_qubit_error_grid(
+        initial_state=params.get('initial_state', '0'), engine=params.get('engine', 'unitary'))
+    return {'error_types': error_types, 'grid': grid.tolist()}
+
+
+def _sweep(params):
+    from src.simulate import simulate_sweep, sweep_configs
+    configs = params.get('configs')
+    if configs is None:
+        configs = sweep_configs(params.get('qubits', range(9)),
+                                params.get('error_types', ('none', 'bit', 'phase', 'both')),
+                                params.get('initial_states', ('0', '1')))
+    rows = simulate_sweep(configs, shots=params.get('shots', 8192),
+                          seed_simulator=params.get('seed'), noise=params.get('noise'),
+                          chunksize=params.get('chunksize'))
+    return {'rows': rows}
+
+
+# Request path -> handler taking the decoded JSON body
+HANDLERS = {
+    'simulate': _simulate,
+    'grid': _grid,
+    'sweep': _sweep,
+}
+
+
+def handle_request(kind, params):
+    """Run one request of the given kind ('simulate', 'grid' or 'sweep').
+
+    params is the decoded JSON body; its keys mirror the arguments of the
+    corresponding CLI subcommand. Returns a JSON-serializable dict.
+    """
+    if kind not in HANDLERS:
+        raise ValueError(f"Unknown request '{kind}', expected one of {sorted(HANDLERS)}")
+    return HANDLERS[kind](params)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def _reply(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.strip('/') == 'health':
+            self._reply(200, {'status': 'ok', 'requests': self.server.requests_served})
+        else:
+            self._reply(404, {'error': f"Unknown path '{self.path}'"})
+
+    def do_POST(self):
+        kind = self.path.strip('/')
+        if kind not in HANDLERS:
+            self._reply(404, {'error': f"Unknown request '{kind}', expected one of {sorted(HANDLERS)}"})
+            return
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            params = json.loads(self.rfile.read(length) or b'{}')
+            result = handle_request(kind, params)
+        except (KeyError, ValueError, TypeError) as e:
+            self._reply(400, {'error': str(e)})
+            return
+        except Exception as e:
+            logger.exception("Request %s failed", kind)
+            self._reply(500, {'error': str(e)})
+            return
+        self.server.requests_served += 1
+        self._reply(200, result)
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+class SimulationServer(HTTPServer):
+    """Localhost HTTP server that answers simulate/grid/sweep requests with
+    JSON from one long-lived, warmed-up process.
+
+    Requests are handled one at a time, so Aer always has the whole
+    machine to itself. Use port=0 to pick a free port (see server_address).
+    """
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, warm=True, noise=None):
+        super().__init__((host, port), _Handler)
+        self.requests_served = 0
+        if warm:
+            warm_up(noise)
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, noise=None):
+    """Warm up and serve until interrupted."""
+    server = SimulationServer(host, port, noise=noise)
+    logger.info("Serving on http://%s:%d", *server.server_address[:2])
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -1,39 +1,89 @@
 from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
 from qiskit_aer import AerSimulator
-from qiskit_aer.noise import NoiseModel
-from qiskit_aer.noise import depolarizing_error
-from qiskit import execute
+from qiskit_aer.noise import NoiseModel, ReadoutError
+from qiskit_aer.noise import depolarizing_error, thermal_relaxation_error
+import functools
+import os
 import sys
+import numpy as np
 from os.path import dirname, abspath
 
 # Add the project root directory to Python path
 sys.path.append(dirname(dirname(abspath(__file__))))
 
-from src.encode import create_shors_code
-from src.decode import decode_shors_code
+from src.circuit_cache import get_template, get_transpiled
+from src.parallel import parallel_imap, resolve_workers, task_seed
+from src.results_store import ResultStore
+from src.result_cache import run_counts
+from src.counts_array import (array_to_memory, counts_to_array, memory_to_array,
+                               open_memory_file, outcome_dtype)
+from src.instrumentation import count, logger, span
+from src.pauli_frame import NOISY_1Q_GATES, NOISY_2Q_GATES
 
-def create_noise_model():
-    """Create a realistic noise model."""
-    noise_model = NoiseModel()
-    
-    # Improved error probabilities for more realistic simulation
-    p1 = 0.001  # Increase single-qubit error rate to 0.1%
-    p2 = 0.01   # Increase two-qubit error rate to 1%
-    
-    # Add thermal relaxation error
-    t1 = 50e3  # T1 relaxation time (50 microseconds)
-    t2 = 70e3  # T2 relaxation time (70 microseconds)
-    
+# Typical superconducting-qubit values, for use with create_noise_model(t1=T1, t2=T2)
+T1 = 50e3  # T1 relaxation time (50 microseconds, in ns)
+T2 = 70e3  # T2 relaxation time (70 microseconds, in ns)
+
+def create_noise_model(p1=0.001, p2=0.01, readout=0.0, t1=None, t2=None,
+                       gate_time_1q=50, gate_time_2q=300):
+    """Create a realistic noise model.
+
+    p1 and p2 are the single- and two-qubit depolarizing error rates; the
+    defaults (0.1% and 1%) are the ones every result in the README uses.
+    readout is a symmetric measurement bit-flip probability. When t1 and t2
+    (in ns) are given, every noisy gate is also followed by thermal
+    relaxation for its duration, gate_time_1q or gate_time_2q ns.
+
+    Models are memoized on these parameters, so a sweep that revisits a
+    point reuses the already built model. The returned NoiseModel is shared:
+    do not modify it in place.
+    """
+    return _cached_noise_model(float(p1), float(p2), float(readout),
+                               None if t1 is None else float(t1),
+                               None if t2 is None else float(t2),
+                               float(gate_time_1q), float(gate_time_2q))
+
+def gate_errors(p1=0.001, p2=0.01, t1=None, t2=None, gate_time_1q=50, gate_time_2q=300):
+    """The (single-qubit, two-qubit) QuantumErrors that create_noise_model()
+    attaches to NOISY_1Q_GATES and NOISY_2Q_GATES."""
     # Single-qubit depolarizing noise
     error_1 = depolarizing_error(p1, 1)
-    noise_model.add_all_qubit_quantum_error(error_1, ['x', 'h', 'z'])
-    
     # Two-qubit depolarizing noise
     error_2 = depolarizing_error(p2, 2)
-    noise_model.add_all_qubit_quantum_error(error_2, ['cx'])
+
+    # Thermal relaxation during each gate
+    if t1 is not None and t2 is not None:
+        relax_1 = thermal_relaxation_error(t1, t2, gate_time_1q)
+        relax_2 = thermal_relaxation_error(t1, t2, gate_time_2q)
+        error_1 = error_1.compose(relax_1)
+        error_2 = error_2.compose(relax_2.expand(relax_2))
+    return error_1, error_2
+
+@functools.lru_cache(maxsize=256)
+def _cached_noise_model(p1, p2, readout, t1, t2, gate_time_1q, gate_time_2q):
+    noise_model = NoiseModel()
+    error_1, error_2 = gate_errors(p1, p2, t1, t2, gate_time_1q, gate_time_2q)
+    noise_model.add_all_qubit_quantum_error(error_1, list(NOISY_1Q_GATES))
+    noise_model.add_all_qubit_quantum_error(error_2, list(NOISY_2Q_GATES))
+
+    if readout > 0:
+        noise_model.add_all_qubit_readout_error(
+            ReadoutError([[1 - readout, readout], [readout, 1 - readout]]))
     
     return noise_model
 
+def resolve_noise_model(noise=None):
+    """Turn a noise argument into a NoiseModel.
+
+    None gives the default create_noise_model(), a dict is passed to
+    create_noise_model() as keyword arguments, and a NoiseModel is used as is.
+    """
+    if noise is None:
+        return create_noise_model()
+    if isinstance(noise, dict):
+        return create_noise_model(**noise)
+    return noise
+
 def introduce_error(qc, qubit, error_type='bit'):
     """Introduce a single error on the specified qubit."""
     if error_type == 'bit':
@@ -44,11 +94,8 @@ def introduce_error(qc, qubit, error_type='bit'):
         qc.x(qubit)
         qc.z(qubit)
 
-def simulate_shors_code(error_qubit=3, error_type='both', initial_state='0'):
-    """Simulates Shor's 9-qubit code with a single error using AerSimulator."""
-    # Create simulator with minimal noise
-    noise_model = create_noise_model()
-    backend = AerSimulator(noise_model=noise_model)
+def _assemble_circuit(encode, decode, error_qubit, error_type, initial_state):
+    """Wrap the encode and decode blocks with state preparation, error and measurement."""
     qr = QuantumRegister(9, 'q')
     cr = ClassicalRegister(1, 'c')
     full_circuit = QuantumCircuit(qr, cr)
@@ -58,43 +105,265 @@ def simulate_shors_code(error_qubit=3, error_type='both', initial_state='0'):
         full_circuit.x(0)
     
     # Add encoding circuit
-    full_circuit.compose(create_shors_code(), inplace=True)
+    full_circuit.compose(encode, inplace=True)
     full_circuit.barrier()
 
     # Add error if specified
     if error_type != 'none':
-        if error_type == 'bit':
-            full_circuit.x(error_qubit)
-        elif error_type == 'phase':
-            full_circuit.z(error_qubit)
-        elif error_type == 'both':
-            full_circuit.x(error_qubit)
-            full_circuit.z(error_qubit)
+        introduce_error(full_circuit, error_qubit, error_type)
     full_circuit.barrier()
     
     # Decode and measure
-    full_circuit.compose(decode_shors_code(), inplace=True)
+    full_circuit.compose(decode, inplace=True)
     full_circuit.measure(0, 0)
+    return full_circuit
+
+def _build_full_circuit(error_qubit=3, error_type='both', initial_state='0'):
+    """Build the encode -> error -> decode -> measure circuit for one configuration."""
+    return _assemble_circuit(get_template('encode'), get_template('decode'),
+                             error_qubit, error_type, initial_state)
+
+def _build_transpiled_circuit(backend, error_qubit=3, error_type='both', initial_state='0'):
+    """Same circuit as _build_full_circuit, assembled from the cached blocks
+    already transpiled for backend, so it can be run without transpiling."""
+    return _assemble_circuit(get_transpiled('encode', backend), get_transpiled('decode', backend),
+                             error_qubit, error_type, initial_state)
 
-    # Run simulation with noise model
-    job = execute(
-        full_circuit, 
-        backend,
-        shots=8192,
-        noise_model=noise_model
-    )
-    result = job.result()
-    counts = result.get_counts()
+def simulate_shors_code(error_qubit=3, error_type='both', initial_state='0', shots=8192,
+                        noise=None, seed_simulator=None, as_array=False):
+    """Simulates Shor's 9-qubit code with a single error using AerSimulator.
+
+    noise selects the noise model, as in resolve_noise_model(). With
+    as_array the counts are returned as a histogram array (see
+    src.counts_array) instead of a dict.
+    """
+    # Create simulator with minimal noise
+    with span('noise_model'):
+        noise_model = resolve_noise_model(noise)
+        backend = AerSimulator(noise_model=noise_model)
+    with span('build_circuit'):
+        full_circuit = _build_full_circuit(error_qubit, error_type, initial_state)
+        transpiled = _build_transpiled_circuit(backend, error_qubit, error_type, initial_state)
+
+    # Run the pre-transpiled equivalent of full_circuit with the noise model
+    # (served from the result cache when this exact job has run before)
+    counts = run_counts(backend, [transpiled], shots=shots, seed_simulator=seed_simulator)[0]
     
-    # Calculate and print success rate
-    total = sum(counts.values())
-    expected_state = initial_state
-    success = counts.get(expected_state, 0)
-    success_rate = (success / total) * 100
+    # Calculate and report success rate
+    with span('postprocess'):
+        total = sum(counts.values())
+        expected_state = initial_state
+        success = counts.get(expected_state, 0)
+        success_rate = (success / total) * 100
     
-    print(f"Initial state: |{initial_state}⟩")
-    print(f"Error type: {error_type}")
-    print(f"Counts: {counts}")
-    print(f"Success rate: {success_rate:.1f}% (preservation of |{initial_state}⟩ state)")
+    logger.info("Initial state: |%s⟩", initial_state)
+    logger.info("Error type: %s", error_type)
+    logger.info("Counts: %s", counts)
+    logger.info("Success rate: %.1f%% (preservation of |%s⟩ state)", success_rate, initial_state)
     
+    if as_array:
+        return full_circuit, counts_to_array(counts, full_circuit.num_clbits)
     return full_circuit, counts
+
+def sweep_configs(error_qubits=range(9), error_types=('none', 'bit', 'phase', 'both'),
+                  initial_states=('0', '1')):
+    """Return the full grid of sweep configurations as a list of dicts.
+
+    Every (error_qubit, error_type, initial_state) combination is included,
+    so the default is the 9 qubits x 4 error types x 2 initial states grid.
+    """
+    return [
+        {'error_qubit': q, 'error_type': et, 'initial_state': s}
+        for s in initial_states
+        for et in error_types
+        for q in error_qubits
+    ]
+
+def _run_sweep_chunk(task):
+    """Run one chunk of sweep rows as a single multi-experiment Aer job."""
+    rows, shots, seed_simulator, noise = task
+    with span('noise_model'):
+        noise_model = resolve_noise_model(noise)
+        backend = AerSimulator(noise_model=noise_model)
+    circuits = []
+    with span('build_circuit'):
+        for i, row in enumerate(rows):
+            circuit = _build_transpiled_circuit(
+                backend, row['error_qubit'], row['error_type'], row['initial_state'])
+            circuit.name = f"shor_{i}_{row['error_type']}_q{row['error_qubit']}_{row['initial_state']}"
+            circuits.append(circuit)
+
+    results = run_counts(backend, circuits, shots=shots, seed_simulator=seed_simulator)
+
+    with span('postprocess'):
+        for row, counts in zip(rows, results):
+            total = sum(counts.values())
+            row['counts'] = counts
+            row['success_rate'] = (counts.get(row['initial_state'], 0) / total) * 100
+    return rows
+
+def simulate_sweep(configs, shots=8192, seed_simulator=None, workers=1, chunksize=None,
+                   store=None, noise=None):
+    """Simulate many error configurations as batched multi-experiment Aer jobs.
+
+    configs is an iterable of dicts with any of the keys error_qubit,
+    error_type and initial_state (missing keys take simulate_shors_code's
+    defaults), or of (error_qubit, error_type, initial_state) tuples.
+    Configs are split into chunks of chunksize; each chunk builds the noise
+    model and backend once and sends all of its circuits, assembled from the
+    cached pre-transpiled blocks, to Aer in one run() call. chunksize=None
+    puts every config in one chunk (a single Aer job); pass a chunksize to
+    spread the chunks over workers or checkpoint more often to a store.
+    Chunks run serially, or across a process pool when workers is not 1
+    (None for one worker per core). The chunk layout never depends on
+    workers and each chunk is seeded with task_seed(seed_simulator, chunk
+    index), so seeded sweeps give the same counts for any worker count.
+    noise selects the noise model as in resolve_noise_model(); pass a dict
+    of create_noise_model() parameters rather than a NoiseModel when
+    workers is not 1, so each worker builds (and memoizes) its own.
+
+    store, a directory path or ResultStore, makes the sweep resumable: each
+    chunk's rows are appended to it as soon as the chunk finishes, and
+    chunks already in the store are not simulated again. Resuming keeps the
+    chunk seeds, so a seeded sweep gives the same rows whether or not it
+    was interrupted.
+
+    Returns a list of result rows, one per config and in the same order,
+    each a dict with the config keys plus 'counts' and 'success_rate'
+    (percentage of shots that preserved the initial state).
+    """
+    defaults = {'error_qubit': 3, 'error_type': 'both', 'initial_state': '0'}
+    rows = []
+    for config in configs:
+        if not isinstance(config, dict):
+            config = dict(zip(('error_qubit', 'error_type', 'initial_state'), config))
+        row = dict(defaults)
+        row.update(config)
+        rows.append(row)
+    if chunksize is None:
+        chunksize = max(len(rows), 1)
+
+    if isinstance(store, str):
+        params = {'configs': [dict(row) for row in rows], 'shots': shots, 'seed_simulator': seed_simulator,
+                  'chunksize': chunksize, 'noise': noise}
+        store = ResultStore(store, 'simulate_sweep', params)
+    done = store.completed_indices() if store is not None else set()
+
+    tasks = []
+    for index, start in enumerate(range(0, len(rows), chunksize)):
+        indices = range(start, min(start + chunksize, len(rows)))
+        if all(i in done for i in indices):
+            continue
+        chunk = rows[start:start + chunksize]
+        if store is not None:
+            chunk = [dict(row, index=i) for i, row in zip(indices, chunk)]
+        tasks.append((chunk, shots, task_seed(seed_simulator, index), noise))
+
+    results = []
+    for chunk in parallel_imap(_run_sweep_chunk, tasks, workers=workers):
+        if store is not None:
+            store.append(chunk)
+        results.extend(chunk)
+    if store is None:
+        return results
+    store.mark_complete()
+    return store.sorted_rows()
+
+
+# Default upper bound on the shots of one shard in simulate_sharded()
+SHARD_SHOTS = 1 << 18
+
+def shard_sizes(shots, shard_shots=SHARD_SHOTS):
+    """Split shots into near-equal shards of at most shard_shots each.
+
+    Depends only on its arguments (never on the worker count), so the shard
+    layout, and with it every shard's seed, is the same on any machine.
+    """
+    num_shards = max(1, -(-shots // shard_shots))
+    base, extra = divmod(shots, num_shards)
+    return [base + (1 if i < extra else 0) for i in range(num_shards)]
+
+def merge_counts(counts_list):
+    """Sum a sequence of counts dicts into one, e.g. the counts of every shard."""
+    merged = {}
+    for counts in counts_list:
+        for outcome, n in counts.items():
+            merged[outcome] = merged.get(outcome, 0) + n
+    return merged
+
+def _run_shot_shard(task):
+    """Run one shard of simulate_sharded() and return (counts, outcomes or None).
+
+    Per-shot outcomes come back as an integer array (memory_to_array()),
+    which is far cheaper to send back from a worker than Aer's strings.
+    """
+    error_qubit, error_type, initial_state, shots, seed, noise, threads, memory = task
+    with span('noise_model'):
+        backend = AerSimulator(noise_model=resolve_noise_model(noise),
+                               max_parallel_threads=threads)
+    with span('build_circuit'):
+        circuit = _build_transpiled_circuit(backend, error_qubit, error_type, initial_state)
+    if not memory:
+        return run_counts(backend, [circuit], shots=shots, seed_simulator=seed)[0], None
+    # Per-shot memory is not kept in the result cache, so run directly
+    with span('execute'):
+        result = backend.run(circuit, shots=shots, seed_simulator=seed, memory=True).result()
+    count('shots_executed', shots)
+    return dict(result.get_counts(0)), memory_to_array(result.get_memory(0), circuit.num_clbits)
+
+def simulate_sharded(error_qubit=3, error_type='both', initial_state='0', shots=10**7,
+                     noise=None, seed_simulator=None, workers=None, shard_shots=SHARD_SHOTS,
+                     memory=False, as_array=False, memory_path=None):
+    """Run a large shot budget of simulate_shors_code()'s circuit as parallel shards.
+
+    shots is split by shard_sizes() and the shards run across a process
+    pool of workers processes (None for one per core), shard i seeded with
+    task_seed(seed_simulator, i). In an unseeded run every shard is
+    unseeded too, so Aer draws each one a fresh seed and none of them is
+    written to the result cache. Each worker's Aer is limited to its
+    share of the cores (cpu_count // workers threads), so the shards do not
+    oversubscribe the machine. noise is as in resolve_noise_model(); pass a
+    dict rather than a NoiseModel when workers is not 1.
+
+    Returns (full_circuit, counts) in simulate_shors_code()'s format, with
+    the counts of all shards merged. With memory=True the per-shot
+    outcomes, concatenated in shard order, are returned as a third element.
+
+    as_array returns the counts as a histogram array and the outcomes as an
+    integer array (see src.counts_array) rather than a dict and bitstrings.
+    memory_path (implies memory=True) streams the outcomes shard by shard
+    into a memory-mapped .npy file there, which is returned in their place,
+    so tens of millions of shots never sit in memory at once.
+    """
+    memory = memory or memory_path is not None
+    workers = resolve_workers(workers)
+    threads = 0 if workers == 1 else max(1, (os.cpu_count() or 1) // workers)
+    tasks = [(error_qubit, error_type, initial_state, shard, task_seed(seed_simulator, i),
+              noise, threads, memory)
+             for i, shard in enumerate(shard_sizes(shots, shard_shots))]
+    logger.info("Running %d shots as %d shards on %d workers", shots, len(tasks), workers)
+
+    full_circuit = _build_full_circuit(error_qubit, error_type, initial_state)
+    num_bits = full_circuit.num_clbits
+    counts = {}
+    if memory_path is not None:
+        outcomes = open_memory_file(memory_path, shots, num_bits)
+    elif memory:
+        outcomes = np.empty(shots, dtype=outcome_dtype(num_bits))
+    offset = 0
+    for shard_counts, shard_outcomes in parallel_imap(_run_shot_shard, tasks, workers=workers):
+        with span('postprocess'):
+            counts = merge_counts([counts, shard_counts])
+            if memory:
+                outcomes[offset:offset + len(shard_outcomes)] = shard_outcomes
+                offset += len(shard_outcomes)
+    if memory_path is not None:
+        outcomes.flush()
+
+    if as_array:
+        counts = counts_to_array(counts, num_bits)
+    if not memory:
+        return full_circuit, counts
+    if not (as_array or memory_path is not None):
+        outcomes = array_to_memory(outcomes, num_bits)
+    return full_circuit, counts, outcomes
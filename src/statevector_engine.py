@@ -0,0 +1,116 @@
+import functools
+import numpy as np
+import sys
+from os.path import dirname, abspath
+
+from qiskit.quantum_info import Operator, Statevector
+
+# Add the project root directory to Python path
+sys.path.append(dirname(dirname(abspath(__file__))))
+
+from src.circuit_cache import get_template
+
+NUM_QUBITS = 9
+DIM = 2 ** NUM_QUBITS
+
+
+@functools.lru_cache(maxsize=None)
+def block_unitary(name):
+    """Return the 512x512 unitary of the 'encode' or 'decode' block, computed once per process.
+
+    Uses qiskit's little-endian ordering, so qubit q is bit q of the
+    amplitude index. The returned array is shared: do not modify it.
+    """
+    unitary = Operator(get_template(name)).data
+    unitary.setflags(write=False)
+    return unitary
+
+
+def prepare_state(initial_state='0'):
+    """9-qubit input statevector with qubit 0 set as the simulation circuits set it
+    (X for '1', nothing otherwise) and the other 8 qubits in |0>.
+
+    initial_state '+' puts qubit 0 in |+>, which exposes logical phase
+    errors that the computational-basis states cannot see.
+    """
+    state = np.zeros(DIM, dtype=complex)
+    if initial_state == '+':
+        state[:2] = 1 / np.sqrt(2)
+    elif initial_state in ('0', '1'):
+        state[int(initial_state)] = 1
+    else:
+        raise ValueError(f"Unknown initial state '{initial_state}', expected '0', '1' or '+'")
+    return state
+
+
+def apply_pauli_errors(states, errors):
+    """Apply one Pauli error pattern to each row of a batch of statevectors.
+
+    states has shape (batch, 512) or (512,), in which case it is broadcast
+    to every pattern. errors holds one pattern per row: a list of
+    (qubit, error_type) pairs with error_type 'none', 'bit', 'phase' or
+    'both', applied like introduce_error() (X, then Z for 'both'). A single
+    (qubit, error_type) pair is accepted in place of a one-element list.
+
+    X is an index permutation and Z a sign flip, so no operator matrices
+    are built. Patterns that apply several Paulis to one qubit are equal to
+    the product up to a global phase, which does not change any fidelity.
+    Returns a new (len(errors), 512) array.
+    """
+    states = np.asarray(states, dtype=complex)
+    if states.ndim == 1:
+        states = np.broadcast_to(states, (len(errors), DIM))
+    indices = np.arange(DIM)
+    out = np.empty((len(errors), DIM), dtype=complex)
+    for row, pattern in enumerate(errors):
+        if pattern and not isinstance(pattern[0], (list, tuple)):
+            pattern = [pattern]
+        x_mask = 0
+        z_mask = 0
+        for qubit, error_type in pattern:
+            if error_type in ('bit', 'both'):
+                x_mask ^= 1 << qubit
+            if error_type in ('phase', 'both'):
+                z_mask ^= 1 << qubit
+        parity = np.zeros(DIM, dtype=int)
+        for qubit in range(NUM_QUBITS):
+            if z_mask >> qubit & 1:
+                parity ^= (indices >> qubit) & 1
+        out[row] = states[row][indices ^ x_mask] * (1 - 2 * parity)
+    return out
+
+
+def qubit0_reduced_states(states):
+    """Reduced density matrices of qubit 0 for a batch of 9-qubit statevectors.
+
+    Qubit 0 is the fastest-varying index, so reshaping each statevector to
+    (256, 2) puts the other 8 qubits on the first axis and tracing them out
+    is a single contraction. Returns an array of shape (batch, 2, 2).
+    """
+    amplitudes = np.asarray(states).reshape(-1, DIM // 2, 2)
+    return np.einsum('bri,brj->bij', amplitudes, amplitudes.conj())
+
+
+def decode_error_batch(errors, initial_state='0'):
+    """Encode |initial_state>, apply each error pattern and decode, exactly.
+
+    The encoded state is computed once; the decoder is applied to the whole
+    batch of errored states as one matrix multiply. Returns the decoded
+    (len(errors), 512) statevectors.
+    """
+    encoded = block_unitary('encode') @ prepare_state(initial_state)
+    errored = apply_pauli_errors(encoded, errors)
+    return errored @ block_unitary('decode').T
+
+
+def recovery_fidelities(errors, initial_state='0'):
+    """Fidelity of the recovered qubit 0 with |initial_state> for each error pattern.
+
+    Equivalent to building _build_error_circuit() for every pattern and
+    comparing partial_trace() of its statevector against
+    DensityMatrix.from_label(initial_state), but vectorized over the batch.
+    Returns a 1-D array with one fidelity per pattern.
+    """
+    reduced = qubit0_reduced_states(decode_error_batch(errors, initial_state))
+    expected = Statevector.from_label(initial_state).data
+    return np.einsum('i,bij,j->b', expected.conj(), reduced, expected).real
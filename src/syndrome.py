@@ -0,0 +1,129 @@
+from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
+import sys
+from os.path import dirname, abspath
+
+# Add the project root directory to Python path
+sys.path.append(dirname(dirname(abspath(__file__))))
+
+from src.circuit_cache import get_template
+from src.simulate import introduce_error, resolve_noise_model
+from src.result_cache import run_counts
+
+# Z-type stabilizers: neighbouring pairs within each 3-qubit block
+Z_STABILIZERS = [(0, 1), (1, 2), (3, 4), (4, 5), (6, 7), (7, 8)]
+# X-type stabilizers: X on two neighbouring blocks
+X_STABILIZERS = [(0, 1, 2, 3, 4, 5), (3, 4, 5, 6, 7, 8)]
+NUM_SYNDROME = len(Z_STABILIZERS) + len(X_STABILIZERS)
+
+# Block hit by a phase flip, from the two X-type syndrome bits
+_PHASE_FLIP_BLOCK = {(1, 0): 0, (1, 1): 1, (0, 1): 2}
+
+
+def append_syndrome_round(qc, clbits, reset=False):
+    """Append one round of stabilizer measurements to a circuit whose qubits
+    0-8 are data and 9-16 ancillas, measuring the ancillas into clbits.
+
+    With reset, the ancillas are reset afterwards so the next round can
+    reuse them.
+    """
+    ancillas = list(range(9, 9 + NUM_SYNDROME))
+    # Z-type stabilizers: parity of two data qubits copied onto an ancilla
+    for i, (a, b) in enumerate(Z_STABILIZERS):
+        qc.cx(a, 9 + i)
+        qc.cx(b, 9 + i)
+    # X-type stabilizers: ancilla in |+> controls X on six data qubits
+    for j, qubits in enumerate(X_STABILIZERS):
+        ancilla = 9 + len(Z_STABILIZERS) + j
+        qc.h(ancilla)
+        for q in qubits:
+            qc.cx(ancilla, q)
+        qc.h(ancilla)
+    qc.measure(ancillas, clbits)
+    if reset:
+        qc.reset(ancillas)
+
+
+def build_syndrome_circuit(error_qubit=3, error_type='both', initial_state='0'):
+    """Encode, inject an error, measure all eight stabilizers with ancillas,
+    then read every data qubit out in the X basis.
+
+    Everything is Clifford (no Toffolis), so the circuit runs on
+    AerSimulator(method='stabilizer'). Qubits 0-8 are the data qubits and
+    9-16 the ancillas; classical register 'syndrome' holds the six Z-type
+    then two X-type stabilizer outcomes and 'readout' the data qubits.
+
+    Corrections are applied afterwards in software by decode_outcome(),
+    not with classically controlled gates.
+    """
+    data = QuantumRegister(9, 'q')
+    ancillas = QuantumRegister(NUM_SYNDROME, 'a')
+    syndrome = ClassicalRegister(NUM_SYNDROME, 'syndrome')
+    readout = ClassicalRegister(9, 'readout')
+    qc = QuantumCircuit(data, ancillas, syndrome, readout)
+
+    if initial_state == '1':
+        qc.x(0)
+    qc.compose(get_template('encode'), qubits=list(range(9)), inplace=True)
+    qc.barrier()
+
+    if error_type != 'none':
+        introduce_error(qc, error_qubit, error_type)
+    qc.barrier()
+
+    append_syndrome_round(qc, syndrome)
+    qc.barrier()
+
+    # Logical Z of this code is X on all nine qubits, so read out in the X basis
+    qc.h(data)
+    qc.measure(data, readout)
+    return qc
+
+
+def split_outcome(key):
+    """Split a counts key of build_syndrome_circuit() into
+    (readout bits, syndrome bits), each a list indexed by qubit/stabilizer."""
+    readout, syndrome = key.split()
+    return [int(b) for b in reversed(readout)], [int(b) for b in reversed(syndrome)]
+
+
+def decode_outcome(readout, syndrome):
+    """Logical measurement result ('0' or '1') of one shot, after correction.
+
+    Each block's X-basis parity is one copy of the logical value. The two
+    X-type syndrome bits locate a phase flip to one block, whose parity is
+    flipped back, and the corrected copies are combined by majority vote.
+    Bit flips commute with this readout, so the Z-type syndrome bits (which
+    locate them) do not change the logical result.
+    """
+    parities = [readout[3 * k] ^ readout[3 * k + 1] ^ readout[3 * k + 2] for k in range(3)]
+    block = _PHASE_FLIP_BLOCK.get((syndrome[6], syndrome[7]))
+    if block is not None:
+        parities[block] ^= 1
+    return '1' if sum(parities) >= 2 else '0'
+
+
+def decode_syndrome_counts(counts):
+    """Aer counts of build_syndrome_circuit() -> corrected logical counts."""
+    logical = {}
+    for key, count in counts.items():
+        bit = decode_outcome(*split_outcome(key))
+        logical[bit] = logical.get(bit, 0) + count
+    return logical
+
+
+def simulate_syndrome_code(error_qubit=3, error_type='both', initial_state='0', shots=8192,
+                           noise=None, seed_simulator=None, raw=False):
+    """Measurement-based counterpart of simulate_shors_code() on the stabilizer method.
+
+    noise is resolved as in simulate_shors_code(); it must be Pauli (the
+    default depolarizing and readout errors are, thermal relaxation is not)
+    for the stabilizer method to accept it. Returns logical counts in the
+    same {'0': n, '1': m} format as simulate_shors_code(), or the raw
+    syndrome-and-readout counts when raw is True.
+    """
+    from qiskit_aer import AerSimulator
+
+    backend = AerSimulator(method='stabilizer', noise_model=resolve_noise_model(noise))
+    circuit = build_syndrome_circuit(error_qubit, error_type, initial_state)
+    counts = run_counts(backend, [circuit], shots=shots, seed_simulator=seed_simulator)[0]
+    return counts if raw else decode_syndrome_counts(counts)
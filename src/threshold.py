@@ -0,0 +1,177 @@
+import numpy as np
+from scipy.stats import beta
+import sys
+from os.path import dirname, abspath
+
+# Add the project root directory to Python path
+sys.path.append(dirname(dirname(abspath(__file__))))
+
+from src.parallel import parallel_imap, task_seed
+from src.results_store import ResultStore
+
+ENGINES = ('aer', 'pauli_frame')
+
+
+def clopper_pearson(failures, shots, confidence=0.95):
+    """Exact (Clopper-Pearson) confidence interval for a binomial failure rate.
+
+    Returns (low, high). Conservative, and still valid when failures is 0
+    or equal to shots, which is common at low physical error rates.
+    """
+    alpha = 1 - confidence
+    low = beta.ppf(alpha / 2, failures, shots - failures + 1) if failures > 0 else 0.0
+    high = beta.ppf(1 - alpha / 2, failures + 1, shots - failures) if failures < shots else 1.0
+    return float(low), float(high)
+
+
+def sample_failures(p1, p2, shots, seed=None, engine='aer',
+                    error_qubit=3, error_type='none', initial_state='0', noise=None):
+    """Run shots of the Shor code circuit at error rates p1/p2 and count logical failures.
+
+    engine='aer' runs the pre-transpiled circuit on AerSimulator with
+    create_noise_model(p1, p2); engine='pauli_frame' uses the much faster
+    sampler in src.pauli_frame (noiseless Toffolis, see its docstring).
+    noise is a dict of extra create_noise_model() parameters (readout, t1,
+    t2, gate times) for the Aer engine; the Pauli-frame engine only models
+    depolarizing noise and rejects it.
+    A failure is a shot that does not read back initial_state.
+    """
+    if engine == 'aer':
+        from qiskit_aer import AerSimulator
+        from src.simulate import create_noise_model, _build_transpiled_circuit
+        from src.result_cache import run_counts
+        backend = AerSimulator(noise_model=create_noise_model(p1, p2, **(noise or {})))
+        circuit = _build_transpiled_circuit(backend, error_qubit, error_type, initial_state)
+        counts = run_counts(backend, [circuit], shots=shots, seed_simulator=seed)[0]
+    elif engine == 'pauli_frame':
+        if noise:
+            raise ValueError("The pauli_frame engine only supports depolarizing p1/p2 noise")
+        from src.pauli_frame import sample_shors_code
+        counts = sample_shors_code(error_qubit, error_type, initial_state,
+                                   shots=shots, p1=p1, p2=p2, seed=seed)
+    else:
+        raise ValueError(f"Unknown engine '{engine}', expected one of {ENGINES}")
+    return shots - counts.get(initial_state, 0)
+
+
+def estimate_logical_error_rate(p1, p2, physical_rate=None, relative_width=0.2,
+                                target_width=None, initial_shots=1024, max_shots=1 << 20,
+                                confidence=0.95, seed=None, engine='aer', **circuit_kwargs):
+    """Estimate the logical error rate at one (p1, p2) point with adaptive shots.
+
+    Starts with initial_shots and doubles the total each round until one of:
+      - the confidence interval is narrower than relative_width times the
+        estimate (or than target_width, an absolute width, if given);
+      - physical_rate is given and lies outside the interval, i.e. it is
+        already resolved whether encoding helps or hurts at this point;
+      - max_shots have been spent.
+    Round r is seeded with task_seed(seed, r), so seeded runs are reproducible.
+    circuit_kwargs (error_qubit, error_type, initial_state, noise) go to
+    sample_failures().
+
+    Returns a dict with p1, p2, shots, failures, logical_error_rate, ci_low,
+    ci_high, rounds and stop_reason ('width', 'resolved' or 'max_shots').
+    """
+    shots = 0
+    failures = 0
+    rounds = 0
+    batch = min(initial_shots, max_shots)
+    while True:
+        failures += sample_failures(p1, p2, batch, seed=task_seed(seed, rounds),
+                                    engine=engine, **circuit_kwargs)
+        shots += batch
+        rounds += 1
+        rate = failures / shots
+        low, high = clopper_pearson(failures, shots, confidence)
+
+        if target_width is not None and high - low <= target_width:
+            stop_reason = 'width'
+        elif target_width is None and failures > 0 and high - low <= relative_width * rate:
+            stop_reason = 'width'
+        elif physical_rate is not None and not low <= physical_rate <= high:
+            stop_reason = 'resolved'
+        elif shots >= max_shots:
+            stop_reason = 'max_shots'
+        else:
+            batch = min(shots, max_shots - shots)
+            continue
+
+        return {'p1': p1, 'p2': p2, 'shots': shots, 'failures': failures,
+                'logical_error_rate': rate, 'ci_low': low, 'ci_high': high,
+                'rounds': rounds, 'stop_reason': stop_reason}
+
+
+def _threshold_point(task):
+    """Adaptive estimate for one point of a threshold sweep."""
+    index, physical_rate, p2, stop_when_resolved, kwargs = task
+    row = estimate_logical_error_rate(
+        physical_rate, p2, physical_rate=physical_rate if stop_when_resolved else None, **kwargs)
+    row['physical_rate'] = physical_rate
+    row['index'] = index
+    return row
+
+
+def threshold_sweep(physical_rates, p2_ratio=10.0, stop_when_resolved=True,
+                    workers=1, seed=None, store=None, **kwargs):
+    """Logical-vs-physical error rate curve over a grid of physical error rates.
+
+    Each physical rate p is simulated at p1 = p and p2 = p2_ratio * p (the
+    default keeps create_noise_model()'s 1:10 ratio) and compared against p,
+    the failure rate of an unencoded qubit. With stop_when_resolved, points
+    stop as soon as their interval excludes p, so shots are only spent near
+    the pseudo-threshold. Points run through parallel_map over workers
+    processes, point i seeded with task_seed(seed, i); the remaining kwargs
+    go to estimate_logical_error_rate().
+
+    store, a directory path or ResultStore, streams each finished point to
+    disk and skips points already stored there, as in simulate_sweep().
+
+    Returns one row per rate, in order, as estimate_logical_error_rate()
+    rows plus 'physical_rate'.
+    """
+    physical_rates = list(physical_rates)
+    if isinstance(store, str):
+        params = dict(kwargs, physical_rates=physical_rates, p2_ratio=p2_ratio,
+                      stop_when_resolved=stop_when_resolved, seed=seed)
+        store = ResultStore(store, 'threshold_sweep', params)
+    done = store.completed_indices() if store is not None else set()
+
+    tasks = []
+    for index, p in enumerate(physical_rates):
+        if index in done:
+            continue
+        point_kwargs = dict(kwargs, seed=task_seed(seed, index))
+        tasks.append((index, p, p2_ratio * p, stop_when_resolved, point_kwargs))
+
+    rows = []
+    for row in parallel_imap(_threshold_point, tasks, workers=workers):
+        if store is not None:
+            store.append([row])
+        rows.append(row)
+    if store is not None:
+        store.mark_complete()
+        return store.sorted_rows()
+    return [{k: v for k, v in row.items() if k != 'index'} for row in rows]
+
+
+def pseudo_threshold(rows):
+    """Physical rate where the logical error rate crosses it, from threshold_sweep() rows.
+
+    Interpolates linearly in log-log space between the first pair of
+    neighbouring points (sorted by physical rate) where logical minus
+    physical changes sign, or linearly when the lower point saw no
+    failures. Returns None if the curve never crosses.
+    """
+    rows = sorted(rows, key=lambda row: row['physical_rate'])
+    for below, above in zip(rows, rows[1:]):
+        gap_below = below['logical_error_rate'] - below['physical_rate']
+        gap_above = above['logical_error_rate'] - above['physical_rate']
+        if gap_below <= 0 < gap_above:
+            if below['logical_error_rate'] == 0:
+                x0, x1 = below['physical_rate'], above['physical_rate']
+                return float(x0 - gap_below * (x1 - x0) / (gap_above - gap_below))
+            x0, x1 = np.log(below['physical_rate']), np.log(above['physical_rate'])
+            y0 = np.log(below['logical_error_rate']) - x0
+            y1 = np.log(above['logical_error_rate']) - x1
+            return float(np.exp(x0 - y0 * (x1 - x0) / (y1 - y0)))
+    return None
@@ -1,13 +1,30 @@
 import os
 import shutil
-import matplotlib.pyplot as plt
-import matplotlib
-matplotlib.use('Agg')  # Force matplotlib to not use X11
 from datetime import datetime
 import numpy as np
 from qiskit import QuantumCircuit
 from qiskit.quantum_info import Statevector, DensityMatrix, partial_trace, state_fidelity
-from qiskit.visualization import plot_histogram
+import sys
+from os.path import dirname, abspath
+
+# Add the project root directory to Python path
+sys.path.append(dirname(dirname(abspath(__file__))))
+
+from src.parallel import parallel_map
+from src.result_cache import cached_statevector
+from src.instrumentation import logger
+from src.render import render, render_figures
+
+def _pyplot():
+    """Import pyplot on first use, on the non-interactive Agg backend.
+
+    Deferred so that importing this module (e.g. from the CLI's grid
+    command) does not pay for matplotlib unless something is plotted.
+    """
+    import matplotlib
+    matplotlib.use('Agg')  # Force matplotlib to not use X11
+    import matplotlib.pyplot as plt
+    return plt
 
 def setup_output_directory():
     """Setup the output directory for saving visualizations."""
@@ -18,93 +35,141 @@ def setup_output_directory():
     
     return output_dir
 
-def visualize_circuit(circuit):
-    """Generate a clear circuit diagram."""
+CIRCUIT_STYLE = {
+    'backgroundcolor': '#FFFFFF',
+    'textcolor': '#000000',
+    'fontsize': 14,
+    'subfontsize': 12,
+    'showindex': True,
+    'margin': [2.0, 0.2, 0.2, 0.3],
+    'displaytext': {
+        "CNOT": "⊕",
+        "x": "E",    
+        "z": "E",    
+        "H": "H", 
+        "CCX": "T"
+    },
+    'displaycolor': {
+        'x': '#FF0000',   
+        'z': '#FF0000',   
+        'H': '#000000',
+        'CNOT': '#000000',
+        'CCX': '#000000'
+    }
+}
+
+def _draw_circuit(fig, circuit):
+    """Circuit diagram; the mpl drawer sizes its own figure to the circuit."""
+    _pyplot()
+    return circuit.draw(output='mpl', style=CIRCUIT_STYLE, plot_barriers=True, initial_state=True)
+
+def visualize_circuit(circuit, force=False):
+    """Generate a clear circuit diagram.
+
+    Skipped when examples/shor_circuit.png was already drawn from the same
+    circuit (see src.render); pass force=True to redraw anyway.
+    """
     output_dir = setup_output_directory()
     
     try:
         image_file = f"{output_dir}/shor_circuit.png"
-        circuit.draw(
-            output='mpl',
-            filename=image_file,
-            style={
-                'backgroundcolor': '#FFFFFF',
-                'textcolor': '#000000',
-                'fontsize': 14,
-                'subfontsize': 12,
-                'showindex': True,
-                'margin': [2.0, 0.2, 0.2, 0.3],
-                'displaytext': {
-                    "CNOT": "⊕",
-                    "x": "E",    
-                    "z": "E",    
-                    "H": "H", 
-                    "CCX": "T"
-                },
-                'displaycolor': {
-                    'x': '#FF0000',   
-                    'z': '#FF0000',   
-                    'H': '#000000',
-                    'CNOT': '#000000',
-                    'CCX': '#000000'
-                }
-            },
-            plot_barriers=True,
-            initial_state=True
-        )
-        
-        print(f"Circuit saved to: {image_file}")
+        if render(image_file, _draw_circuit, circuit, figsize=None, dpi=150, force=force):
+            logger.info("Circuit saved to: %s", image_file)
+        else:
+            logger.info("Circuit unchanged: %s", image_file)
         
     except Exception as e:
-        print(f"Error saving circuit: {str(e)}")
+        logger.error("Error saving circuit: %s", e)
+
+def _draw_histogram(fig, data):
+    """Counts histogram with its success rate (data: counts, title, expected)."""
+    from qiskit.visualization import plot_histogram
+
+    counts = data['counts']
+    total_shots = sum(counts.values())
+    expected = data.get('expected', '0')
+    success_rate = (counts.get(expected, 0) / total_shots) * 100
+    plot_histogram(
+        counts,
+        title=f"{data['title']}\nSuccess Rate: {success_rate:.1f}% (|{expected}⟩ state)",
+        bar_labels=True,
+        ax=fig.subplots()
+    )
 
-def visualize_results(counts):
-    """Generate results visualization."""
+def _draw_histogram_array(fig, data):
+    """Bar chart of the non-zero bins of a histogram array (see src.counts_array)."""
+    from src.counts_array import success_rate
+
+    hist, num_bits = data['hist'], data['num_bits']
+    expected = data.get('expected', '0')
+    outcomes = np.flatnonzero(hist)
+    ax = fig.subplots()
+    bars = ax.bar(range(len(outcomes)), hist[outcomes] / hist.sum())
+    ax.bar_label(bars, labels=[f"{hist[i] / hist.sum():.3f}" for i in outcomes])
+    ax.set_xticks(range(len(outcomes)))
+    ax.set_xticklabels([format(int(i), f'0{num_bits}b') for i in outcomes])
+    ax.set_ylabel('Quasi-probability')
+    ax.set_title(f"{data['title']}\nSuccess Rate: {success_rate(hist, expected):.1f}% "
+                 f"(|{expected}⟩ state)")
+
+def visualize_results(counts, force=False):
+    """Generate results visualization.
+
+    counts is a counts dict or a histogram array (simulate_shors_code(...,
+    as_array=True)); an array is plotted straight from its bins, without
+    building a dict. Skipped when examples/results.png already shows the
+    same counts.
+    """
     output_dir = setup_output_directory()
     
     try:
-        plt.figure(figsize=(12, 6))
-        
-        total_shots = sum(counts.values())
-        success_rate = (counts.get('0', 0) / total_shots) * 100
-        
-        plot_histogram(
-            counts,
-            title=f"Shor's Code Results\nSuccess Rate: {success_rate:.1f}% (|0⟩ state)",
-            bar_labels=True
-        )
-        
         filepath = os.path.join(output_dir, 'results.png')
-        plt.savefig(filepath, bbox_inches='tight', dpi=300)
-        plt.close()
-        
-        print(f"Results saved to: {filepath}")
+        if isinstance(counts, np.ndarray):
+            draw = _draw_histogram_array
+            data = {'hist': counts, 'num_bits': int(np.log2(len(counts))),
+                    'title': "Shor's Code Results"}
+        else:
+            draw = _draw_histogram
+            data = {'counts': counts, 'title': "Shor's Code Results"}
+        if render(filepath, draw, data, figsize=(12, 6), dpi=300, force=force):
+            logger.info("Results saved to: %s", filepath)
+        else:
+            logger.info("Results unchanged: %s", filepath)
         
     except Exception as e:
-        print(f"Error saving results: {str(e)}")
+        logger.error("Error saving results: %s", e)
 
-def visualize_error_correction_performance(error_types=['bit', 'phase', 'both']):
-    """Visualize the performance of error correction for different error types."""
-    from src.simulate import simulate_shors_code
+def visualize_error_correction_performance(error_types=['bit', 'phase', 'both'], workers=1, seed=None):
+    """Visualize the performance of error correction for different error types.
+
+    Each error type is simulated as its own task, in parallel across workers
+    processes when workers is not 1; pass seed for reproducible counts.
+    """
+    from src.simulate import simulate_sweep
+    from qiskit.visualization import plot_histogram
+    plt = _pyplot()
     
     plt.figure(figsize=(12, 6))
     
     results = {}
     success_rates = []
     
-    for error_type in error_types:
-        _, counts = simulate_shors_code(
-            error_type=error_type,
-            error_qubit=4,
-            initial_state='0'  
-        )
+    rows = simulate_sweep(
+        [{'error_type': error_type, 'error_qubit': 4, 'initial_state': '0'}
+         for error_type in error_types],
+        seed_simulator=seed,
+        workers=workers,
+        chunksize=1
+    )
+    for error_type, row in zip(error_types, rows):
+        counts = row['counts']
         results[f'{error_type}'] = counts
         
         total = sum(counts.values())
         success = counts.get('0', 0)  
         success_rate = (success / total) * 100
         
-        print(f"{error_type}: {success}/{total} counts are |0⟩ = {success_rate:.1f}%")
+        logger.info("%s: %d/%d counts are |0⟩ = %.1f%%", error_type, success, total, success_rate)
         success_rates.append(f'{success_rate:.1f}%')
 
     title = "Shor Code Error Correction Results\n" + \
@@ -147,7 +212,16 @@ def _build_error_circuit(error_type, error_qubit, initial_state='0'):
     return qc
 
 
-def compute_per_qubit_error_grid(initial_state='0'):
+def _grid_fidelity(task):
+    """Recovery fidelity of qubit 0 for one (qubit, error type, initial state) task."""
+    qubit_idx, error_type, initial_state = task
+    qc = _build_error_circuit(error_type, qubit_idx, initial_state=initial_state)
+    full_state = Statevector(cached_statevector(qc))
+    reduced = partial_trace(full_state, [q for q in range(9) if q != 0])
+    return state_fidelity(DensityMatrix.from_label(initial_state), reduced)
+
+
+def compute_per_qubit_error_grid(initial_state='0', workers=1, chunksize=3, engine='unitary'):
     """Compute recovery fidelity for a single-qubit error on each of the 9
     physical qubits, for each of 3 error types (bit-flip, phase-flip, both),
     using the ideal noiseless case.
@@ -170,52 +244,42 @@ def compute_per_qubit_error_grid(initial_state='0'):
       6. Computes fidelity of that reduced state against the expected pure
          logical state |{initial_state}> via qiskit.quantum_info.state_fidelity.
 
+    With engine='unitary' (the default) the same quantities are computed by
+    src.statevector_engine in one vectorized call: the encode and decode
+    blocks are turned into 512x512 unitaries once, all 27 errored states are
+    decoded in a single matrix multiply and qubit 0's reduced state is read
+    off the reshaped amplitudes. engine='circuit' runs the steps above case
+    by case; the 27 cases are independent, so with workers other than 1
+    they are spread over a process pool (None for one worker per core),
+    chunksize cases per task. The grid is filled in the same order either way.
+
     Returns a (9, 3) numpy array of fidelities, rows = physical qubit index
     0-8, columns = ['bit', 'phase', 'both'].
     """
     error_types = ['bit', 'phase', 'both']
-    expected_logical = DensityMatrix.from_label(initial_state)
-
-    grid = np.zeros((9, len(error_types)))
-    for qubit_idx in range(9):
-        for col, error_type in enumerate(error_types):
-            qc = _build_error_circuit(error_type, qubit_idx, initial_state=initial_state)
-            full_state = Statevector.from_instruction(qc)
-            reduced = partial_trace(full_state, [q for q in range(9) if q != 0])
-            grid[qubit_idx, col] = state_fidelity(expected_logical, reduced)
-
+    if engine == 'unitary':
+        from src.statevector_engine import recovery_fidelities
+        errors = [(qubit_idx, error_type)
+                  for qubit_idx in range(9) for error_type in error_types]
+        fidelities = recovery_fidelities(errors, initial_state=initial_state)
+    elif engine == 'circuit':
+        tasks = [(qubit_idx, error_type, initial_state)
+                 for qubit_idx in range(9) for error_type in error_types]
+        fidelities = parallel_map(_grid_fidelity, tasks, workers=workers, chunksize=chunksize)
+    else:
+        raise ValueError(f"Unknown engine '{engine}', expected 'unitary' or 'circuit'")
+
+    grid = np.array(fidelities).reshape(9, len(error_types))
     return grid, error_types
 
 
-def generate_per_qubit_error_grid(initial_state='0'):
-    """Generate and save the per-qubit, per-error-type recovery fidelity heatmap.
+ERROR_LABELS = {'bit': 'bit-flip (X)', 'phase': 'phase-flip (Z)', 'both': 'combined (X+Z)'}
 
-    Ideal (noiseless) case only: for each of the 9 physical qubits and each of
-    3 single-qubit error types, encodes logical |{initial_state}>, injects the
-    error on that one physical qubit, decodes, and measures how faithfully the
-    logical qubit (qubit 0) is recovered. Saved to
-    examples/per_qubit_error_correction.png at 200 dpi.
-    """
-    output_dir = setup_output_directory()
-    grid, error_types = compute_per_qubit_error_grid(initial_state=initial_state)
-
-    fidelity_min = grid.min()
-    fidelity_max = grid.max()
-    fidelity_mean = grid.mean()
 
-    print("Per-qubit, per-error-type recovery fidelity (ideal, noiseless, "
-          f"logical |{initial_state}>):")
-    label_map = {'bit': 'bit-flip (X)', 'phase': 'phase-flip (Z)', 'both': 'combined (X+Z)'}
-    for qubit_idx in range(9):
-        row = "  ".join(
-            f"{label_map[et]}={grid[qubit_idx, col]*100:.2f}%"
-            for col, et in enumerate(error_types)
-        )
-        print(f"  qubit {qubit_idx}: {row}")
-    print(f"Average fidelity: {fidelity_mean*100:.4f}%  "
-          f"Min: {fidelity_min*100:.4f}%  Max: {fidelity_max*100:.4f}%")
-
-    fig, ax = plt.subplots(figsize=(10, 4.5))
+def _draw_error_grid(fig, data):
+    """Heatmap of a (9, 3) recovery fidelity grid."""
+    grid, error_types, initial_state = data['grid'], data['error_types'], data['initial_state']
+    ax = fig.subplots()
     im = ax.imshow(grid.T, cmap='viridis', vmin=0.0, vmax=1.0, aspect='auto')
 
     ax.set_xticks(range(9))
@@ -223,7 +287,7 @@ def generate_per_qubit_error_grid(initial_state='0'):
     ax.set_xlabel('Physical qubit index (0-8)')
 
     ax.set_yticks(range(len(error_types)))
-    ax.set_yticklabels([label_map[et] for et in error_types])
+    ax.set_yticklabels([ERROR_LABELS[et] for et in error_types])
     ax.set_ylabel('Injected error type')
 
     for col in range(len(error_types)):
@@ -240,21 +304,121 @@ def generate_per_qubit_error_grid(initial_state='0'):
         "Shor's Code: Per-Qubit Recovery Fidelity (Ideal, No Noise)\n"
         f"Logical |{initial_state}> recovered on qubit 0 after single-qubit error "
         f"on any of the 9 physical qubits\n"
-        f"Average: {fidelity_mean*100:.2f}%  Min: {fidelity_min*100:.2f}%  "
-        f"Max: {fidelity_max*100:.2f}%"
+        f"Average: {grid.mean()*100:.2f}%  Min: {grid.min()*100:.2f}%  "
+        f"Max: {grid.max()*100:.2f}%"
     )
-    plt.tight_layout()
+    fig.tight_layout()
 
-    filepath = os.path.join(output_dir, 'per_qubit_error_correction.png')
-    plt.savefig(filepath, bbox_inches='tight', dpi=200)
-    plt.close()
 
-    print(f"Per-qubit error correction grid saved to: {filepath}")
+def generate_per_qubit_error_grid(initial_state='0', workers=1, engine='unitary', output_dir=None,
+                                  force=False):
+    """Generate and save the per-qubit, per-error-type recovery fidelity heatmap.
+
+    Ideal (noiseless) case only: for each of the 9 physical qubits and each of
+    3 single-qubit error types, encodes logical |{initial_state}>, injects the
+    error on that one physical qubit, decodes, and measures how faithfully the
+    logical qubit (qubit 0) is recovered. Saved to
+    examples/per_qubit_error_correction.png (or output_dir) at 200 dpi,
+    unless that file was already rendered from the same grid (force=True
+    redraws it regardless).
+    """
+    output_dir = output_dir or setup_output_directory()
+    grid, error_types = compute_per_qubit_error_grid(
+        initial_state=initial_state, workers=workers, engine=engine)
+
+    fidelity_min = grid.min()
+    fidelity_max = grid.max()
+    fidelity_mean = grid.mean()
+
+    logger.info("Per-qubit, per-error-type recovery fidelity (ideal, noiseless, "
+                "logical |%s>):", initial_state)
+    for qubit_idx in range(9):
+        row = "  ".join(
+            f"{ERROR_LABELS[et]}={grid[qubit_idx, col]*100:.2f}%"
+            for col, et in enumerate(error_types)
+        )
+        logger.info("  qubit %d: %s", qubit_idx, row)
+    logger.info("Average fidelity: %.4f%%  Min: %.4f%%  Max: %.4f%%",
+                fidelity_mean*100, fidelity_min*100, fidelity_max*100)
+
+    filepath = os.path.join(output_dir, 'per_qubit_error_correction.png')
+    data = {'grid': grid, 'error_types': error_types, 'initial_state': initial_state}
+    rendered = render(filepath, _draw_error_grid, data, force=force)
+    logger.info("Per-qubit error correction grid %s: %s",
+                'saved to' if rendered else 'unchanged', filepath)
     return grid, error_types
 
 
+def _draw_sweep_success(fig, data):
+    """Heatmap of sweep success rates; NaN cells (points not yet run) stay blank."""
+    grid, error_types = data['grid'], data['error_types']
+    ax = fig.subplots()
+    im = ax.imshow(np.ma.masked_invalid(grid), cmap='viridis', vmin=0.0, vmax=100.0, aspect='auto')
+    ax.set_xticks(range(9))
+    ax.set_xlabel('Error qubit index (0-8)')
+    ax.set_yticks(range(len(error_types)))
+    ax.set_yticklabels(error_types)
+    ax.set_ylabel('Injected error type')
+    cbar = fig.colorbar(im, ax=ax)
+    cbar.set_label('Success rate (%)')
+    ax.set_title(f"Shor's Code Sweep Success Rates, logical |{data['initial_state']}> "
+                 f"({data['status']})")
+    fig.tight_layout()
+
+
+def generate_sweep_success_plot(store_path, initial_state='0', force=False):
+    """Plot success rates from a simulate_sweep() result store without re-simulating.
+
+    Rows are streamed from the store's results.jsonl one at a time, so an
+    unfinished sweep can be plotted while it is still running; points not
+    yet completed are left blank. Saved to examples/sweep_success_rates.png,
+    which is left alone if the store has not changed since it was drawn.
+    """
+    from src.results_store import open_store
+
+    store = open_store(store_path)
+    error_types = ['none', 'bit', 'phase', 'both']
+    grid = np.full((len(error_types), 9), np.nan)
+    for row in store.rows():
+        if row['initial_state'] == initial_state and row['error_type'] in error_types:
+            grid[error_types.index(row['error_type']), row['error_qubit']] = row['success_rate']
+
+    filepath = os.path.join(setup_output_directory(), 'sweep_success_rates.png')
+    data = {'grid': grid, 'error_types': error_types, 'initial_state': initial_state,
+            'status': 'complete' if store.complete else 'in progress'}
+    if render(filepath, _draw_sweep_success, data, force=force):
+        logger.info("Sweep success rates saved to: %s", filepath)
+    else:
+        logger.info("Sweep success rates unchanged: %s", filepath)
+    return grid
+
+
+def generate_sweep_histograms(store_path, output_dir=None, workers=1, force=False):
+    """Save one counts histogram per point of a simulate_sweep() result store.
+
+    Figures go to examples/sweep_histograms/point_<index>.png (or
+    output_dir). Only points whose counts changed since their PNG was drawn
+    are rendered, spread over workers processes (None for one per core).
+    Returns the list of paths that were rendered.
+    """
+    from src.results_store import open_store
+
+    output_dir = output_dir or os.path.join(setup_output_directory(), 'sweep_histograms')
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = []
+    for row in open_store(store_path).rows():
+        title = (f"Shor's Code, {row['error_type']} error on qubit {row['error_qubit']}, "
+                 f"logical |{row['initial_state']}>")
+        jobs.append({
+            'path': os.path.join(output_dir, f"point_{row['index']:05d}.png"),
+            'draw': _draw_histogram,
+            'data': {'counts': row['counts'], 'title': title, 'expected': row['initial_state']},
+            'figsize': (7, 5),
+        })
+    return render_figures(jobs, workers=workers, force=force)
+
+
 if __name__ == "__main__":
-    import sys
-    from os.path import dirname, abspath
-    sys.path.append(dirname(dirname(abspath(__file__))))
+    import logging
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     generate_per_qubit_error_grid()
@@ -0,0 +1,62 @@
+import asyncio
+import os
+import shutil
+import tempfile
+import unittest
+import sys
+from os.path import dirname, abspath
+
+sys.path.append(dirname(dirname(abspath(__file__))))
+from qiskit_aer import AerSimulator
+from src.async_api import simulate_shors_code_async, simulate_sweep_async
+from src.circuit_cache import clear_circuit_cache, get_transpiled
+from src.result_cache import cache_get, cache_put, clear_result_cache
+from src.simulate import create_noise_model, simulate_sweep
+
+class TestAsyncApi(unittest.TestCase):
+    def test_simulate_async(self):
+        """The awaitable simulation returns the same (circuit, counts) shape as the blocking one."""
+        circuit, counts = asyncio.run(simulate_shors_code_async(3, 'bit', '0', shots=2048,
+                                                                seed_simulator=3))
+        self.assertEqual(circuit.num_qubits, 9)
+        self.assertEqual(sum(counts.values()), 2048)
+        self.assertGreater(counts.get('0', 0) / 2048, 0.85)
+
+    def test_sweep_async_matches_blocking_sweep(self):
+        """Concurrent jobs return rows in config order, equal to a chunksize=1 sweep."""
+        configs = [(q, 'phase', '1') for q in range(5)]
+        seen = []
+
+        async def collect(row):
+            seen.append(row['error_qubit'])
+
+        rows = asyncio.run(simulate_sweep_async(configs, shots=1024, seed_simulator=9,
+                                                max_concurrency=2, on_result=collect))
+        expected = simulate_sweep(configs, shots=1024, seed_simulator=9, chunksize=1)
+        self.assertEqual([row['counts'] for row in rows], [row['counts'] for row in expected])
+        self.assertEqual(sorted(seen), list(range(5)))
+    def test_concurrent_cold_cache_writes(self):
+        """Executor threads writing the same entries into empty cache dirs do not collide."""
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        backend = AerSimulator(noise_model=create_noise_model())
+        counts = [{'0': 7, '1': 1}]
+
+        def cold_start():
+            cache_put('shared', counts, cache_dir=cache_dir)
+            return get_transpiled('decode', backend, cache_dir=cache_dir)
+
+        async def run_all():
+            loop = asyncio.get_running_loop()
+            return await asyncio.gather(*(loop.run_in_executor(None, cold_start)
+                                          for _ in range(8)))
+
+        clear_circuit_cache()
+        circuits = asyncio.run(run_all())
+        self.assertEqual(len({circuit.num_qubits for circuit in circuits}), 1)
+        clear_result_cache()
+        self.assertEqual(cache_get('shared', cache_dir=cache_dir), counts)
+        self.assertFalse([f for f in os.listdir(cache_dir) if f.endswith('.tmp')])
+
+if __name__ == '__main__':
+    unittest.main()
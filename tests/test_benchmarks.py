@@ -0,0 +1,46 @@
+import os
+import tempfile
+import unittest
+import sys
+from os.path import dirname, abspath
+
+sys.path.append(dirname(dirname(abspath(__file__))))
+from benchmarks.run_benchmarks import (BENCHMARKS, measure, compare, main,
+                                       DEFAULT_THRESHOLD)
+
+class TestBenchmarks(unittest.TestCase):
+    def test_measure_reports_metrics(self):
+        """measure() records wall time, peak memory and shots per second."""
+        result = measure(lambda: [0] * 100000, repeat=2, shots=1000)
+        self.assertGreater(result['wall_time_s'], 0)
+        self.assertGreater(result['peak_memory_mb'], 0.5)
+        self.assertAlmostEqual(result['shots_per_second'], 1000 / result['wall_time_s'])
+
+    def test_compare_flags_only_regressions(self):
+        """Only slowdowns beyond the threshold are reported."""
+        baseline = {'a': {'wall_time_s': 1.0}, 'b': {'wall_time_s': 1.0}}
+        results = {'a': {'wall_time_s': 1.1}, 'b': {'wall_time_s': 1.5},
+                   'c': {'wall_time_s': 9.0}}
+        self.assertEqual(compare(results, baseline, DEFAULT_THRESHOLD), [('b', 1.0, 1.5)])
+        self.assertEqual(compare(results, baseline, threshold=0.6), [])
+
+    @unittest.skipUnless(os.environ.get('SHORS_RUN_BENCHMARKS') == '1',
+                         'set SHORS_RUN_BENCHMARKS=1 to run the benchmark suite')
+    def test_suite_against_baseline(self):
+        """The full suite runs and stays within the stored baseline."""
+        self.assertEqual(main(['--repeat', '1']), 0)
+
+    def test_cheap_benchmarks_run(self):
+        """Benchmarks that need no simulation run, and a baseline is only written on request."""
+        path = os.path.join(tempfile.mkdtemp(), 'baseline.json')
+        args = ['--only', 'circuit_build', 'grid_unitary', '--repeat', '1', '--baseline', path]
+        self.assertEqual(main(args), 2)
+        self.assertFalse(os.path.exists(path))
+        self.assertEqual(main(args + ['--update-baseline']), 0)
+        self.assertTrue(os.path.exists(path))
+        self.assertEqual(main(args + ['--threshold', '100']), 0)
+        self.assertIn('grid_unitary', BENCHMARKS)
+        os.remove(path)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+import numpy as np
+import sys
+from os.path import dirname, abspath
+
+sys.path.append(dirname(dirname(abspath(__file__))))
+from src.channel import logical_channel, exact_success_probability
+from src.pauli_frame import sample_shors_code
+from src.simulate import simulate_sweep
+
+class TestChannel(unittest.TestCase):
+    def test_noiseless_channel_is_identity(self):
+        """Without noise every correctable error leaves the logical channel as the identity."""
+        for error_type in ['none', 'bit', 'phase', 'both']:
+            with self.subTest(error_type=error_type):
+                ptm = logical_channel(4, error_type, p1=0, p2=0, transpiled=False)
+                np.testing.assert_allclose(ptm, np.eye(4), atol=1e-9)
+
+    def test_noisy_channel_is_trace_preserving(self):
+        """The PTM of a noisy run keeps the trace row and shrinks the Bloch vector."""
+        ptm = logical_channel(3, 'bit')
+        np.testing.assert_allclose(ptm[0], [1, 0, 0, 0], atol=1e-9)
+        self.assertTrue(all(0 < ptm[i, i] < 1 for i in range(1, 4)))
+
+    def test_matches_pauli_frame_sampler(self):
+        """The exact success probability agrees with 10^6 Pauli-frame shots."""
+        exact = exact_success_probability(3, 'phase', '0', transpiled=False)
+        counts = sample_shors_code(3, 'phase', '0', shots=10**6, seed=1)
+        sampled = counts.get('0', 0) / 10**6
+        sigma = np.sqrt(exact * (1 - exact) / 10**6)
+        self.assertLess(abs(sampled - exact), 5 * sigma)
+
+    def test_matches_aer(self):
+        """The exact success probability of the transpiled circuit agrees with Aer sampling."""
+        exact = exact_success_probability(4, 'bit', '1')
+        row = simulate_sweep([(4, 'bit', '1')], shots=8192, seed_simulator=6)[0]
+        sigma = np.sqrt(exact * (1 - exact) / 8192)
+        self.assertLess(abs(row['success_rate'] / 100 - exact), 5 * sigma)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import os
+import tempfile
+import unittest
+from qiskit import QuantumCircuit
+from qiskit_aer import AerSimulator
+import sys
+from os.path import dirname, abspath
+
+sys.path.append(dirname(dirname(abspath(__file__))))
+from src.circuit_cache import get_template, get_transpiled, clear_circuit_cache
+from src.simulate import create_noise_model
+
+class TestCircuitCache(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.backend = AerSimulator(noise_model=create_noise_model())
+        clear_circuit_cache()
+
+    def tearDown(self):
+        clear_circuit_cache(self.cache_dir)
+        os.rmdir(self.cache_dir)
+
+    def test_template_built_once(self):
+        """Templates are memoized per process."""
+        self.assertIs(get_template('encode'), get_template('encode'))
+        self.assertEqual(get_template('decode').num_qubits, 9)
+        with self.assertRaises(ValueError):
+            get_template('syndrome')
+
+    def test_transpiled_persisted_and_reloaded(self):
+        """A transpiled block is written as QPY and reloaded after the in-process cache is cleared."""
+        first = get_transpiled('decode', self.backend, cache_dir=self.cache_dir)
+        files = os.listdir(self.cache_dir)
+        self.assertEqual(len(files), 1)
+        self.assertTrue(files[0].startswith('decode-') and files[0].endswith('.qpy'))
+        self.assertIs(get_transpiled('decode', self.backend, cache_dir=self.cache_dir), first)
+
+        clear_circuit_cache()
+        reloaded = get_transpiled('decode', self.backend, cache_dir=self.cache_dir)
+        self.assertIsNot(reloaded, first)
+        self.assertEqual(reloaded.count_ops(), first.count_ops())
+        self.assertNotIn('ccx', reloaded.count_ops())
+
+    def test_key_depends_on_optimization_level(self):
+        """Different optimization levels are cached separately."""
+        get_transpiled('encode', self.backend, optimization_level=0, cache_dir=self.cache_dir)
+        get_transpiled('encode', self.backend, optimization_level=2, cache_dir=self.cache_dir)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+    def test_transpiled_blocks_still_correct(self):
+        """Encode and decode blocks from the cache still correct a bit flip."""
+        qc = QuantumCircuit(9, 1)
+        qc.x(0)
+        qc.compose(get_transpiled('encode', self.backend, cache_dir=self.cache_dir), inplace=True)
+        qc.x(4)
+        qc.compose(get_transpiled('decode', self.backend, cache_dir=self.cache_dir), inplace=True)
+        qc.measure(0, 0)
+        counts = AerSimulator().run(qc, shots=256).result().get_counts()
+        self.assertEqual(counts, {'1': 256})
+
+if __name__ == '__main__':
+    unittest.main()
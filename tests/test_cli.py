@@ -0,0 +1,56 @@
+import json
+import subprocess
+import unittest
+import sys
+from os.path import dirname, abspath
+
+ROOT = dirname(dirname(abspath(__file__)))
+sys.path.append(ROOT)
+from src.cli import build_parser
+
+# Modules too slow to import for --help or argument parsing
+HEAVY_MODULES = ('qiskit', 'qiskit_aer', 'matplotlib')
+
+def _python(*args):
+    return subprocess.run([sys.executable, *args], cwd=ROOT, capture_output=True, text=True,
+                          check=True)
+
+class TestCli(unittest.TestCase):
+    def test_cli_import_is_lightweight(self):
+        """Importing the CLI loads neither qiskit nor matplotlib."""
+        out = _python('-c', "import sys, src.cli; "
+                            f"print(sorted(m for m in {HEAVY_MODULES} if m in sys.modules))")
+        self.assertEqual(out.stdout.strip(), '[]')
+
+    def test_parsing_is_lightweight(self):
+        """Parsing every subcommand's arguments loads none of the heavy modules."""
+        out = _python('-c', "import sys; from src.cli import build_parser; "
+                            "parser = build_parser(); "
+                            "[parser.parse_args(a) for a in "
+                            "(['simulate'], ['grid'], ['sweep'], ['plot', 'store'], ['serve'])]; "
+                            f"print(sorted(m for m in {HEAVY_MODULES} if m in sys.modules))")
+        self.assertEqual(out.stdout.strip(), '[]')
+
+    def test_help(self):
+        """python -m src --help lists the subcommands."""
+        out = _python('-m', 'src', '--help')
+        self.assertIn('simulate', out.stdout)
+
+    def test_grid_does_not_load_matplotlib(self):
+        """The grid subcommand computes fidelities without importing matplotlib."""
+        out = _python('-c', "import sys; from src.cli import main; "
+                            "main(['grid', '--json']); print('matplotlib' in sys.modules)")
+        lines = out.stdout.strip().splitlines()
+        self.assertEqual(lines[-1], 'False')
+        self.assertEqual(len(json.loads(lines[0])['fidelity']), 9)
+
+    def test_sweep_arguments(self):
+        """Comma-separated sweep options are parsed into lists."""
+        args = build_parser().parse_args(['sweep', '--qubits', '0,4', '--error-types', 'bit',
+                                          '--workers', 'all'])
+        self.assertEqual(args.qubits, [0, 4])
+        self.assertEqual(args.error_types, ['bit'])
+        self.assertIsNone(args.workers)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+import sys
+from os.path import dirname, abspath
+
+sys.path.append(dirname(dirname(abspath(__file__))))
+from src.concatenated import (create_concatenated_shors_code, decode_concatenated_shors_code,
+                              concatenated_ops, sample_concatenated_code, concatenation_scaling)
+from src.encode import create_shors_code
+from src.pauli_frame import propagate_frames
+
+def _logical_flip(level, errors, initial_state='0'):
+    """True if the noiseless decoder returns the wrong logical value."""
+    ops = concatenated_ops(level, errors, initial_state)
+    outcome = propagate_frames(ops, 9 ** level, 64)[0]
+    return bool(outcome.any()) != (initial_state == '1')
+
+class TestConcatenated(unittest.TestCase):
+    def test_level_one_is_shors_code(self):
+        """Level 1 is exactly the existing 9-qubit encoder."""
+        self.assertEqual(create_concatenated_shors_code(1), create_shors_code())
+
+    def test_level_two_size(self):
+        """Level 2 encodes into 81 qubits."""
+        self.assertEqual(create_concatenated_shors_code(2).num_qubits, 81)
+        self.assertEqual(decode_concatenated_shors_code(2).num_qubits, 81)
+
+    def test_corrects_any_single_error(self):
+        """Every single-qubit error on the 81 qubits is corrected, for both logical states."""
+        for qubit in range(81):
+            for error_type in ('bit', 'phase', 'both'):
+                for initial_state in ('0', '1'):
+                    self.assertFalse(_logical_flip(2, [(qubit, error_type)], initial_state),
+                                     f"{error_type} error on qubit {qubit}")
+
+    def test_level_two_corrects_level_one_failure(self):
+        """Two phase flips that defeat the 9-qubit code are corrected one level up."""
+        errors = [(0, 'phase'), (3, 'phase')]
+        self.assertTrue(_logical_flip(1, errors))
+        self.assertFalse(_logical_flip(2, errors))
+
+    def test_errors_in_separate_blocks_corrected(self):
+        """One error in each of the nine inner blocks is still corrected."""
+        errors = [(9 * k + k, 'both') for k in range(9)]
+        self.assertFalse(_logical_flip(2, errors))
+
+    def test_noiseless_sampling(self):
+        """Without noise every shot returns the initial logical state."""
+        counts = sample_concatenated_code(2, initial_state='1', shots=1000, p1=0, p2=0)
+        self.assertEqual(counts, {'1': 1000})
+
+    def test_scaling_rows(self):
+        """The scaling sweep returns one seeded row per (level, rate) point."""
+        rows = concatenation_scaling(levels=(1, 2), physical_rates=(1e-3, 1e-2),
+                                     shots=2000, seed=4)
+        self.assertEqual([(row['level'], row['physical_rate']) for row in rows],
+                         [(1, 1e-3), (1, 1e-2), (2, 1e-3), (2, 1e-2)])
+        self.assertEqual(rows, concatenation_scaling(levels=(1, 2), physical_rates=(1e-3, 1e-2),
+                                                     shots=2000, seed=4))
+        self.assertGreater(rows[-1]['logical_error_rate'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+import sys
+from os.path import dirname, abspath
+
+sys.path.append(dirname(dirname(abspath(__file__))))
+from src.counts_array import (counts_to_array, array_to_counts, memory_to_array, array_to_memory,
+                              outcome_dtype, open_memory_file, load_memory_file, histogram,
+                              success_rate)
+from src.simulate import simulate_shors_code, simulate_sharded
+
+class TestCountsArray(unittest.TestCase):
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.output_dir)
+
+    def test_round_trips(self):
+        """Dicts and bitstrings convert to arrays and back unchanged."""
+        counts = {'000000000': 90, '100000001': 7, '000000011': 3}
+        hist = counts_to_array(counts, 9)
+        self.assertEqual(hist.shape, (512,))
+        self.assertEqual(hist[0b100000001], 7)
+        self.assertEqual(array_to_counts(hist, 9), counts)
+        self.assertAlmostEqual(success_rate(hist, '000000000'), 90.0)
+        memory = ['101', '000', '111', '101']
+        outcomes = memory_to_array(memory, 3)
+        self.assertEqual(outcomes.dtype, np.uint8)
+        self.assertEqual(array_to_memory(outcomes, 3), memory)
+        self.assertEqual(outcome_dtype(9), np.uint16)
+
+    def test_memory_file(self):
+        """Outcomes written to a memory-mapped file load back lazily and histogram in chunks."""
+        path = os.path.join(self.output_dir, 'memory.npy')
+        outcomes = open_memory_file(path, 10, 9)
+        memory_to_array(['000000001'] * 4 + ['000000000'] * 6, 9, out=outcomes)
+        outcomes.flush()
+        loaded = load_memory_file(path)
+        self.assertIsInstance(loaded, np.memmap)
+        hist = histogram(loaded, 9, chunk=3)
+        self.assertEqual(array_to_counts(hist, 9), {'000000000': 6, '000000001': 4})
+
+    def test_simulate_as_array(self):
+        """as_array gives the same counts as the dict, as a histogram."""
+        _, counts = simulate_shors_code(3, 'bit', '0', shots=2048, seed_simulator=4)
+        _, hist = simulate_shors_code(3, 'bit', '0', shots=2048, seed_simulator=4, as_array=True)
+        self.assertEqual(array_to_counts(hist, 1), counts)
+
+    def test_sharded_memory_file(self):
+        """Sharded runs stream outcomes to disk matching the in-memory outcomes and counts."""
+        path = os.path.join(self.output_dir, 'shots.npy')
+        _, counts, memory = simulate_sharded(3, 'phase', '1', shots=5000, seed_simulator=6,
+                                             workers=1, shard_shots=2000, memory=True)
+        _, hist, outcomes = simulate_sharded(3, 'phase', '1', shots=5000, seed_simulator=6,
+                                             workers=2, shard_shots=2000, memory_path=path,
+                                             as_array=True)
+        self.assertEqual(array_to_counts(hist, 1), counts)
+        self.assertEqual(array_to_memory(load_memory_file(path), 1), memory)
+        np.testing.assert_array_equal(histogram(outcomes, 1), hist)
+
+if __name__ == '__main__':
+    unittest.main()
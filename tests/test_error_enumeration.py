@@ -0,0 +1,60 @@
+import unittest
+import numpy as np
+import sys
+from os.path import dirname, abspath
+
+sys.path.append(dirname(dirname(abspath(__file__))))
+from src.error_enumeration import (pauli_patterns, canonical_pattern, error_classes,
+                                   enumerate_logical_failures, failure_summary,
+                                   PAULI_ERROR_TYPES)
+from src.statevector_engine import recovery_fidelities
+
+class TestErrorEnumeration(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.rows = enumerate_logical_failures()
+
+    def test_pattern_counts(self):
+        """All 27 + 324 + 2268 patterns fall into 53 symmetry classes."""
+        self.assertEqual([len(list(pauli_patterns(k))) for k in (1, 2, 3)], [27, 324, 2268])
+        classes = error_classes()
+        self.assertEqual(len(classes), 53)
+        self.assertEqual(sum(len(members) for members in classes.values()), 27 + 324 + 2268)
+
+    def test_canonical_pattern_invariant(self):
+        """Swapping blocks or qubits inside a block keeps the representative."""
+        pattern = ((1, 'X'), (7, 'Z'), (8, 'Y'))
+        swapped = ((0, 'Y'), (2, 'Z'), (4, 'X'))  # blocks 0 -> 1 and 2 -> 0, qubits reordered
+        self.assertEqual(canonical_pattern(pattern), canonical_pattern(swapped))
+        self.assertEqual(canonical_pattern(((5, 'Z'),)), ((0, 'Z'),))
+
+    def test_single_errors_corrected(self):
+        """No weight-1 Pauli, Y included, causes a logical failure."""
+        summary = failure_summary(self.rows)
+        self.assertEqual(summary[1]['failures'], 0)
+        self.assertEqual(summary[1]['patterns'], 27)
+
+    def test_failure_counts(self):
+        """Known failure counts and logical effects of weight-2 and weight-3 errors."""
+        summary = failure_summary(self.rows)
+        self.assertEqual(summary[2]['failures'], 144)
+        self.assertEqual(summary[3]['failures'], 1464)
+        by_label = {row['representative']: row for row in self.rows}
+        self.assertEqual(by_label['X0 X1']['logical_error'], 'Z')
+        self.assertEqual(by_label['Z0 Z3']['logical_error'], 'X')
+        self.assertEqual(by_label['X0 X3']['logical_error'], 'I')
+        self.assertIn('Z4 Z7', by_label['Z0 Z3']['patterns'])
+
+    def test_classes_agree_with_brute_force(self):
+        """Every member of a weight-2 class decodes exactly like its representative."""
+        for row in self.rows:
+            if row['weight'] != 2:
+                continue
+            errors = []
+            for label in row['patterns']:
+                errors.append([(int(term[1:]), PAULI_ERROR_TYPES[term[0]]) for term in label.split()])
+            np.testing.assert_allclose(recovery_fidelities(errors, '0'), row['fidelity_0'], atol=1e-9)
+            np.testing.assert_allclose(recovery_fidelities(errors, '+'), row['fidelity_plus'], atol=1e-9)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+import numpy as np
+import sys
+from os.path import dirname, abspath
+
+sys.path.append(dirname(dirname(abspath(__file__))))
+from src.fault_paths import (enumerate_fault_paths, failure_polynomial, evaluate_polynomial,
+                             malignant_paths)
+from src.pauli_frame import shors_code_ops, fault_locations, sample_shors_code, logical_error_rate
+
+class TestFaultPaths(unittest.TestCase):
+    def test_path_counts(self):
+        """One row for the empty set, each location and each pair of locations."""
+        n = len(fault_locations(shors_code_ops(3, 'none', '0'), 1, 1))
+        rows = enumerate_fault_paths()
+        self.assertEqual(len(rows), 1 + n + n * (n - 1) // 2)
+        self.assertEqual(rows[0]['locations'], ())
+        self.assertEqual(rows[0]['failure_fraction'], 0.0)
+
+    def test_injected_error_corrected_without_faults(self):
+        """With no faults the injected single-qubit error never fails."""
+        for initial_state in ('0', '1'):
+            rows = enumerate_fault_paths(5, 'both', initial_state, max_order=1)
+            self.assertEqual(rows[0]['failure_fraction'], 0.0)
+
+    def test_polynomial_matches_sampling(self):
+        """The second-order polynomial agrees with Pauli-frame sampling at the default noise."""
+        coefficients = failure_polynomial()
+        self.assertEqual(coefficients[(0, 0)], 0.0)
+        predicted = evaluate_polynomial(coefficients, 0.001, 0.01)
+        shots = 10**6
+        sampled = logical_error_rate(sample_shors_code(3, 'none', '0', shots=shots,
+                                                       p1=0.001, p2=0.01, seed=5))
+        sigma = np.sqrt(sampled * (1 - sampled) / shots)
+        self.assertAlmostEqual(predicted, sampled, delta=5 * sigma + 5e-4)
+
+    def test_low_noise_is_first_order(self):
+        """At very low noise P_L is dominated by the linear terms."""
+        coefficients = failure_polynomial()
+        linear = coefficients.get((1, 0), 0) * 1e-6 + coefficients.get((0, 1), 0) * 1e-5
+        self.assertAlmostEqual(evaluate_polynomial(coefficients, 1e-6, 1e-5), linear,
+                               delta=abs(linear) * 1e-3)
+
+    def test_malignant_pairs(self):
+        """Malignant pairs fail although neither of their faults fails alone."""
+        rows = enumerate_fault_paths()
+        singles = {row['locations']: row['failure_fraction'] for row in rows
+                   if len(row['locations']) == 1}
+        for row in malignant_paths(rows):
+            self.assertGreater(row['failure_fraction'], 0)
+            self.assertTrue(all(singles[(index,)] == 0 for index in row['locations']))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+import sys
+from os.path import dirname, abspath
+
+sys.path.append(dirname(dirname(abspath(__file__))))
+from src.instrumentation import record_metrics, span, count, _active
+from src import result_cache
+from src.simulate import simulate_sweep, sweep_configs
+
+class TestInstrumentation(unittest.TestCase):
+    def test_spans_and_counters_only_while_recording(self):
+        """Spans nest, counters add up, and nothing is kept outside a recorder."""
+        with span('ignored'):
+            count('ignored')
+        with record_metrics() as metrics:
+            with span('outer'):
+                with span('inner'):
+                    count('items', 3)
+                count('items')
+        self.assertEqual([s['name'] for s in metrics.spans], ['inner', 'outer'])
+        self.assertEqual([s['depth'] for s in metrics.spans], [1, 0])
+        self.assertEqual(metrics.counters, {'items': 4})
+        self.assertEqual(_active, [])
+
+    def test_pipeline_stages_and_aer_metadata(self):
+        """A simulation records each stage, shot counters and Aer's own timing."""
+        result_cache.ENABLED = False
+        self.addCleanup(setattr, result_cache, 'ENABLED', True)
+        path = os.path.join(tempfile.mkdtemp(), 'metrics.json')
+        received = []
+        with record_metrics(path=path, callback=received.append):
+            simulate_sweep([(3, 'bit', '0'), (5, 'phase', '1')], shots=512, seed_simulator=7)
+        names = set(received[0].totals())
+        self.assertTrue({'noise_model', 'build_circuit', 'execute', 'postprocess'} <= names)
+        with open(path) as f:
+            exported = json.load(f)
+        self.assertEqual(exported['counters']['shots_executed'], 1024)
+        self.assertEqual(exported['counters']['circuits_executed'], 2)
+        self.assertEqual(len(exported['aer'][0]['experiments']), 2)
+        self.assertIsNotNone(exported['aer'][0]['time_taken'])
+        os.remove(path)
+
+    def test_serial_sweep_is_one_job(self):
+        """With one worker the default chunking sends the whole sweep as one Aer job."""
+        with record_metrics() as metrics:
+            simulate_sweep(sweep_configs()[:12], shots=256)
+        self.assertEqual(len(metrics.aer), 1)
+        self.assertEqual(metrics.counters['circuits_executed'], 12)
+
+    def test_csv_export(self):
+        """Spans can be exported as CSV rows."""
+        path = os.path.join(tempfile.mkdtemp(), 'metrics.csv')
+        with record_metrics(path=path):
+            with span('stage'):
+                pass
+        with open(path) as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(rows[0]['name'], 'stage')
+        os.remove(path)
+
+if __name__ == '__main__':
+    unittest.main()
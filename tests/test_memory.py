@@ -0,0 +1,35 @@
+import unittest
+import sys
+from os.path import dirname, abspath
+
+sys.path.append(dirname(dirname(abspath(__file__))))
+from src.memory import memory_experiment, round_ops
+from src.pauli_frame import propagate_frames
+
+class TestMemory(unittest.TestCase):
+    def test_noiseless_memory_never_fails(self):
+        """Without noise the stored logical state survives every round."""
+        rows = memory_experiment(5, shots=1000, p1=0, p2=0)
+        self.assertEqual([row['rounds'] for row in rows], [1, 2, 3, 4, 5])
+        self.assertTrue(all(row['failures'] == 0 for row in rows))
+
+    def test_round_syndromes_trivial_without_errors(self):
+        """A noiseless syndrome round from the zero frame measures all zeros."""
+        outcomes = propagate_frames(round_ops(), 17, 128)
+        self.assertEqual(len(outcomes), 8)
+        self.assertTrue(all(not outcome.any() for outcome in outcomes))
+
+    def test_shorter_runs_are_prefixes(self):
+        """Rounds are simulated incrementally, so a seeded shorter run is a prefix of a longer one."""
+        short = memory_experiment(3, shots=5000, p1=0.005, p2=0.02, seed=8)
+        long = memory_experiment(6, shots=5000, p1=0.005, p2=0.02, seed=8)
+        self.assertEqual(long[:3], short)
+
+    def test_errors_accumulate_with_rounds(self):
+        """The logical error rate grows with the number of rounds."""
+        rows = memory_experiment(10, shots=20000, p1=0.005, p2=0.02, seed=2)
+        self.assertGreater(rows[-1]['logical_error_rate'], rows[0]['logical_error_rate'])
+        self.assertLess(rows[0]['logical_error_rate'], 0.2)
+
+if __name__ == '__main__':
+    unittest.main()
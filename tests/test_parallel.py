@@ -0,0 +1,50 @@
+import unittest
+import numpy as np
+import sys
+from os.path import dirname, abspath
+
+sys.path.append(dirname(dirname(abspath(__file__))))
+from src.parallel import parallel_map, task_seed
+from src.simulate import simulate_sweep
+from src.visualize import compute_per_qubit_error_grid
+
+def _square(x):
+    return x * x
+
+class TestParallel(unittest.TestCase):
+    def test_parallel_map_preserves_order(self):
+        """Results come back in task order for any worker count."""
+        tasks = list(range(20))
+        expected = [x * x for x in tasks]
+        self.assertEqual(parallel_map(_square, tasks), expected)
+        self.assertEqual(parallel_map(_square, tasks, workers=3, chunksize=4), expected)
+
+    def test_task_seed_reproducible(self):
+        """Task seeds depend only on the base seed and task index."""
+        self.assertEqual(task_seed(42, 3), task_seed(42, 3))
+        self.assertNotEqual(task_seed(42, 3), task_seed(42, 4))
+        self.assertIsNone(task_seed(None, 3))
+
+    def test_grid_same_for_any_worker_count(self):
+        """The fidelity grid does not depend on how it was parallelised."""
+        serial, error_types = compute_per_qubit_error_grid(engine='circuit')
+        parallel, _ = compute_per_qubit_error_grid(workers=2, chunksize=5, engine='circuit')
+        self.assertEqual(error_types, ['bit', 'phase', 'both'])
+        np.testing.assert_allclose(serial, parallel)
+
+    def test_seeded_sweep_same_for_any_worker_count(self):
+        """A seeded sweep gives identical counts serially and in parallel."""
+        configs = [(q, 'phase', '0') for q in range(4)]
+        serial = simulate_sweep(configs, shots=512, seed_simulator=9, chunksize=1)
+        parallel = simulate_sweep(configs, shots=512, seed_simulator=9, workers=2, chunksize=1)
+        self.assertEqual([r['counts'] for r in serial], [r['counts'] for r in parallel])
+
+    def test_default_chunking_same_for_any_worker_count(self):
+        """With the default chunksize the worker count does not change the counts."""
+        configs = [(q, 'bit', '1') for q in range(9)]
+        serial = simulate_sweep(configs, shots=512, seed_simulator=9)
+        parallel = simulate_sweep(configs, shots=512, seed_simulator=9, workers=2)
+        self.assertEqual([r['counts'] for r in serial], [r['counts'] for r in parallel])
+
+if __name__ == '__main__':
+    unittest.main()
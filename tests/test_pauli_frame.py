@@ -0,0 +1,65 @@
+import unittest
+from qiskit import QuantumCircuit
+import sys
+from os.path import dirname, abspath
+
+sys.path.append(dirname(dirname(abspath(__file__))))
+from src.encode import create_shors_code
+from src.decode import decode_shors_code
+from src.pauli_frame import (circuit_ops, run_pauli_frames, sample_shors_code,
+                             logical_error_rate, num_words, pack_shots, popcount,
+                             valid_mask)
+
+class TestPauliFrame(unittest.TestCase):
+    def test_noiseless_single_errors_corrected(self):
+        """Every single-qubit error is corrected when the gates are noiseless."""
+        for error_type in ['none', 'bit', 'phase', 'both']:
+            for error_qubit in range(9):
+                for initial_state in ['0', '1']:
+                    with self.subTest(error_type=error_type, error_qubit=error_qubit,
+                                      initial_state=initial_state):
+                        counts = sample_shors_code(error_qubit, error_type, initial_state,
+                                                   shots=256, p1=0, p2=0)
+                        self.assertEqual(counts, {initial_state: 256})
+
+    def test_two_phase_flips_cause_logical_failure(self):
+        """Phase flips in two different blocks defeat the outer majority vote."""
+        qc = QuantumCircuit(9, 1)
+        qc.compose(create_shors_code(), inplace=True)
+        qc.z(0)
+        qc.z(3)
+        qc.compose(decode_shors_code(), inplace=True)
+        qc.measure(0, 0)
+        counts = run_pauli_frames(circuit_ops(qc), shots=256, p1=0, p2=0)
+        self.assertEqual(counts, {'1': 256})
+
+    def test_depolarizing_rate_on_single_gate(self):
+        """A 2-qubit depolarizing error flips the control's Z outcome with probability p/2."""
+        ops = [('cx', (0, 1)), ('measure', (0,))]
+        counts = run_pauli_frames(ops, shots=10**6, p2=0.2, seed=7)
+        self.assertAlmostEqual(counts['1'] / 10**6, 0.1, delta=0.002)
+
+    def test_seed_reproducible(self):
+        """The same seed gives the same counts."""
+        first = sample_shors_code(4, 'bit', shots=10**5, seed=5)
+        second = sample_shors_code(4, 'bit', shots=10**5, seed=5)
+        self.assertEqual(first, second)
+        self.assertEqual(sum(first.values()), 10**5)
+        self.assertLess(logical_error_rate(first), 0.1)
+
+    def test_reused_toffoli_control_rejected(self):
+        """A Toffoli whose controls are used again cannot be tracked as a frame."""
+        ops = [('ccx', (1, 2, 0)), ('cx', (1, 0)), ('measure', (0,))]
+        with self.assertRaises(ValueError):
+            run_pauli_frames(ops, shots=64)
+    def test_bit_packing_helpers(self):
+        """Shot masks pack one bit per shot and padding bits are never valid."""
+        n_words = num_words(70)
+        self.assertEqual(n_words, 2)
+        mask = pack_shots([0, 5, 64, 69], n_words)
+        self.assertEqual(popcount(mask), 4)
+        self.assertEqual(popcount(valid_mask(70, n_words)), 70)
+        self.assertEqual(popcount(~mask & valid_mask(70, n_words)), 66)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+import numpy as np
+import sys
+from os.path import dirname, abspath
+
+sys.path.append(dirname(dirname(abspath(__file__))))
+from src.rare_events import (fault_count_distribution, sample_conditional_faults,
+                             stratified_logical_error_rate)
+from src.pauli_frame import shors_code_ops, fault_locations, sample_shors_code, logical_error_rate
+
+class TestRareEvents(unittest.TestCase):
+    def test_fault_count_distribution(self):
+        """The exact fault-count weights match the binomial for equal probabilities."""
+        weights, tail = fault_count_distribution([0.1] * 5, 2)
+        np.testing.assert_allclose(weights, [0.9 ** 5, 5 * 0.1 * 0.9 ** 4, 10 * 0.01 * 0.9 ** 3])
+        self.assertAlmostEqual(weights.sum() + tail, 1.0)
+
+    def test_conditional_faults_have_exact_count(self):
+        """Every conditioned shot has exactly k firing locations."""
+        locations = fault_locations(shors_code_ops(), 0.001, 0.01)
+        rng = np.random.default_rng(0)
+        shots = 1000
+        faults = sample_conditional_faults(locations, 3, shots, rng)
+        fired = np.zeros(shots, dtype=int)
+        for masks in faults.values():
+            # Locations that drew the identity leave no mask, so this counts at most k
+            words = np.zeros_like(masks[0][1])
+            for _, x_mask, z_mask in masks:
+                words |= x_mask | z_mask
+            fired += np.unpackbits(words.view(np.uint8), bitorder='little')[:shots]
+        self.assertTrue((fired <= 3).all())
+        self.assertGreater(fired.mean(), 2)
+
+    def test_matches_plain_sampling(self):
+        """At high noise, where plain sampling is cheap, both estimators agree."""
+        p1, p2 = 0.01, 0.05
+        plain = logical_error_rate(sample_shors_code(3, 'none', '0', shots=400000,
+                                                     p1=p1, p2=p2, seed=1))
+        result = stratified_logical_error_rate(p1=p1, p2=p2, max_faults=6,
+                                               shots_per_stratum=50000, seed=2)
+        self.assertLess(result['truncation'], 1e-3)
+        self.assertAlmostEqual(result['logical_error_rate'], plain,
+                               delta=5 * result['std_error'] + 0.002)
+        low, high = result['ci']
+        self.assertLessEqual(low, result['logical_error_rate'])
+        self.assertGreaterEqual(high, result['logical_error_rate'])
+
+    def test_tight_error_bars_at_low_noise(self):
+        """Below the default p1/p2 the stratified error bar is far below plain sampling's."""
+        result = stratified_logical_error_rate(p1=1e-4, p2=1e-3, shots_per_stratum=20000, seed=3)
+        rate = result['logical_error_rate']
+        plain_std = np.sqrt(rate * (1 - rate) / result['shots'])
+        self.assertGreater(rate, 0)
+        self.assertLess(result['std_error'], plain_std / 3)
+        self.assertEqual(result['strata'][0]['failures'], 0)
+
+    def test_deterministic_injected_error(self):
+        """A corrected injected error and logical |1> keep the zero-fault stratum clean."""
+        result = stratified_logical_error_rate(5, 'both', '1', max_faults=2,
+                                               shots_per_stratum=5000, seed=4)
+        self.assertEqual(result['strata'][0]['failure_rate'], 0.0)
+        self.assertEqual(len(result['strata']), 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+import numpy as np
+import sys
+from os.path import dirname, abspath
+
+sys.path.append(dirname(dirname(abspath(__file__))))
+from src.readout_decoder import readout_lut, decode_readout, decode_histogram, simulate_readout
+
+def _outcome(bits):
+    """Outcome index with bit q set for every qubit q in bits."""
+    return sum(1 << q for q in bits)
+
+class TestReadoutDecoder(unittest.TestCase):
+    def test_x_basis_table(self):
+        """Block parities vote on the logical value; an outvoted block is the syndrome."""
+        logical, syndrome = decode_readout(np.array([0, _outcome([4]), _outcome([0, 3, 6]),
+                                                     _outcome([0, 3])]), 'X')
+        np.testing.assert_array_equal(logical, [0, 0, 1, 1])
+        np.testing.assert_array_equal(syndrome, [0, 2, 0, 3])
+
+    def test_z_basis_table(self):
+        """Block majorities correct bit flips; their parity is the logical value."""
+        logical, syndrome = decode_readout(np.array([0, _outcome([7]), _outcome([0, 1, 2]),
+                                                     _outcome([0, 1, 2, 3, 4, 5])]), 'Z')
+        np.testing.assert_array_equal(logical, [0, 0, 1, 0])
+        self.assertEqual(syndrome[1], 2 << 4)
+        self.assertEqual(syndrome[2], 0)
+
+    def test_lut_is_shared_and_read_only(self):
+        """The 512-entry tables are computed once and cannot be modified."""
+        logical, _ = readout_lut('X')
+        self.assertIs(readout_lut('X')[0], logical)
+        self.assertEqual(len(logical), 512)
+        with self.assertRaises(ValueError):
+            logical[0] = 1
+
+    def test_histogram_matches_per_shot(self):
+        """Decoding a histogram equals decoding its shots one by one."""
+        rng = np.random.default_rng(0)
+        outcomes = rng.integers(0, 512, size=100000)
+        logical, syndrome = decode_readout(outcomes, 'Z')
+        hist_logical, hist_syndrome = decode_histogram(np.bincount(outcomes, minlength=512), 'Z')
+        np.testing.assert_array_equal(hist_logical, np.bincount(logical, minlength=2))
+        np.testing.assert_array_equal(hist_syndrome, np.bincount(syndrome, minlength=64))
+
+    def test_single_errors_corrected(self):
+        """Noiseless single errors are corrected for all four logical inputs."""
+        for initial_state, expected in (('0', '0'), ('1', '1'), ('+', '0'), ('-', '1')):
+            for error_type in ('bit', 'phase', 'both'):
+                result = simulate_readout(4, error_type, initial_state, shots=512,
+                                          noise={'p1': 0, 'p2': 0}, seed_simulator=1)
+                self.assertEqual(result['counts'], {expected: 512},
+                                 f"{error_type} error, |{initial_state}>")
+
+    def test_syndrome_statistics_and_memory(self):
+        """A phase flip on block 1 shows up as syndrome 2 in every X-basis shot."""
+        result = simulate_readout(4, 'phase', '0', shots=1000, noise={'p1': 0, 'p2': 0},
+                                  seed_simulator=2, memory=True)
+        self.assertEqual(result['syndromes'], {2: 1000})
+        self.assertEqual(len(result['outcomes']), 1000)
+        self.assertTrue((result['syndrome'] == 2).all())
+        self.assertTrue((result['logical'] == 0).all())
+
+    def test_noisy_readout(self):
+        """With the default noise most shots still decode correctly."""
+        result = simulate_readout(3, 'both', '0', shots=4096, seed_simulator=3)
+        self.assertGreater(result['counts'].get('0', 0) / 4096, 0.85)
+    def test_thermal_noise(self):
+        """Non-Pauli (thermal relaxation) noise runs instead of failing in Aer."""
+        result = simulate_readout(3, 'both', '0', shots=1024, seed_simulator=4,
+                                  noise={'t1': 50e3, 't2': 70e3})
+        self.assertEqual(sum(result['counts'].values()), 1024)
+        self.assertGreater(result['counts'].get('0', 0) / 1024, 0.85)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+import sys
+from os.path import dirname, abspath
+
+sys.path.append(dirname(dirname(abspath(__file__))))
+from src.render import render, render_figures, stored_hash, input_hash, get_figure
+from src.visualize import _draw_histogram
+
+def _draw_line(fig, data):
+    fig.subplots().plot(data)
+
+class TestRender(unittest.TestCase):
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.output_dir, 'line.png')
+
+    def tearDown(self):
+        shutil.rmtree(self.output_dir)
+
+    def test_skips_unchanged_inputs(self):
+        """A figure is drawn once and skipped while its inputs stay the same."""
+        self.assertTrue(render(self.path, _draw_line, [1, 2, 3]))
+        mtime = os.path.getmtime(self.path)
+        self.assertFalse(render(self.path, _draw_line, [1, 2, 3]))
+        self.assertEqual(os.path.getmtime(self.path), mtime)
+        self.assertTrue(render(self.path, _draw_line, [1, 2, 3], force=True))
+
+    def test_changed_inputs_rerender(self):
+        """New data, dpi or size give a new hash and a fresh render."""
+        render(self.path, _draw_line, np.array([1.0, 2.0]))
+        self.assertEqual(stored_hash(self.path), input_hash(_draw_line, np.array([1.0, 2.0]), (10, 4.5), 200))
+        self.assertTrue(render(self.path, _draw_line, np.array([1.0, 2.5])))
+        self.assertTrue(render(self.path, _draw_line, np.array([1.0, 2.5]), dpi=100))
+        self.assertTrue(render(self.path, _draw_line, np.array([1.0, 2.5]), dpi=100, figsize=(4, 3)))
+
+    def test_stored_hash_of_foreign_files(self):
+        """Missing files, non-PNGs and PNGs without a hash have no stored hash."""
+        self.assertIsNone(stored_hash(self.path))
+        with open(self.path, 'w') as f:
+            f.write('not a png')
+        self.assertIsNone(stored_hash(self.path))
+        fig = get_figure((2, 2))
+        fig.savefig(self.path)
+        self.assertIsNone(stored_hash(self.path))
+
+    def test_figures_are_reused(self):
+        """Figures of the same size are cleared and handed out again."""
+        fig = get_figure((3, 3))
+        fig.subplots()
+        self.assertIs(get_figure((3, 3)), fig)
+        self.assertEqual(len(fig.axes), 0)
+        self.assertIsNot(get_figure((3, 4)), fig)
+
+    def test_render_figures_only_draws_changes(self):
+        """Batch rendering (in worker processes) redraws only the figures whose counts changed."""
+        jobs = [{'path': os.path.join(self.output_dir, f'point_{i}.png'), 'draw': _draw_histogram,
+                 'data': {'counts': {'0': 100 - i, '1': i}, 'title': f'point {i}'}, 'figsize': (7, 5)}
+                for i in range(4)]
+        self.assertEqual(len(render_figures(jobs, workers=2, chunksize=1)), 4)
+        jobs[2]['data'] = {'counts': {'0': 50, '1': 50}, 'title': 'point 2'}
+        self.assertEqual(render_figures(jobs), [jobs[2]['path']])
+        self.assertEqual(render_figures(jobs), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit_aer import AerSimulator
+import sys
+from os.path import dirname, abspath
+
+sys.path.append(dirname(dirname(abspath(__file__))))
+from src.result_cache import (result_key, cache_get, cache_put, run_counts,
+                              cached_statevector, clear_result_cache)
+from src.simulate import create_noise_model
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        clear_result_cache()
+
+    def tearDown(self):
+        clear_result_cache(self.cache_dir)
+        os.rmdir(self.cache_dir)
+
+    def _circuit(self, error_qubit=0):
+        qc = QuantumCircuit(2, 1)
+        qc.x(error_qubit)
+        qc.measure(0, 0)
+        return qc
+
+    def test_key_depends_on_content(self):
+        """Keys change with the circuit, noise, shots and seed, but not with the circuit name."""
+        renamed = self._circuit()
+        renamed.name = 'other'
+        base = result_key('counts', [self._circuit()], create_noise_model(), 100, 1)
+        self.assertEqual(base, result_key('counts', [renamed], create_noise_model(), 100, 1))
+        self.assertNotEqual(base, result_key('counts', [self._circuit(1)], create_noise_model(), 100, 1))
+        self.assertNotEqual(base, result_key('counts', [self._circuit()], create_noise_model(0.002), 100, 1))
+        self.assertNotEqual(base, result_key('counts', [self._circuit()], create_noise_model(), 200, 1))
+        self.assertNotEqual(base, result_key('counts', [self._circuit()], create_noise_model(), 100, 2))
+
+    def test_counts_served_from_disk(self):
+        """A repeated job is answered from the disk tier after the process tier is cleared."""
+        backend = AerSimulator(noise_model=create_noise_model())
+        first = run_counts(backend, [self._circuit()], shots=512, seed_simulator=3,
+                           cache_dir=self.cache_dir)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+        clear_result_cache()
+        second = run_counts(backend, [self._circuit()], shots=512, seed_simulator=3,
+                            cache_dir=self.cache_dir)
+        self.assertEqual(first, second)
+
+    def test_unseeded_jobs_not_cached(self):
+        """Unseeded jobs always simulate and leave nothing in the cache."""
+        backend = AerSimulator(noise_model=create_noise_model())
+        run_counts(backend, [self._circuit()], shots=512, cache_dir=self.cache_dir)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_hits_are_private_copies(self):
+        """Editing a returned value does not change what later hits return."""
+        cache_put('k', [{'0': 1}], cache_dir=None)
+        cache_get('k', cache_dir=None)[0]['0'] = 99
+        self.assertEqual(cache_get('k', cache_dir=None), [{'0': 1}])
+
+    def test_statevector_cached(self):
+        """Statevectors round-trip through the .npy disk tier."""
+        qc = QuantumCircuit(2)
+        qc.h(0)
+        qc.cx(0, 1)
+        first = cached_statevector(qc, cache_dir=self.cache_dir)
+        clear_result_cache()
+        np.testing.assert_allclose(cached_statevector(qc, cache_dir=self.cache_dir), first)
+
+    def test_lru_eviction(self):
+        """Least recently used files are evicted first when the disk budget is exceeded."""
+        cache_put('a', list(range(100)), cache_dir=self.cache_dir)
+        os.utime(os.path.join(self.cache_dir, 'a.json'), (1, 1))
+        cache_put('b', list(range(100)), cache_dir=self.cache_dir)
+        os.utime(os.path.join(self.cache_dir, 'b.json'), (2, 2))
+        cache_put('c', list(range(100)), cache_dir=self.cache_dir, max_bytes=800)
+        self.assertEqual(sorted(os.listdir(self.cache_dir)), ['b.json', 'c.json'])
+        clear_result_cache()
+        self.assertIsNone(cache_get('a', cache_dir=self.cache_dir))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import sys
+from os.path import dirname, abspath
+
+sys.path.append(dirname(dirname(abspath(__file__))))
+from src.results_store import ResultStore, open_store, RESULTS_FILE
+from src.simulate import simulate_sweep
+
+class TestResultStore(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), 'sweep')
+
+    def tearDown(self):
+        shutil.rmtree(dirname(self.path))
+
+    def test_append_and_reopen(self):
+        """Appended rows survive reopening, and a torn last line is dropped."""
+        store = ResultStore(self.path, 'test', {'n': 3})
+        store.append([{'index': 1, 'value': 'b'}, {'index': 0, 'value': 'a'}])
+        with open(os.path.join(self.path, RESULTS_FILE), 'a') as f:
+            f.write('{"index": 2, "val')
+
+        reopened = open_store(self.path)
+        self.assertEqual(reopened.completed_indices(), {0, 1})
+        self.assertEqual(reopened.sorted_rows(), [{'value': 'a'}, {'value': 'b'}])
+        self.assertFalse(reopened.complete)
+
+    def test_mismatched_params_rejected(self):
+        """A store cannot be resumed with different sweep parameters."""
+        ResultStore(self.path, 'test', {'n': 3})
+        with self.assertRaises(ValueError):
+            ResultStore(self.path, 'test', {'n': 4})
+
+    def test_params_frozen_at_creation(self):
+        """Changing the caller's params afterwards does not break reopening."""
+        params = {'configs': [{'error_qubit': 3}]}
+        store = ResultStore(self.path, 'test', params)
+        params['configs'][0]['counts'] = {'0': 1}
+        store.mark_complete()
+        self.assertTrue(open_store(self.path).complete)
+
+    def test_sweep_resumes_without_rerunning(self):
+        """An interrupted sweep only simulates the missing chunks and matches a full run."""
+        configs = [(q, 'bit', '0') for q in range(4)]
+        full = simulate_sweep(configs, shots=256, seed_simulator=2, chunksize=2)
+
+        simulate_sweep(configs, shots=256, seed_simulator=2, chunksize=2, store=self.path)
+        results_path = os.path.join(self.path, RESULTS_FILE)
+        with open(results_path) as f:
+            lines = f.readlines()
+        with open(results_path, 'w') as f:
+            f.writelines(lines[:2])
+
+        resumed = simulate_sweep(configs, shots=256, seed_simulator=2, chunksize=2, store=self.path)
+        self.assertEqual(resumed, full)
+        with open(results_path) as f:
+            self.assertEqual(sorted(json.loads(line)['index'] for line in f), [0, 1, 2, 3])
+        self.assertTrue(open_store(self.path).complete)
+
+if __name__ == '__main__':
+    unittest.main()
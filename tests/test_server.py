@@ -0,0 +1,61 @@
+import subprocess
+import threading
+import unittest
+import sys
+from os.path import dirname, abspath
+
+ROOT = dirname(dirname(abspath(__file__)))
+sys.path.append(ROOT)
+from src.client import SimulationClient
+
+class TestServer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        from src.server import SimulationServer
+        cls.server = SimulationServer(port=0)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        host, port = cls.server.server_address[:2]
+        cls.client = SimulationClient(f"http://{host}:{port}")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_client_import_is_lightweight(self):
+        """The client loads no qiskit, numpy or matplotlib."""
+        out = subprocess.run([sys.executable, '-c',
+                              "import sys, src.client; print(sorted(m for m in "
+                              "('qiskit', 'numpy', 'matplotlib') if m in sys.modules))"],
+                             cwd=ROOT, capture_output=True, text=True, check=True)
+        self.assertEqual(out.stdout.strip(), '[]')
+
+    def test_simulate(self):
+        """A simulate request returns a seeded sweep row."""
+        row = self.client.simulate(3, 'bit', '0', shots=1024, seed=2)
+        self.assertEqual(sum(row['counts'].values()), 1024)
+        self.assertEqual(row, self.client.simulate(3, 'bit', '0', shots=1024, seed=2))
+        self.assertGreater(row['success_rate'], 85)
+
+    def test_grid_and_sweep(self):
+        """Grid and sweep requests return the same data as the library calls."""
+        grid, error_types = self.client.grid()
+        self.assertEqual(error_types, ['bit', 'phase', 'both'])
+        self.assertEqual(len(grid), 9)
+        rows = self.client.sweep(qubits=[0, 4], error_types=['phase'], initial_states=['1'],
+                                 shots=512, seed=1)
+        self.assertEqual([(row['error_qubit'], row['initial_state']) for row in rows],
+                         [(0, '1'), (4, '1')])
+        self.assertGreaterEqual(self.client.health()['requests'], 2)
+
+    def test_errors(self):
+        """Unknown requests and bad parameters are reported as errors, not crashes."""
+        with self.assertRaisesRegex(RuntimeError, '404'):
+            self.client._request('nonsense', {})
+        with self.assertRaisesRegex(RuntimeError, '400'):
+            self.client.grid(engine='nonsense')
+        self.assertEqual(self.client.health()['status'], 'ok')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,8 @@
 import unittest
-from src.simulate import simulate_shors_code
+from src import result_cache
+from src.simulate import (simulate_shors_code, simulate_sweep, sweep_configs,
+                          create_noise_model, T1, T2, simulate_sharded, shard_sizes,
+                          merge_counts)
 
 class TestSimulateShorsCode(unittest.TestCase):
     def setUp(self):
@@ -29,5 +32,74 @@ class TestSimulateShorsCode(unittest.TestCase):
         _, counts = simulate_shors_code(error_qubit=3, error_type='both', initial_state='0')
         self.assertGreater(counts.get('0', 0), 6000, "Results should be logical |0> after correcting both errors.")
 
+    def test_sweep_matches_config_order(self):
+        """Test that a batched sweep returns one row per config, in order."""
+        configs = [
+            {'error_qubit': 3, 'error_type': 'bit', 'initial_state': '0'},
+            (5, 'phase', '1'),
+            {'error_type': 'none'},
+        ]
+        rows = simulate_sweep(configs, shots=2048, seed_simulator=11)
+        self.assertEqual(len(rows), 3)
+        self.assertEqual([r['error_type'] for r in rows], ['bit', 'phase', 'none'])
+        self.assertEqual(rows[1]['initial_state'], '1')
+        for row in rows:
+            self.assertEqual(sum(row['counts'].values()), 2048)
+            self.assertGreater(row['success_rate'], self.error_threshold * 100,
+                               f"Sweep row {row} fell below threshold")
+
+    def test_sweep_configs_grid(self):
+        """Test the default sweep grid covers 9 qubits x 4 error types x 2 states."""
+        configs = sweep_configs()
+        self.assertEqual(len(configs), 9 * 4 * 2)
+        self.assertEqual(len({tuple(c.values()) for c in configs}), 72)
+
+    def test_noise_model_memoized(self):
+        """Equal noise parameters return the same cached NoiseModel."""
+        self.assertIs(create_noise_model(), create_noise_model(p1=0.001, p2=0.01))
+        self.assertIsNot(create_noise_model(), create_noise_model(readout=0.02))
+        relaxing = create_noise_model(t1=T1, t2=T2)
+        self.assertIs(relaxing, create_noise_model(t1=T1, t2=T2, gate_time_1q=50))
+        self.assertNotEqual(relaxing.to_dict(), create_noise_model().to_dict())
+
+    def test_sweep_accepts_noise_parameters(self):
+        """Readout error lowers the success rate of a noiseless-gate sweep."""
+        configs = [(3, 'none', '0')]
+        clean = simulate_sweep(configs, shots=4096, seed_simulator=5,
+                               noise={'p1': 0, 'p2': 0})[0]
+        noisy = simulate_sweep(configs, shots=4096, seed_simulator=5,
+                               noise={'p1': 0, 'p2': 0, 'readout': 0.1})[0]
+        self.assertEqual(clean['success_rate'], 100.0)
+        self.assertAlmostEqual(noisy['success_rate'], 90.0, delta=2.0)
+
+    def test_shard_sizes(self):
+        """Shards cover the budget exactly and never exceed the shard size."""
+        self.assertEqual(shard_sizes(10, 4), [4, 3, 3])
+        self.assertEqual(shard_sizes(8192), [8192])
+        sizes = shard_sizes(10**7, 1 << 18)
+        self.assertEqual(sum(sizes), 10**7)
+        self.assertLessEqual(max(sizes), 1 << 18)
+        self.assertEqual(merge_counts([{'0': 3}, {'0': 1, '1': 2}, {}]), {'0': 4, '1': 2})
+
+    def test_sharded_matches_across_workers(self):
+        """Seeded sharded runs merge to the same counts and memory for any worker count."""
+        serial = simulate_sharded(3, 'bit', '0', shots=6000, seed_simulator=7, workers=1,
+                                  shard_shots=2000, memory=True)
+        parallel = simulate_sharded(3, 'bit', '0', shots=6000, seed_simulator=7, workers=3,
+                                    shard_shots=2000, memory=True)
+        self.assertEqual(serial[1], parallel[1])
+        self.assertEqual(serial[2], parallel[2])
+        self.assertEqual(sum(serial[1].values()), 6000)
+        self.assertEqual(len(serial[2]), 6000)
+        self.assertEqual(serial[1], {outcome: serial[2].count(outcome) for outcome in set(serial[2])})
+        self.assertGreater(serial[1].get('0', 0) / 6000, self.error_threshold)
+
+    def test_unseeded_sharded_not_cached(self):
+        """Unseeded shards are not written to the result cache."""
+        before = dict(result_cache._memory)
+        _, counts = simulate_sharded(3, 'bit', '0', shots=3000, workers=1, shard_shots=1000)
+        self.assertEqual(sum(counts.values()), 3000)
+        self.assertEqual(dict(result_cache._memory), before)
+
 if __name__ == "__main__":
     unittest.main()
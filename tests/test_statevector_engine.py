@@ -0,0 +1,58 @@
+import unittest
+import numpy as np
+from qiskit.quantum_info import Statevector, partial_trace
+import sys
+from os.path import dirname, abspath
+
+sys.path.append(dirname(dirname(abspath(__file__))))
+from src.statevector_engine import (block_unitary, apply_pauli_errors, decode_error_batch,
+                                    qubit0_reduced_states, recovery_fidelities, prepare_state)
+from src.visualize import _build_error_circuit, compute_per_qubit_error_grid
+
+class TestStatevectorEngine(unittest.TestCase):
+    def test_block_unitaries_cached_and_unitary(self):
+        """Block unitaries are built once and are 512x512 unitaries."""
+        encode = block_unitary('encode')
+        self.assertIs(block_unitary('encode'), encode)
+        self.assertEqual(encode.shape, (512, 512))
+        np.testing.assert_allclose(encode.conj().T @ encode, np.eye(512), atol=1e-12)
+
+    def test_unknown_initial_state_rejected(self):
+        """Labels other than '0', '1' and '+' raise instead of preparing |0>."""
+        self.assertEqual(prepare_state('1')[1], 1)
+        for label in ('-', 'one'):
+            with self.assertRaises(ValueError):
+                prepare_state(label)
+
+    def test_matches_circuit_statevectors(self):
+        """Batched decoding gives the same statevectors as simulating each circuit."""
+        cases = [(q, et) for q in (0, 4, 8) for et in ('none', 'bit', 'phase', 'both')]
+        for initial_state in ['0', '1']:
+            batch = decode_error_batch(cases, initial_state=initial_state)
+            for row, (qubit, error_type) in zip(batch, cases):
+                qc = _build_error_circuit(error_type, qubit, initial_state=initial_state)
+                expected = Statevector.from_instruction(qc).data
+                np.testing.assert_allclose(row, expected, atol=1e-12)
+
+    def test_reduced_state_matches_partial_trace(self):
+        """The reshaped-amplitude reduced state equals qiskit's partial_trace."""
+        state = apply_pauli_errors(block_unitary('encode')[:, 1], [[(2, 'both'), (5, 'phase')]])
+        reduced = qubit0_reduced_states(state)[0]
+        expected = partial_trace(Statevector(state[0]), list(range(1, 9))).data
+        np.testing.assert_allclose(reduced, expected, atol=1e-12)
+
+    def test_grid_engines_agree(self):
+        """The unitary and circuit engines produce the same fidelity grid."""
+        for initial_state in ['0', '1']:
+            fast, _ = compute_per_qubit_error_grid(initial_state=initial_state)
+            slow, _ = compute_per_qubit_error_grid(initial_state=initial_state, engine='circuit')
+            np.testing.assert_allclose(fast, slow, atol=1e-12)
+        np.testing.assert_allclose(fast, np.ones((9, 3)), atol=1e-12)
+
+    def test_two_block_phase_flips_fail(self):
+        """Phase flips in two different blocks are not recoverable."""
+        fidelities = recovery_fidelities([[(0, 'phase'), (3, 'phase')]], initial_state='0')
+        self.assertAlmostEqual(fidelities[0], 0.0)
+
+if __name__ == '__main__':
+    unittest.main()
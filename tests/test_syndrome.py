@@ -0,0 +1,49 @@
+import unittest
+import sys
+from os.path import dirname, abspath
+
+sys.path.append(dirname(dirname(abspath(__file__))))
+from src.syndrome import (build_syndrome_circuit, simulate_syndrome_code, split_outcome,
+                          decode_outcome)
+
+NOISELESS = {'p1': 0, 'p2': 0}
+
+class TestSyndrome(unittest.TestCase):
+    def test_circuit_is_clifford(self):
+        """The measurement-based circuit has no Toffolis."""
+        ops = build_syndrome_circuit().count_ops()
+        self.assertNotIn('ccx', ops)
+        self.assertEqual(build_syndrome_circuit().num_qubits, 17)
+
+    def test_noiseless_single_errors_corrected(self):
+        """Every single-qubit error is corrected on the stabilizer method."""
+        for error_type in ['none', 'bit', 'phase', 'both']:
+            for error_qubit in range(9):
+                for initial_state in ['0', '1']:
+                    with self.subTest(error_type=error_type, error_qubit=error_qubit,
+                                      initial_state=initial_state):
+                        counts = simulate_syndrome_code(error_qubit, error_type, initial_state,
+                                                        shots=64, noise=NOISELESS,
+                                                        seed_simulator=1)
+                        self.assertEqual(counts, {initial_state: 64})
+
+    def test_syndrome_locates_error(self):
+        """A bit flip on qubit 4 triggers exactly the two Z-type checks around it."""
+        counts = simulate_syndrome_code(4, 'bit', shots=32, noise=NOISELESS, raw=True)
+        syndromes = {tuple(split_outcome(key)[1]) for key in counts}
+        self.assertEqual(syndromes, {(0, 0, 1, 1, 0, 0, 0, 0)})
+
+    def test_two_block_phase_flips_fail(self):
+        """Phase flips in two blocks are mis-corrected, as with the coherent decoder."""
+        readout = [0] * 9
+        readout[0] = 1
+        readout[3] = 1
+        self.assertEqual(decode_outcome(readout, [0] * 6 + [0, 1]), '1')
+
+    def test_noisy_run(self):
+        """With the default noise model the code still preserves the logical state."""
+        counts = simulate_syndrome_code(3, 'phase', shots=8192, seed_simulator=3)
+        self.assertGreater(counts.get('0', 0) / 8192, 0.85)
+
+if __name__ == '__main__':
+    unittest.main()
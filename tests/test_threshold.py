@@ -0,0 +1,54 @@
+import unittest
+import sys
+from os.path import dirname, abspath
+
+sys.path.append(dirname(dirname(abspath(__file__))))
+from src.threshold import (clopper_pearson, estimate_logical_error_rate, threshold_sweep,
+                           pseudo_threshold)
+
+class TestThreshold(unittest.TestCase):
+    def test_clopper_pearson_bounds(self):
+        """The interval contains the estimate and handles 0 and all failures."""
+        low, high = clopper_pearson(10, 1000)
+        self.assertLess(low, 0.01)
+        self.assertGreater(high, 0.01)
+        self.assertEqual(clopper_pearson(0, 1000)[0], 0.0)
+        self.assertEqual(clopper_pearson(1000, 1000)[1], 1.0)
+
+    def test_stops_at_target_width(self):
+        """Shots are doubled until the interval is narrow enough."""
+        row = estimate_logical_error_rate(0.01, 0.1, relative_width=0.2, initial_shots=1000,
+                                          seed=3, engine='pauli_frame')
+        self.assertEqual(row['stop_reason'], 'width')
+        self.assertLessEqual(row['ci_high'] - row['ci_low'], 0.2 * row['logical_error_rate'])
+        self.assertEqual(row['shots'], 1000 * 2 ** (row['rounds'] - 1))
+
+    def test_resolved_point_stops_early(self):
+        """A point far below the physical rate stops in the first round."""
+        row = estimate_logical_error_rate(0.001, 0.01, physical_rate=0.2, initial_shots=4096,
+                                          seed=1, engine='pauli_frame')
+        self.assertEqual(row['stop_reason'], 'resolved')
+        self.assertEqual(row['rounds'], 1)
+
+    def test_sweep_reproducible_and_ordered(self):
+        """Seeded sweeps are reproducible and keep the input order."""
+        rates = [0.05, 0.001]
+        kwargs = dict(seed=4, engine='pauli_frame', initial_shots=2048, max_shots=8192)
+        first = threshold_sweep(rates, **kwargs)
+        self.assertEqual([row['physical_rate'] for row in first], rates)
+        self.assertEqual(first, threshold_sweep(rates, workers=2, **kwargs))
+
+    def test_pseudo_threshold_interpolation(self):
+        """The crossing is found between the points where logical overtakes physical."""
+        rows = [
+            {'physical_rate': 0.1, 'logical_error_rate': 0.4},
+            {'physical_rate': 0.001, 'logical_error_rate': 0.0001},
+            {'physical_rate': 0.01, 'logical_error_rate': 0.001},
+        ]
+        crossing = pseudo_threshold(rows)
+        self.assertGreater(crossing, 0.01)
+        self.assertLess(crossing, 0.1)
+        self.assertIsNone(pseudo_threshold(rows[1:]))
+
+if __name__ == '__main__':
+    unittest.main()